@@ -0,0 +1,60 @@
+"""音量計算のマイクロベンチマーク（struct版 vs NumPy版）.
+
+使い方:
+    uv run python benchmarks/bench_meter.py
+"""
+
+from __future__ import annotations
+
+import struct
+import timeit
+from collections.abc import Callable
+
+import numpy as np
+
+from voivoi.chat.audio.meter import measure_batch, rms_level
+
+CHUNK_SIZE = 1024  # 1チャンクあたりのフレーム数（64ミリ秒）
+BATCH_SIZE = 16  # 約1秒分のチャンク
+REPEAT = 5
+NUMBER = 2000
+
+
+def legacy_level(data: bytes) -> float:
+    """旧PyAudioAdapter._calculate_levelの実装."""
+    samples = struct.unpack(f"<{len(data) // 2}h", data)
+    if not samples:
+        return 0.0
+    rms = (sum(s * s for s in samples) / len(samples)) ** 0.5
+    return min(1.0, rms / 32767.0)
+
+
+def _best_us(stmt: Callable[[], object]) -> float:
+    """1回あたりの最速実行時間（マイクロ秒）を返す."""
+    times = timeit.repeat(stmt, repeat=REPEAT, number=NUMBER)
+    return min(times) / NUMBER * 1e6
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    chunks = [
+        rng.integers(-8000, 8000, CHUNK_SIZE, dtype=np.int16).tobytes()
+        for _ in range(BATCH_SIZE)
+    ]
+    chunk = chunks[0]
+    assert abs(legacy_level(chunk) - rms_level(chunk)) < 1e-9
+
+    legacy = _best_us(lambda: legacy_level(chunk))
+    vectorized = _best_us(lambda: rms_level(chunk))
+    batch = _best_us(lambda: measure_batch(chunks)) / BATCH_SIZE
+
+    print(f"chunk size: {CHUNK_SIZE} frames")
+    print(f"struct + sum     : {legacy:8.2f} us/chunk")
+    print(f"numpy rms_level  : {vectorized:8.2f} us/chunk ({legacy / vectorized:.1f}x)")
+    print(
+        f"numpy batch({BATCH_SIZE:2d}) : {batch:8.2f} us/chunk ({legacy / batch:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Whisperのint8動的量子化のベンチマーク（fp32 vs int8）.
+
+WAVコーパス（16kHz・モノラル・16-bit）をfp32とint8量子化の各モデルで文字起こしし、
+1発話あたりのレイテンシ、プロセスの最大RSS、fp32の結果を基準にした誤り率を比較する。
+メモリを正しく測るため、各モデルは別プロセスで読み込む。
+
+日本語は単語に区切られないため、--unit charで文字単位の誤り率（CER）を使う。
+
+使い方:
+    uv run python benchmarks/bench_quantize.py CORPUS_DIR [--model small]
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from voivoi.chat.audio.pcm import duration_ms
+from voivoi.chat.audio.wav import load_wav
+
+
+def _run(
+    model_name: str, quantize: bool, files: list[Path], language: str
+) -> tuple[list[float], list[str], float]:
+    """別プロセスでモデルを読み込み、レイテンシ・文字起こし結果・最大RSS（MB）を返す."""
+    from voivoi.chat.stt.adapter import WhisperAdapter
+    from voivoi.chat.stt.port import SilentAudioError
+
+    stt = WhisperAdapter(model_name=model_name, language=language, quantize=quantize)
+    corpus = [load_wav(path) for path in files]
+    try:
+        stt.transcribe(corpus[0])  # ウォームアップ
+    except SilentAudioError:
+        pass
+
+    latencies: list[float] = []
+    texts: list[str] = []
+    for pcm in corpus:
+        start = time.perf_counter()
+        try:
+            texts.append(stt.transcribe(pcm).text)
+        except SilentAudioError:
+            texts.append("")
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    # ru_maxrssはLinuxではKB、macOSではバイト単位
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return latencies, texts, max_rss / scale
+
+
+def _tokens(text: str, unit: str) -> list[str]:
+    """誤り率の計算単位に分割する."""
+    return list(text.replace(" ", "")) if unit == "char" else text.split()
+
+
+def _error_rate(reference: str, hypothesis: str, unit: str) -> float:
+    """編集距離による誤り率（WERまたはCER）を返す."""
+    ref, hyp = _tokens(reference, unit), _tokens(hypothesis, unit)
+    if not ref:
+        return float(bool(hyp))
+    previous = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, start=1):
+        current = [i]
+        for j, h in enumerate(hyp, start=1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (r != h))
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", type=Path, help="WAVファイルを置いたディレクトリ")
+    parser.add_argument("--model", default="small", help="Whisperモデル名")
+    parser.add_argument("--language", default="ja", help="文字起こしの言語")
+    parser.add_argument("--unit", choices=["char", "word"], default="char")
+    args = parser.parse_args()
+
+    files = sorted(args.corpus.glob("*.wav"))
+    if not files:
+        parser.error(f"no WAV files in {args.corpus}")
+    audio_ms = sum(duration_ms(load_wav(path)) for path in files)
+
+    results = {}
+    for label, quantize in [("fp32", False), ("int8", True)]:
+        # 量子化済みキャッシュの作成も含めないよう、int8は2回目の起動を計測する
+        runs = 2 if quantize else 1
+        for _ in range(runs):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                results[label] = pool.submit(
+                    _run, args.model, quantize, files, args.language
+                ).result()
+
+    reference = results["fp32"][1]
+    print(f"model: {args.model}, corpus: {len(files)} files, {audio_ms / 1000:.1f} s")
+    print(f"{'variant':<8} {'median ms':>10} {'RTF':>7} {'max RSS MB':>11} {'ER':>7}")
+    for label, (latencies, texts, rss_mb) in results.items():
+        error = statistics.mean(
+            _error_rate(ref, hyp, args.unit)
+            for ref, hyp in zip(reference, texts, strict=True)
+        )
+        print(
+            f"{label:<8} {statistics.median(latencies):>10.1f}"
+            f" {sum(latencies) / audio_ms:>7.3f} {rss_mb:>11.0f} {error:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""STTバックエンドの比較ベンチマーク（PyTorch Whisper vs faster-whisper int8）.
+
+WAVコーパス（16kHz・モノラル・16-bit）の各ファイルを両方のバックエンドで文字起こしし、
+1発話あたりのレイテンシとリアルタイム係数（RTF = 処理時間 / 音声の長さ）を比較する。
+各バックエンドとも最初の1ファイルで一度ウォームアップしてから計測する。
+
+使い方:
+    uv sync --extra faster-whisper
+    uv run python benchmarks/bench_stt_backends.py CORPUS_DIR [--model base]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from voivoi.chat.audio.pcm import duration_ms
+from voivoi.chat.audio.wav import load_wav
+from voivoi.chat.stt.adapter import WhisperAdapter
+from voivoi.chat.stt.faster_adapter import FasterWhisperAdapter
+from voivoi.chat.stt.port import SilentAudioError, STTPort
+
+
+def _transcribe_ms(stt: STTPort, pcm: bytes) -> tuple[float, str]:
+    """文字起こしにかかった時間（ミリ秒）と結果のテキストを返す."""
+    start = time.perf_counter()
+    try:
+        text = stt.transcribe(pcm).text
+    except SilentAudioError:
+        text = ""
+    return (time.perf_counter() - start) * 1000, text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("corpus", type=Path, help="WAVファイルを置いたディレクトリ")
+    parser.add_argument("--model", default="base", help="Whisperモデル名")
+    parser.add_argument("--language", default="ja", help="文字起こしの言語")
+    args = parser.parse_args()
+
+    corpus = {path.name: load_wav(path) for path in sorted(args.corpus.glob("*.wav"))}
+    if not corpus:
+        parser.error(f"no WAV files in {args.corpus}")
+    audio_ms = {name: duration_ms(pcm) for name, pcm in corpus.items()}
+
+    backends: dict[str, STTPort] = {
+        "whisper": WhisperAdapter(model_name=args.model, language=args.language),
+        "faster-whisper int8": FasterWhisperAdapter(
+            model_name=args.model, language=args.language
+        ),
+    }
+
+    print(f"corpus: {len(corpus)} files, {sum(audio_ms.values()) / 1000:.1f} s")
+    print(f"{'backend':<20} {'median ms':>10} {'max ms':>10} {'RTF':>7}")
+    for label, stt in backends.items():
+        _transcribe_ms(stt, next(iter(corpus.values())))  # ウォームアップ
+        latencies = {name: _transcribe_ms(stt, pcm)[0] for name, pcm in corpus.items()}
+        rtf = sum(latencies.values()) / sum(audio_ms.values())
+        print(
+            f"{label:<20} {statistics.median(latencies.values()):>10.1f}"
+            f" {max(latencies.values()):>10.1f} {rtf:>7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""STTへの音声受け渡し方法のベンチマーク（WAVファイル経由 vs メモリ上のPCM）.
+
+WAVファイル経由ではディスク書き込み・ffmpegの起動・デコードが毎ターン発生する。
+--modelを指定するとWhisperでの文字起こしを含むターン全体の時間も計測する。
+
+使い方:
+    uv run python benchmarks/bench_stt_input.py [--seconds 5] [--model base]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import whisper
+
+from voivoi.chat.audio.pcm import to_float32
+from voivoi.chat.audio.wav import save_wav
+
+REPEAT = 10
+
+
+def _median_ms(func: Callable[[], object]) -> float:
+    """関数の実行時間の中央値（ミリ秒）を返す."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0, help="発話の長さ")
+    parser.add_argument("--model", help="文字起こしも計測するWhisperモデル名")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n_samples = int(args.seconds * 16000)
+    pcm = rng.integers(-3000, 3000, n_samples, dtype=np.int16).tobytes()
+    wav_path = Path(tempfile.gettempdir()) / "voivoi_bench.wav"
+
+    def via_file() -> object:
+        save_wav(pcm, wav_path)
+        return whisper.load_audio(str(wav_path))
+
+    file_ms = _median_ms(via_file)
+    memory_ms = _median_ms(lambda: to_float32(pcm))
+    print(f"utterance: {args.seconds:.1f} s")
+    print(f"wav + ffmpeg decode : {file_ms:8.2f} ms/turn")
+    print(f"in-memory float32   : {memory_ms:8.2f} ms/turn")
+    print(f"saved per turn      : {file_ms - memory_ms:8.2f} ms")
+
+    if args.model:
+        model = whisper.load_model(args.model)
+        file_total = _median_ms(
+            lambda: model.transcribe(str(wav_path), language="ja", fp16=False)
+        )
+        memory_total = _median_ms(
+            lambda: model.transcribe(to_float32(pcm), language="ja", fp16=False)
+        )
+        print(f"transcribe via wav  : {file_total:8.2f} ms/turn")
+        print(f"transcribe in-memory: {memory_total:8.2f} ms/turn")
+
+    wav_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,26 +9,23 @@ class TestPyAudioAdapter:
     """PyAudioAdapterのテスト."""
 
     @patch("voivoi.chat.audio.adapter.pyaudio")
-    def test_read_chunk_returns_audio_data_and_level(
-        self, mock_pyaudio: MagicMock
-    ) -> None:
-        """チャンクを読み取り、音声データと音量レベルを返す."""
+    def test_read_chunk_returns_audio_data(self, mock_pyaudio: MagicMock) -> None:
+        """チャンクを読み取り、音声データを返す."""
         # Arrange
         mock_pa = MagicMock()
         mock_pyaudio.PyAudio.return_value = mock_pa
         mock_stream = MagicMock()
         mock_pa.open.return_value = mock_stream
         # 16-bit signed integerの音声データ（最大値32767の半分程度）
-        mock_stream.read.return_value = b"\x00\x40" * 1024  # 約0.5の音量レベル
+        mock_stream.read.return_value = b"\x00\x40" * 1024
 
         recorder = PyAudioAdapter()
 
         # Act
-        data, level = recorder.read_chunk()
+        data = recorder.read_chunk()
 
         # Assert
         assert data == b"\x00\x40" * 1024
-        assert 0.0 <= level <= 1.0
 
     @patch("voivoi.chat.audio.adapter.pyaudio")
     def test_close_releases_resources(self, mock_pyaudio: MagicMock) -> None:
@@ -66,3 +63,70 @@ class TestPyAudioAdapter:
         mock_stream.stop_stream.assert_called_once()
         mock_stream.close.assert_called_once()
         mock_pa.terminate.assert_called_once()
+
+
+class TestPyAudioAdapterBuffered:
+    """PyAudioAdapter（コールバックによるバックグラウンド録音）のテスト."""
+
+    @patch("voivoi.chat.audio.adapter.pyaudio")
+    def test_opens_stream_with_callback(self, mock_pyaudio: MagicMock) -> None:
+        """buffer_secondsを指定するとコールバックAPIでストリームを開く."""
+        # Arrange
+        mock_pa = MagicMock()
+        mock_pyaudio.PyAudio.return_value = mock_pa
+
+        # Act
+        PyAudioAdapter(chunk_size=4, buffer_seconds=1.0)
+
+        # Assert
+        assert mock_pa.open.call_args.kwargs["stream_callback"] is not None
+
+    @patch("voivoi.chat.audio.adapter.pyaudio")
+    def test_read_chunk_returns_audio_captured_by_callback(
+        self, mock_pyaudio: MagicMock
+    ) -> None:
+        """コールバックで蓄積した音声を順に読み出す."""
+        # Arrange
+        mock_pyaudio.paInputOverflow = 2
+        mock_pyaudio.paContinue = 0
+        mock_pa = MagicMock()
+        mock_pyaudio.PyAudio.return_value = mock_pa
+        recorder = PyAudioAdapter(chunk_size=4, buffer_seconds=1.0)
+        callback = mock_pa.open.call_args.kwargs["stream_callback"]
+
+        # Act
+        callback(b"\x00\x40" * 4, 4, {}, 0)
+        callback(b"\x00\x00" * 4, 4, {}, 0)
+        first = recorder.read_chunk()
+        second = recorder.read_chunk()
+
+        # Assert
+        assert first == b"\x00\x40" * 4
+        assert second == b"\x00\x00" * 4
+
+    @patch("voivoi.chat.audio.adapter.pyaudio")
+    def test_stats_counts_dropped_chunks_and_overflows(
+        self, mock_pyaudio: MagicMock
+    ) -> None:
+        """バッファ満杯による破棄と入力オーバーフローを記録する."""
+        # Arrange
+        mock_pyaudio.paInputOverflow = 2
+        mock_pyaudio.paContinue = 0
+        mock_pa = MagicMock()
+        mock_pyaudio.PyAudio.return_value = mock_pa
+        # 16000Hz / 8000フレーム × 1秒 = 2チャンク分の容量
+        recorder = PyAudioAdapter(chunk_size=8000, buffer_seconds=1.0)
+        callback = mock_pa.open.call_args.kwargs["stream_callback"]
+        chunk = b"\x00\x00" * 8000
+
+        # Act
+        callback(chunk, 8000, {}, 0)
+        callback(chunk, 8000, {}, 2)
+        callback(chunk, 8000, {}, 0)
+        stats = recorder.stats
+
+        # Assert
+        assert stats.captured_chunks == 3
+        assert stats.dropped_chunks == 1
+        assert stats.input_overflows == 1
+        assert stats.buffered_chunks == 2
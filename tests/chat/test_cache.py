@@ -0,0 +1,213 @@
+"""CachedLLM（LLMの応答キャッシュ）モジュールのテスト."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from voivoi.chat.llm.cache import CachedLLM, CacheStats, normalize_prompt
+from voivoi.chat.llm.port import LLMMessage, LLMStream
+from voivoi.chat.llm.router import RoutingLLM
+
+
+def _user(text: str) -> list[LLMMessage]:
+    """ユーザーの発話1件のメッセージリストを作る."""
+    return [LLMMessage(role="user", content=text)]
+
+
+class TestNormalizePrompt:
+    """normalize_promptのテスト."""
+
+    def test_ignores_width_case_spaces_and_punctuation(self) -> None:
+        """全角・半角、大文字・小文字、空白と句読点の違いを無視する."""
+        # Act & Assert
+        assert normalize_prompt("今日の予定は？") == normalize_prompt("今日の予定は")
+        assert normalize_prompt("What time is it?") == normalize_prompt(
+            "ｗｈａｔ  time is it"
+        )
+
+
+class TestCachedLLM:
+    """CachedLLMのテスト."""
+
+    def test_generate_returns_cached_response_for_same_question(self) -> None:
+        """表記の揺れを除いて同じ質問には、LLMを呼ばずに保存済みの応答を返す."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "10時から会議があります"
+        cached = CachedLLM(mock_llm, model="llama3.1")
+
+        # Act
+        first = cached.generate(_user("今日の予定は？"))
+        second = cached.generate(_user("今日の予定は"))
+
+        # Assert
+        assert first == second == "10時から会議があります"
+        mock_llm.generate.assert_called_once()
+        assert cached.stats == CacheStats(hits=1, misses=1)
+
+    def test_stream_caches_only_completed_response(self) -> None:
+        """最後まで受信した応答を保存し、次は1つの断片として返す."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.stream.side_effect = lambda messages: LLMStream(
+            iter(["こんにちは", "！"])
+        )
+        cached = CachedLLM(mock_llm, model="llama3.1")
+
+        # Act
+        interrupted = cached.stream(_user("こんにちは"))
+        next(interrupted)
+        interrupted.cancel()
+        list(interrupted)
+        first = list(cached.stream(_user("こんにちは")))
+        second = list(cached.stream(_user("こんにちは")))
+
+        # Assert
+        assert first == ["こんにちは", "！"]
+        assert second == ["こんにちは！"]
+        assert mock_llm.stream.call_count == 2  # 中断した応答は保存しない
+
+    def test_cancel_is_forwarded_to_wrapped_stream(self) -> None:
+        """取り消すと、包んでいるLLMのストリームも取り消す."""
+        # Arrange
+        mock_llm = MagicMock()
+        inner = LLMStream(iter(["こんにちは"]))
+        mock_llm.stream.return_value = inner
+        cached = CachedLLM(mock_llm, model="llama3.1")
+
+        # Act
+        cached.stream(_user("こんにちは")).cancel()
+
+        # Assert
+        assert inner.cancelled is True
+
+    def test_does_not_cache_deeper_conversation_or_summary(self) -> None:
+        """max_depthより深い会話と、要約（system）を含むリクエストはキャッシュしない."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "はい"
+        cached = CachedLLM(mock_llm, model="llama3.1", max_depth=1)
+        deep = [
+            LLMMessage(role="user", content="旅行に行きたい"),
+            LLMMessage(role="assistant", content="どこへ？"),
+            LLMMessage(role="user", content="おすすめは？"),
+        ]
+        summarized = [
+            LLMMessage(role="system", content="これまでの会話の要約"),
+            LLMMessage(role="user", content="おすすめは？"),
+        ]
+
+        # Act
+        for messages in (deep, deep, summarized, summarized):
+            cached.generate(messages)
+
+        # Assert
+        assert mock_llm.generate.call_count == 4
+        assert cached.stats == CacheStats(hits=0, misses=0)
+
+    def test_expired_entry_is_not_used(self) -> None:
+        """ttl_secondsを過ぎた応答は使わずにLLMに問い合わせる."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.generate.side_effect = ["9時です", "10時です"]
+        cached = CachedLLM(mock_llm, model="llama3.1", ttl_seconds=60)
+
+        # Act
+        with patch("voivoi.chat.llm.cache.time.time", return_value=1000.0):
+            cached.generate(_user("今何時？"))
+        with patch("voivoi.chat.llm.cache.time.time", return_value=1061.0):
+            response = cached.generate(_user("今何時？"))
+
+        # Assert
+        assert response == "10時です"
+        assert cached.stats == CacheStats(hits=0, misses=2)
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        """max_entriesを超えたら、最も使われていない応答から削除する."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.generate.side_effect = lambda messages: messages[-1].content + "!"
+        cached = CachedLLM(mock_llm, model="llama3.1", max_entries=2)
+
+        # Act
+        cached.generate(_user("a"))
+        cached.generate(_user("b"))
+        cached.generate(_user("a"))  # aを最近使ったものにする
+        cached.generate(_user("c"))  # bを削除する
+        cached.generate(_user("a"))
+        cached.generate(_user("b"))
+
+        # Assert
+        assert cached.stats == CacheStats(hits=2, misses=4)
+
+    def test_persists_entries_to_disk(self, tmp_path: Path) -> None:
+        """保存した応答はファイルに書き出し、次の起動で使い回す."""
+        # Arrange
+        path = tmp_path / "cache" / "llm.json"
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "晴れです"
+        CachedLLM(mock_llm, model="llama3.1", path=path).generate(_user("天気は？"))
+
+        # Act
+        restored = CachedLLM(MagicMock(), model="llama3.1", path=path)
+        response = restored.generate(_user("天気は？"))
+
+        # Assert
+        assert response == "晴れです"
+        assert restored.stats == CacheStats(hits=1, misses=0)
+
+    def test_key_includes_model(self, tmp_path: Path) -> None:
+        """モデルが異なる場合は保存済みの応答を使わない."""
+        # Arrange
+        path = tmp_path / "llm.json"
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "晴れです"
+        CachedLLM(mock_llm, model="llama3.1", path=path).generate(_user("天気は？"))
+
+        # Act
+        other = CachedLLM(mock_llm, model="gemma2", path=path)
+        other.generate(_user("天気は？"))
+
+        # Assert
+        assert other.stats == CacheStats(hits=0, misses=1)
+
+    def test_keys_fast_route_answer_on_fast_model(self, tmp_path: Path) -> None:
+        """小さいモデルに振り分けた応答は、小さいモデルの応答として保存する."""
+        # Arrange
+        path = tmp_path / "llm.json"
+        mock_router = MagicMock(spec=RoutingLLM)
+        mock_router.route.return_value = "fast"
+        mock_router.last_route = "fast"
+        mock_router.generate.return_value = "晴れです"
+        CachedLLM(
+            mock_router, model="llama3.1", path=path, fast_model="llama3.2"
+        ).generate(_user("天気は？"))
+
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "曇りです"
+
+        # Act
+        fast = CachedLLM(mock_llm, model="llama3.2", path=path)
+        fast.generate(_user("天気は？"))
+        primary = CachedLLM(mock_llm, model="llama3.1", path=path)
+        primary.generate(_user("天気は？"))
+
+        # Assert
+        assert primary.stats == CacheStats(hits=0, misses=1)
+        assert fast.stats == CacheStats(hits=1, misses=0)
+
+    def test_does_not_store_hedged_answer(self) -> None:
+        """大きいモデルの遅れを小さいモデルが補った応答は保存しない."""
+        # Arrange
+        mock_router = MagicMock(spec=RoutingLLM)
+        mock_router.route.return_value = "primary"
+        mock_router.last_route = "hedge"
+        mock_router.stream.side_effect = lambda messages: LLMStream(iter(["晴れ"]))
+        cached = CachedLLM(mock_router, model="llama3.1", fast_model="llama3.2")
+
+        # Act
+        list(cached.stream(_user("明日の天気を教えてください")))
+        list(cached.stream(_user("明日の天気を教えてください")))
+
+        # Assert
+        assert mock_router.stream.call_count == 2
+        assert cached.stats == CacheStats(hits=0, misses=2)
@@ -1,14 +1,30 @@
 """Chat CLI のテスト."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
-from voivoi.chat.cli import save_session
+from voivoi.chat.audio.vad import AdaptiveVAD, SpectralVAD, ThresholdVAD
+from voivoi.chat.cli import (
+    _load_llm,
+    _load_stt,
+    _respond,
+    _run_turns,
+    _summary_llm,
+    _unload_llm,
+    create_decoding_options,
+    create_vad,
+    save_session,
+)
 from voivoi.chat.domain.models import Chat
 from voivoi.chat.domain.repository import load_chat
 from voivoi.cli import app
+from voivoi.config.schema import STTBackend, VADType
 
 runner = CliRunner()
 
@@ -38,6 +54,22 @@ class TestSaveSession:
         assert saved_chat.messages[1].role == "assistant"
         assert saved_chat.messages[1].content == "はい、こんにちは！"
 
+    def test_save_session_saves_summary_next_to_chat(self, tmp_path: Path) -> None:
+        """要約がある場合はチャットと並べて保存する."""
+        # Arrange
+        from voivoi.chat.domain.models import ChatSummary
+
+        chat = Chat.create()
+        chat.add_message("user", "こんにちは")
+        summary = ChatSummary(text="- 挨拶をした", covered=1)
+
+        # Act
+        save_session(chat, tmp_path, summary)
+
+        # Assert
+        assert (tmp_path / f"{chat.id}.summary.json").exists()
+        assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
     def test_save_session_does_nothing_when_no_messages(self, tmp_path: Path) -> None:
         """会話がない場合はファイルを作成しない."""
         # Arrange
@@ -55,13 +87,13 @@ class TestChatStart:
     """voivoi chat コマンド（音声チャット開始）のテスト."""
 
     @patch("voivoi.chat.cli.load_config")
-    @patch("voivoi.chat.cli.PyAudioAdapter")
-    @patch("voivoi.chat.cli.ThresholdVAD")
-    @patch("voivoi.chat.cli.ContinuousListener")
-    @patch("voivoi.chat.cli.WhisperAdapter")
-    @patch("voivoi.chat.cli.OllamaAdapter")
-    @patch("voivoi.chat.cli.Pyttsx3Adapter")
-    @patch("voivoi.chat.cli.ChatOrchestrator")
+    @patch("voivoi.chat.audio.adapter.PyAudioAdapter")
+    @patch("voivoi.chat.audio.vad.AdaptiveVAD")
+    @patch("voivoi.chat.audio.listener.ContinuousListener")
+    @patch("voivoi.chat.stt.adapter.WhisperAdapter")
+    @patch("voivoi.chat.llm.adapter.OllamaAdapter")
+    @patch("voivoi.chat.tts.adapter.Pyttsx3Adapter")
+    @patch("voivoi.chat.orchestrator.ChatOrchestrator")
     def test_chat_start_initializes_and_runs_voice_chat(
         self,
         mock_voice_chat_class: MagicMock,
@@ -91,6 +123,7 @@ class TestChatStart:
         mock_listener.listen.return_value = iter([])
 
         mock_voice_chat = MagicMock()
+        mock_voice_chat.get_chat.return_value = Chat.create()
         mock_voice_chat_class.return_value = mock_voice_chat
 
         # Act
@@ -106,6 +139,287 @@ class TestChatStart:
         mock_tts_class.assert_called_once()
         mock_voice_chat_class.assert_called_once()
 
+    @patch("voivoi.chat.cli.save_session")
+    @patch("voivoi.chat.cli.load_config")
+    @patch("voivoi.chat.audio.adapter.PyAudioAdapter")
+    @patch("voivoi.chat.audio.listener.ContinuousListener")
+    @patch("voivoi.chat.stt.adapter.WhisperAdapter")
+    @patch("voivoi.chat.llm.adapter.OllamaAdapter")
+    @patch("voivoi.chat.tts.adapter.Pyttsx3Adapter")
+    @patch("voivoi.chat.orchestrator.ChatOrchestrator")
+    def test_chat_start_saves_session_when_ending_with_error(
+        self,
+        mock_voice_chat_class: MagicMock,
+        mock_tts_class: MagicMock,
+        mock_llm_class: MagicMock,
+        mock_stt_class: MagicMock,
+        mock_listener_class: MagicMock,
+        mock_recorder_class: MagicMock,
+        mock_load_config: MagicMock,
+        mock_save_session: MagicMock,
+    ) -> None:
+        """Ctrl+C以外で終了した場合も会話と要約を保存する."""
+        # Arrange
+        from voivoi.config.schema import Config
+
+        mock_load_config.return_value = Config()
+        mock_recorder_class.return_value.__enter__ = MagicMock(return_value=MagicMock())
+        mock_recorder_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_listener_class.return_value.listen.side_effect = OSError("device lost")
+        chat = Chat.create()
+        mock_voice_chat_class.return_value.get_chat.return_value = chat
+
+        # Act
+        result = runner.invoke(app, ["chat"])
+
+        # Assert
+        assert isinstance(result.exception, OSError)
+        mock_save_session.assert_called_once()
+        assert mock_save_session.call_args.args[0] is chat
+
+
+class TestRunTurns:
+    """ターン処理ループのテスト."""
+
+    def test_ctrl_c_cancels_response_and_keeps_listening(self) -> None:
+        """応答中のCtrl+Cはターンだけを取り消し、聞き取りを続ける."""
+        # Arrange
+        mock_listener = MagicMock()
+        mock_listener.listen.side_effect = [KeyboardInterrupt, iter([])]
+        mock_voice_chat = MagicMock()
+        mock_voice_chat.interrupt.return_value = True
+
+        # Act
+        _run_turns(mock_listener, mock_voice_chat, MagicMock())
+
+        # Assert
+        mock_voice_chat.interrupt.assert_called_once()
+        assert mock_listener.listen.call_count == 2
+
+    def test_ignored_utterance_is_not_submitted_as_turn(self) -> None:
+        """オーケストレーターが捨てた発話（応答中の録音）はターンにしない."""
+        # Arrange
+        mock_listener = MagicMock()
+        mock_listener.listen.return_value = iter([b"echo", b"question"])
+        mock_voice_chat = MagicMock()
+        type(mock_voice_chat).last_utterance_ignored = PropertyMock(
+            side_effect=[True, False]
+        )
+        mock_turns = MagicMock()
+
+        # Act
+        _run_turns(mock_listener, mock_voice_chat, mock_turns)
+
+        # Assert
+        mock_turns.submit.assert_called_once_with(
+            _respond, mock_voice_chat, b"question"
+        )
+
+    def test_ctrl_c_while_idle_exits(self) -> None:
+        """応答中でなければCtrl+Cで終了する."""
+        # Arrange
+        mock_listener = MagicMock()
+        mock_listener.listen.side_effect = KeyboardInterrupt
+        mock_voice_chat = MagicMock()
+        mock_voice_chat.interrupt.return_value = False
+
+        # Act & Assert
+        with pytest.raises(KeyboardInterrupt):
+            _run_turns(mock_listener, mock_voice_chat, MagicMock())
+
+
+class TestCreateVAD:
+    """VAD作成のテスト."""
+
+    def test_create_vad_returns_vad_for_configured_type(self) -> None:
+        """設定されたVADの種類に応じた実装を返す."""
+        # Act & Assert
+        assert isinstance(create_vad(VADType.THRESHOLD), ThresholdVAD)
+        assert isinstance(create_vad(VADType.SPECTRAL), SpectralVAD)
+        assert isinstance(create_vad(VADType.ADAPTIVE), AdaptiveVAD)
+
+
+class TestLoadSTT:
+    """STT読み込みのテスト."""
+
+    @patch("voivoi.chat.stt.faster_adapter.FasterWhisperAdapter")
+    def test_load_stt_uses_configured_backend(self, mock_adapter: MagicMock) -> None:
+        """設定されたバックエンドと計算精度でSTTを読み込む."""
+        # Arrange
+        from voivoi.config.schema import Config, STTConfig
+
+        config = Config(
+            stt=STTConfig(backend=STTBackend.FASTER_WHISPER, silence_precheck=False)
+        )
+
+        # Act
+        stt = _load_stt(config)
+
+        # Assert
+        assert stt is mock_adapter.return_value
+        mock_adapter.assert_called_once_with(
+            model_name="base",
+            language="ja",
+            compute_type="int8",
+            decoding=create_decoding_options(config.stt.decoding),
+        )
+
+    @patch("voivoi.chat.stt.adapter.WhisperAdapter")
+    def test_load_stt_wraps_with_silence_precheck(
+        self, mock_adapter: MagicMock
+    ) -> None:
+        """無音の事前判定が有効な場合、Whisperを判定器として包む."""
+        # Arrange
+        from voivoi.chat.stt.gate import SpeechGate
+        from voivoi.config.schema import Config, STTConfig
+
+        # Act
+        stt = _load_stt(Config(stt=STTConfig(streaming=False)))
+
+        # Assert
+        assert isinstance(stt, SpeechGate)
+        assert stt._detector is mock_adapter.return_value
+
+    @patch("voivoi.chat.stt.adapter.WhisperAdapter")
+    def test_load_stt_skips_model_precheck_when_streaming(
+        self, mock_adapter: MagicMock
+    ) -> None:
+        """逐次文字起こしでは、エンコーダーを余分に実行するモデルの判定を行わない."""
+        # Arrange
+        from voivoi.chat.stt.gate import SpeechGate
+        from voivoi.config.schema import Config
+
+        # Act
+        stt = _load_stt(Config())
+
+        # Assert
+        assert isinstance(stt, SpeechGate)
+        assert stt._detector is None
+
+    def test_create_decoding_options_from_profile(self) -> None:
+        """設定のデコードプロファイルをデコード設定に変換する."""
+        # Arrange
+        from voivoi.config.schema import DecodingProfile
+
+        profile = DecodingProfile(beam_size=3, temperatures=[0.0, 0.5], threads=4)
+
+        # Act
+        options = create_decoding_options(profile)
+
+        # Assert
+        assert options.beam_size == 3
+        assert options.temperatures == (0.0, 0.5)
+        assert options.threads == 4
+
+
+class TestLoadLLM:
+    """LLM読み込みのテスト."""
+
+    @patch("voivoi.chat.llm.adapter.OllamaAdapter")
+    def test_load_llm_uses_configured_client_and_warms_up(
+        self, mock_adapter: MagicMock
+    ) -> None:
+        """設定したホスト・タイムアウト・keep_aliveでLLMを作り、モデルを読み込ませる."""
+        # Arrange
+        from voivoi.config.schema import Config, LLMConfig
+
+        config = Config(llm=LLMConfig(host="http://gpu-box:11434", keep_alive="1h"))
+
+        # Act
+        llm = _load_llm(config)
+
+        # Assert
+        assert llm is mock_adapter.return_value
+        mock_adapter.assert_called_once_with(
+            model="llama3.1",
+            host="http://gpu-box:11434",
+            timeout=120.0,
+            keep_alive="1h",
+            num_ctx=8192,
+        )
+        mock_adapter.return_value.warm_up.assert_called_once()
+
+    @patch("voivoi.chat.llm.adapter.OllamaAdapter")
+    def test_load_llm_routes_between_models_when_enabled(
+        self, mock_adapter: MagicMock
+    ) -> None:
+        """振り分けを有効にすると、小さいモデルも読み込んでルーターを返す."""
+        # Arrange
+        from voivoi.chat.llm.router import RoutingLLM
+        from voivoi.config.schema import Config, LLMConfig
+
+        config = Config(llm=LLMConfig(route_max_chars=12, hedge_after_ms=800))
+
+        # Act
+        llm = _load_llm(config)
+
+        # Assert
+        assert isinstance(llm, RoutingLLM)
+        models = [c.kwargs["model"] for c in mock_adapter.call_args_list]
+        assert models == ["llama3.1", "llama3.2"]
+        assert mock_adapter.return_value.warm_up.call_count == 2
+
+    @patch("voivoi.chat.llm.cache.get_cache_dir")
+    @patch("voivoi.chat.llm.adapter.OllamaAdapter")
+    def test_load_llm_wraps_with_response_cache_when_enabled(
+        self, mock_adapter: MagicMock, mock_cache_dir: MagicMock, tmp_path: Path
+    ) -> None:
+        """応答キャッシュを有効にすると、LLMをキャッシュで包む."""
+        # Arrange
+        from voivoi.chat.llm.cache import CachedLLM
+        from voivoi.config.schema import Config, LLMConfig, ResponseCacheConfig
+
+        mock_cache_dir.return_value = tmp_path
+        config = Config(llm=LLMConfig(cache=ResponseCacheConfig(enabled=True)))
+
+        # Act
+        llm = _load_llm(config)
+
+        # Assert
+        assert isinstance(llm, CachedLLM)
+        assert llm.llm is mock_adapter.return_value
+
+    @patch("voivoi.chat.llm.cache.get_cache_dir")
+    @patch("voivoi.chat.llm.adapter.OllamaAdapter")
+    def test_summary_llm_bypasses_cache_and_router(
+        self, mock_adapter: MagicMock, mock_cache_dir: MagicMock, tmp_path: Path
+    ) -> None:
+        """要約には、キャッシュと振り分けを通さない大きいモデルを使う."""
+        # Arrange
+        from voivoi.config.schema import Config, LLMConfig, ResponseCacheConfig
+
+        primary, fast = MagicMock(), MagicMock()
+        mock_adapter.side_effect = [primary, fast]
+        mock_cache_dir.return_value = tmp_path
+        config = Config(
+            llm=LLMConfig(route_max_chars=12, cache=ResponseCacheConfig(enabled=True))
+        )
+
+        # Act
+        llm = _summary_llm(_load_llm(config))
+
+        # Assert
+        assert llm is primary
+
+    def test_unload_llm_ignores_connection_error(self) -> None:
+        """終了時のアンロードでOllamaに接続できなくても例外を送出しない."""
+        # Arrange
+        from concurrent.futures import Future
+
+        from voivoi.chat.llm.adapter import OllamaAdapter
+        from voivoi.chat.llm.port import LLMConnectionError, LLMPort
+
+        mock_llm = MagicMock(spec=OllamaAdapter)
+        mock_llm.unload.side_effect = LLMConnectionError("connection refused")
+        llm_future: Future[LLMPort] = Future()
+        llm_future.set_result(mock_llm)
+
+        # Act
+        _unload_llm(llm_future)
+
+        # Assert
+        mock_llm.unload.assert_called_once()
+
 
 class TestChatList:
     """voivoi chat list コマンドのテスト."""
@@ -185,3 +499,45 @@ class TestChatShow:
         # Assert
         assert result.exit_code == 1
         assert "not found" in result.stdout.lower()
+
+
+class TestImportCost:
+    """音声処理のバックエンドを必要としないコマンドのimportのテスト."""
+
+    # 読み込みに数秒かかる、または音声デバイスを必要とするモジュール
+    HEAVY_MODULES = ("torch", "whisper", "pyaudio")
+
+    def _loaded_heavy_modules(self, args: list[str], home: Path) -> list[str]:
+        """別プロセスでCLIを実行し、読み込まれた重いモジュールを返す."""
+        script = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from voivoi.cli import app\n"
+            f"result = CliRunner().invoke(app, {args!r})\n"
+            "assert result.exit_code == 0, result.output\n"
+            f"print(','.join(m for m in {self.HEAVY_MODULES!r} if m in sys.modules))\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "HOME": str(home)},
+        )
+        return [m for m in completed.stdout.strip().split(",") if m]
+
+    def test_chat_list_does_not_import_audio_backends(self, tmp_path: Path) -> None:
+        """voivoi chat list はtorch・whisper・pyaudioを読み込まない."""
+        # Act
+        loaded = self._loaded_heavy_modules(["chat", "list"], tmp_path)
+
+        # Assert
+        assert loaded == []
+
+    def test_config_init_does_not_import_audio_backends(self, tmp_path: Path) -> None:
+        """voivoi config init はtorch・whisper・pyaudioを読み込まない."""
+        # Act
+        loaded = self._loaded_heavy_modules(["config", "init"], tmp_path)
+
+        # Assert
+        assert loaded == []
@@ -0,0 +1,160 @@
+"""ContextWindow（会話履歴のトークン予算管理）モジュールのテスト."""
+
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from unittest.mock import MagicMock
+
+from voivoi.chat.context import (
+    SUMMARY_PREFIX,
+    ContextWindow,
+    estimate_tokens,
+    message_tokens,
+)
+from voivoi.chat.domain.models import ChatSummary, Message
+from voivoi.chat.llm.port import LLMMessage
+
+
+class _ImmediateExecutor(Executor):
+    """submitした処理をその場で実行するExecutor."""
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., object], /, *args: object, **kwargs: object
+    ) -> Future[object]:
+        future: Future[object] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _conversation(turns: int, text: str = "あ" * 96) -> list[Message]:
+    """1メッセージ100トークン（見積もり）のユーザーとアシスタントの交互の会話を作る."""
+    messages: list[Message] = []
+    for _ in range(turns):
+        messages.append(Message.create("user", text))
+        messages.append(Message.create("assistant", text))
+    return messages
+
+
+class TestEstimateTokens:
+    """estimate_tokensのテスト."""
+
+    def test_counts_ascii_by_four_characters_and_others_by_one(self) -> None:
+        """ASCII文字は4文字で1トークン、日本語は1文字で1トークンと見積もる."""
+        # Act & Assert
+        assert estimate_tokens("hello world!") == 3
+        assert estimate_tokens("こんにちは") == 5
+        assert message_tokens("こんにちは") == 9
+
+
+class TestContextWindow:
+    """ContextWindowのテスト."""
+
+    def test_build_sends_whole_history_within_budget(self) -> None:
+        """予算内の会話履歴はそのまま送る."""
+        # Arrange
+        context = ContextWindow(
+            llm=MagicMock(), executor=_ImmediateExecutor(), budget_tokens=1000
+        )
+        messages = _conversation(2)
+
+        # Act
+        result = context.build(messages)
+
+        # Assert
+        assert result == [LLMMessage(role=m.role, content=m.content) for m in messages]
+
+    def test_build_drops_oldest_messages_over_budget(self) -> None:
+        """要約ができる前に予算を超えた場合は、古いメッセージから送らない."""
+        # Arrange
+        context = ContextWindow(
+            llm=MagicMock(), executor=_ImmediateExecutor(), budget_tokens=350
+        )
+        messages = _conversation(3)
+
+        # Act
+        result = context.build(messages)
+
+        # Assert
+        assert len(result) == 3
+        assert result[-1].content == messages[-1].content
+
+    def test_compact_does_not_summarize_below_threshold(self) -> None:
+        """履歴が予算の閾値以下なら要約しない."""
+        # Arrange
+        mock_llm = MagicMock()
+        context = ContextWindow(
+            llm=mock_llm, executor=_ImmediateExecutor(), budget_tokens=1000
+        )
+
+        # Act
+        context.compact(_conversation(2))
+
+        # Assert
+        mock_llm.generate.assert_not_called()
+        assert context.summary is None
+
+    def test_compact_folds_old_turns_into_summary(self) -> None:
+        """閾値を超えたら古いターンを要約し、以降は要約と直近のターンを送る."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "- 旅行の計画を立てた"
+        context = ContextWindow(
+            llm=mock_llm, executor=_ImmediateExecutor(), budget_tokens=1000
+        )
+        messages = _conversation(4)
+
+        # Act
+        context.compact(messages)
+        result = context.build(messages)
+
+        # Assert
+        # 直近の500トークン以内をユーザーの発話から残し、それより前を要約する
+        assert context.summary == ChatSummary(text="- 旅行の計画を立てた", covered=4)
+        assert result[0] == LLMMessage(
+            role="system", content=SUMMARY_PREFIX + "- 旅行の計画を立てた"
+        )
+        assert result[1:] == [
+            LLMMessage(role=m.role, content=m.content) for m in messages[4:]
+        ]
+
+    def test_compact_extends_previous_summary(self) -> None:
+        """要約済みの会話がある場合は、前回の要約と新しく古くなったターンを要約する."""
+        # Arrange
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "- 新しい要約"
+        previous = ChatSummary(text="- 前回の要約", covered=4)
+        context = ContextWindow(
+            llm=mock_llm,
+            executor=_ImmediateExecutor(),
+            budget_tokens=1000,
+            summary=previous,
+        )
+        messages = _conversation(8)
+
+        # Act
+        context.compact(messages)
+
+        # Assert
+        [request] = mock_llm.generate.call_args.args
+        assert request[1].content.startswith(SUMMARY_PREFIX + "- 前回の要約")
+        assert request[1].content.count("user: ") == 4  # 要約済みの2ターンは含めない
+        assert context.summary == ChatSummary(text="- 新しい要約", covered=12)
+
+    def test_build_reuses_restored_summary_without_llm(self) -> None:
+        """保存済みの要約を渡すと、要約を作り直さずに使う."""
+        # Arrange
+        mock_llm = MagicMock()
+        context = ContextWindow(
+            llm=mock_llm,
+            executor=_ImmediateExecutor(),
+            budget_tokens=1000,
+            summary=ChatSummary(text="- 保存済みの要約", covered=4),
+        )
+        messages = _conversation(3)
+
+        # Act
+        result = context.build(messages)
+
+        # Assert
+        mock_llm.generate.assert_not_called()
+        assert result[0].content == SUMMARY_PREFIX + "- 保存済みの要約"
+        assert len(result) == 3
@@ -0,0 +1,102 @@
+"""無音の事前判定モジュールのテスト."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from voivoi.chat.stt.gate import SpeechGate
+from voivoi.chat.stt.port import SilentAudioError, TranscribeResult
+
+SAMPLE_RATE = 16000
+
+
+def _voiced(seconds: float, peak: int = 8000) -> bytes:
+    """倍音を含む有声音に似た信号を作る."""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    wave = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 15))
+    return (wave / np.abs(wave).max() * peak).astype("<i2").tobytes()
+
+
+def _white_noise(seconds: float) -> bytes:
+    """白色雑音を作る."""
+    rng = np.random.default_rng(0)
+    return rng.normal(0, 3000, int(SAMPLE_RATE * seconds)).astype("<i2").tobytes()
+
+
+class TestSpeechGate:
+    """SpeechGateのテスト."""
+
+    def test_rejects_noise_without_calling_stt(self) -> None:
+        """雑音のみの音声は文字起こしせずに除外する."""
+        # Arrange
+        mock_stt = MagicMock()
+        gate = SpeechGate(mock_stt)
+
+        # Act & Assert
+        with pytest.raises(SilentAudioError):
+            gate.transcribe(_white_noise(1.0))
+        mock_stt.transcribe.assert_not_called()
+        assert gate.stats.rejected_by_signal == 1
+
+    def test_rejects_when_model_reports_high_no_speech_prob(self) -> None:
+        """モデルの無音確率が閾値を超える場合はフルデコードせずに除外する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_detector = MagicMock()
+        mock_detector.no_speech_prob.return_value = 0.95
+        gate = SpeechGate(mock_stt, detector=mock_detector)
+
+        # Act & Assert
+        with pytest.raises(SilentAudioError):
+            gate.transcribe(_voiced(1.0))
+        mock_stt.transcribe.assert_not_called()
+        assert gate.stats.rejected_by_model == 1
+
+    def test_passes_speech_to_stt(self) -> None:
+        """発話らしい音声は文字起こしに進める."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        mock_detector = MagicMock()
+        mock_detector.no_speech_prob.return_value = 0.1
+        gate = SpeechGate(mock_stt, detector=mock_detector)
+        audio = _voiced(1.0)
+
+        # Act
+        result = gate.transcribe(audio)
+
+        # Assert
+        assert result.text == "こんにちは"
+        mock_stt.transcribe.assert_called_once_with(audio)
+        assert gate.stats.passed == 1
+        assert gate.stats.rejected == 0
+
+    def test_passes_quiet_speech_accepted_by_adaptive_vad(self) -> None:
+        """固定の音量閾値（0.02）を下回る小さな声でも、発話らしければ除外しない."""
+        # Arrange
+        mock_stt = MagicMock()
+        gate = SpeechGate(mock_stt)
+        audio = _voiced(1.0, peak=600)  # 正規化RMS 約0.009
+
+        # Act
+        gate.transcribe(audio)
+
+        # Assert
+        mock_stt.transcribe.assert_called_once_with(audio)
+        assert gate.stats.rejected == 0
+
+    def test_skips_signal_check_for_file_input(self) -> None:
+        """ファイルパスの入力には信号の判定を行わない."""
+        # Arrange
+        mock_stt = MagicMock()
+        gate = SpeechGate(mock_stt)
+
+        # Act
+        gate.transcribe(Path("/tmp/test.wav"))
+
+        # Assert
+        mock_stt.transcribe.assert_called_once()
@@ -0,0 +1,155 @@
+"""暴走デコードの打ち切りモジュールのテスト."""
+
+import pytest
+import torch
+from whisper.tokenizer import Tokenizer, get_tokenizer
+
+from voivoi.chat.stt.guard import DecodeAbortedError, DecodeGuard, trim_repetition
+
+
+def _tokenizer() -> Tokenizer:
+    """日本語の文字起こし用トークナイザーを返す."""
+    return get_tokenizer(True, language="ja", task="transcribe")
+
+
+def _decode(decoder: torch.nn.Module, tokenizer: Tokenizer, tokens: list[int]) -> None:
+    """KVキャッシュ使用時と同じく、初回は複数トークン、以降は1トークンずつ渡す."""
+    decoder(torch.tensor([list(tokenizer.sot_sequence)]))
+    for token in tokens:
+        decoder(torch.tensor([[token]]))
+
+
+class TestDecodeGuard:
+    """DecodeGuardのテスト."""
+
+    def test_aborts_when_token_budget_is_exceeded(self) -> None:
+        """生成トークン数が上限に達したら打ち切り、生成済みのテキストを残す."""
+        # Arrange
+        decoder = torch.nn.Identity()  # フックを登録できる任意のモジュール
+        tokenizer = _tokenizer()
+        tokens = tokenizer.encode("今日はいい天気ですね。明日は雨が降るそうです。")
+        guard = DecodeGuard(
+            decoder,
+            tokenizer,
+            max_tokens=5,
+            max_seconds=60.0,
+            compression_ratio_threshold=2.4,
+        )
+
+        # Act
+        with pytest.raises(DecodeAbortedError), guard:
+            _decode(decoder, tokenizer, tokens)
+
+        # Assert
+        assert guard.partial_text == tokenizer.decode(tokens[:5]).strip()
+
+    def test_aborts_when_output_repeats(self) -> None:
+        """生成中のテキストの圧縮率が閾値を超えたら打ち切り、繰り返しを除いて返す."""
+        # Arrange
+        decoder = torch.nn.Identity()
+        tokenizer = _tokenizer()
+        tokens = tokenizer.encode("ありがとうございます。" * 30)
+        guard = DecodeGuard(
+            decoder,
+            tokenizer,
+            max_tokens=1000,
+            max_seconds=60.0,
+            compression_ratio_threshold=2.4,
+        )
+
+        # Act
+        with pytest.raises(DecodeAbortedError), guard:
+            _decode(decoder, tokenizer, tokens)
+
+        # Assert
+        assert guard.partial_text == "ありがとうございます。"
+
+    def test_does_not_abort_normal_output(self) -> None:
+        """繰り返しのない出力は上限内なら打ち切らない."""
+        # Arrange
+        decoder = torch.nn.Identity()
+        tokenizer = _tokenizer()
+        tokens = tokenizer.encode("今日はいい天気ですね。明日は雨が降るそうです。")
+
+        # Act & Assert
+        with DecodeGuard(
+            decoder,
+            tokenizer,
+            max_tokens=1000,
+            max_seconds=60.0,
+            compression_ratio_threshold=2.4,
+        ):
+            _decode(decoder, tokenizer, tokens)
+
+    def test_beam_decode_is_limited_by_token_budget_only(self) -> None:
+        """ビームサーチでは並べ替えられる候補のテキストで判定せず、トークン数で打ち切る."""
+        # Arrange
+        decoder = torch.nn.Identity()
+        tokenizer = _tokenizer()
+        beam_size = 5
+        # 1行目だけを追うと繰り返しに見える（実際には候補が毎ステップ入れ替わる）
+        tokens = tokenizer.encode("ありがとうございます。" * 30)
+
+        def beam_decode(guard: DecodeGuard) -> None:
+            with guard:
+                decoder(torch.tensor([list(tokenizer.sot_sequence)] * beam_size))
+                for token in tokens:
+                    decoder(torch.tensor([[token]] * beam_size))
+
+        unlimited = DecodeGuard(
+            decoder,
+            tokenizer,
+            max_tokens=1000,
+            max_seconds=60.0,
+            compression_ratio_threshold=2.4,
+            beam_size=beam_size,
+        )
+        limited = DecodeGuard(
+            decoder,
+            tokenizer,
+            max_tokens=5,
+            max_seconds=60.0,
+            compression_ratio_threshold=2.4,
+            beam_size=beam_size,
+        )
+
+        # Act
+        beam_decode(unlimited)
+        with pytest.raises(DecodeAbortedError):
+            beam_decode(limited)
+
+        # Assert（どの候補のテキストか分からないため、生成済みのテキストは返さない）
+        assert limited.partial_text == ""
+
+    def test_removes_hook_on_exit(self) -> None:
+        """監視を終えたらデコーダーのフックを外す."""
+        # Arrange
+        decoder = torch.nn.Identity()
+        tokenizer = _tokenizer()
+        with DecodeGuard(
+            decoder,
+            tokenizer,
+            max_tokens=1,
+            max_seconds=60.0,
+            compression_ratio_threshold=2.4,
+        ):
+            pass
+
+        # Act & Assert（上限を超えても打ち切られない）
+        _decode(decoder, tokenizer, tokenizer.encode("こんにちは"))
+
+
+class TestTrimRepetition:
+    """trim_repetitionのテスト."""
+
+    def test_collapses_trailing_repetition(self) -> None:
+        """末尾で繰り返された語句を1回に縮める."""
+        # Act & Assert
+        assert trim_repetition("はい、そうです。そうです。そうです。") == (
+            "はい、そうです。"
+        )
+
+    def test_keeps_text_without_repetition(self) -> None:
+        """繰り返しのないテキストはそのまま返す."""
+        # Act & Assert
+        assert trim_repetition("今日はいい天気ですね") == "今日はいい天気ですね"
@@ -4,6 +4,14 @@ from unittest.mock import MagicMock
 
 from voivoi.chat.audio.listener import ContinuousListener
 
+# 16kHz・16-bitで100ミリ秒分のチャンク
+CHUNK_BYTES = 3200
+
+
+def _chunk(label: bytes, size: int = CHUNK_BYTES) -> bytes:
+    """ラベルを先頭に持つ指定サイズのチャンクを作る."""
+    return label.ljust(size, b"\x00")
+
 
 class TestContinuousListener:
     """ContinuousListenerのテスト."""
@@ -16,15 +24,19 @@ class TestContinuousListener:
 
         # シーケンス: 発話 → 発話 → 無音×2（発話終了）
         mock_recorder.read_chunk.side_effect = [
-            (b"speech1", 0.5),  # 発話開始
-            (b"speech2", 0.6),  # 発話継続
-            (b"silent1", 0.01),  # 無音1
-            (b"silent2", 0.01),  # 無音2（発話終了判定）
+            _chunk(b"speech1"),  # 発話開始
+            _chunk(b"speech2"),  # 発話継続
+            _chunk(b"silent1"),  # 無音1
+            _chunk(b"silent2"),  # 無音2（発話終了判定）
         ]
-        mock_vad.is_speech.side_effect = [True, True, False, False]
+        mock_vad.is_speech_frame.side_effect = [True, True, False, False]
 
         listener = ContinuousListener(
-            recorder=mock_recorder, vad=mock_vad, min_speech_chunks=1, silence_chunks=2
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=100,
+            silence_ms=200,
+            pre_roll_ms=0,
         )
 
         # Act
@@ -32,7 +44,7 @@ class TestContinuousListener:
 
         # Assert
         # 発話中のデータのみが含まれる
-        assert result == b"speech1speech2"
+        assert result == _chunk(b"speech1") + _chunk(b"speech2")
 
     def test_ignores_short_bursts_of_noise(self) -> None:
         """短いノイズは無視する（最小発話時間を設定）."""
@@ -42,18 +54,30 @@ class TestContinuousListener:
 
         # シーケンス: ノイズ1チャンクのみ → 無音（短すぎるので無視）→ 正常発話
         mock_recorder.read_chunk.side_effect = [
-            (b"noise", 0.5),  # 短いノイズ（1チャンクのみ）
-            (b"silent1", 0.01),  # 無音1
-            (b"silent2", 0.01),  # 無音2（min_speech_chunks未満なので無視）
-            (b"speech1", 0.5),  # 正常な発話開始
-            (b"speech2", 0.6),  # 発話継続
-            (b"silent3", 0.01),  # 無音1
-            (b"silent4", 0.01),  # 無音2（発話終了判定）
+            _chunk(b"noise"),  # 短いノイズ（1チャンクのみ）
+            _chunk(b"silent1"),  # 無音1
+            _chunk(b"silent2"),  # 無音2（min_speech_ms未満なので無視）
+            _chunk(b"speech1"),  # 正常な発話開始
+            _chunk(b"speech2"),  # 発話継続
+            _chunk(b"silent3"),  # 無音1
+            _chunk(b"silent4"),  # 無音2（発話終了判定）
+        ]
+        mock_vad.is_speech_frame.side_effect = [
+            True,
+            False,
+            False,
+            True,
+            True,
+            False,
+            False,
         ]
-        mock_vad.is_speech.side_effect = [True, False, False, True, True, False, False]
 
         listener = ContinuousListener(
-            recorder=mock_recorder, vad=mock_vad, min_speech_chunks=2, silence_chunks=2
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=200,
+            silence_ms=200,
+            pre_roll_ms=0,
         )
 
         # Act
@@ -61,7 +85,7 @@ class TestContinuousListener:
 
         # Assert
         # 短いノイズは無視され、正常な発話のみがyieldされる
-        assert result == b"speech1speech2"
+        assert result == _chunk(b"speech1") + _chunk(b"speech2")
 
     def test_waits_for_silence_duration_before_ending_speech(self) -> None:
         """一定期間の無音を待ってから発話終了と判定する."""
@@ -71,16 +95,20 @@ class TestContinuousListener:
 
         # シーケンス: 発話 → 短い無音（1チャンク）→ 発話再開 → 長い無音（2チャンク、発話終了）
         mock_recorder.read_chunk.side_effect = [
-            (b"speech1", 0.5),  # 発話
-            (b"pause", 0.01),  # 短い無音（1チャンク、息継ぎ）
-            (b"speech2", 0.5),  # 発話再開
-            (b"silent1", 0.01),  # 無音1
-            (b"silent2", 0.01),  # 無音2（発話終了判定）
+            _chunk(b"speech1"),  # 発話
+            _chunk(b"pause"),  # 短い無音（1チャンク、息継ぎ）
+            _chunk(b"speech2"),  # 発話再開
+            _chunk(b"silent1"),  # 無音1
+            _chunk(b"silent2"),  # 無音2（発話終了判定）
         ]
-        mock_vad.is_speech.side_effect = [True, False, True, False, False]
+        mock_vad.is_speech_frame.side_effect = [True, False, True, False, False]
 
         listener = ContinuousListener(
-            recorder=mock_recorder, vad=mock_vad, min_speech_chunks=1, silence_chunks=2
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=100,
+            silence_ms=200,
+            pre_roll_ms=0,
         )
 
         # Act
@@ -88,4 +116,172 @@ class TestContinuousListener:
 
         # Assert
         # 短い無音は発話の一部として含まれる
-        assert result == b"speech1pausespeech2"
+        assert result == _chunk(b"speech1") + _chunk(b"pause") + _chunk(b"speech2")
+
+    def test_includes_pre_roll_audio_before_speech_onset(self) -> None:
+        """発話開始直前の音声をプリロールとして含める."""
+        # Arrange
+        mock_recorder = MagicMock()
+        mock_vad = MagicMock()
+
+        mock_recorder.read_chunk.side_effect = [
+            _chunk(b"before1"),  # プリロールの範囲外
+            _chunk(b"before2"),  # プリロール
+            _chunk(b"before3"),  # プリロール
+            _chunk(b"speech"),  # 発話開始
+            _chunk(b"silent1"),
+            _chunk(b"silent2"),  # 発話終了判定
+        ]
+        mock_vad.is_speech_frame.side_effect = [False, False, False, True, False, False]
+
+        listener = ContinuousListener(
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=100,
+            silence_ms=200,
+            pre_roll_ms=200,
+        )
+
+        # Act
+        result = next(listener.listen())
+
+        # Assert
+        assert result == _chunk(b"before2") + _chunk(b"before3") + _chunk(b"speech")
+
+    def test_endpoint_timeout_is_independent_of_chunk_size(self) -> None:
+        """無音時間はチャンク数ではなく音声の長さで判定する."""
+        # Arrange
+        mock_recorder = MagicMock()
+        mock_vad = MagicMock()
+
+        # 50ミリ秒のチャンクでは200ミリ秒の無音に4チャンク必要
+        half = CHUNK_BYTES // 2
+        mock_recorder.read_chunk.side_effect = [
+            _chunk(b"speech1", half),
+            _chunk(b"speech2", half),
+            _chunk(b"silent1", half),
+            _chunk(b"silent2", half),
+            _chunk(b"silent3", half),
+            _chunk(b"silent4", half),  # 発話終了判定
+        ]
+        mock_vad.is_speech_frame.side_effect = [True, True, False, False, False, False]
+
+        listener = ContinuousListener(
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=100,
+            silence_ms=200,
+            pre_roll_ms=0,
+        )
+
+        # Act
+        result = next(listener.listen())
+
+        # Assert
+        assert result == _chunk(b"speech1", half) + _chunk(b"speech2", half)
+        assert mock_recorder.read_chunk.call_count == 6
+
+    def test_notifies_observer_of_speech_progress(self) -> None:
+        """発話の開始・チャンク・終了をオブザーバーに通知する."""
+        # Arrange
+        mock_recorder = MagicMock()
+        mock_vad = MagicMock()
+        mock_observer = MagicMock()
+
+        mock_recorder.read_chunk.side_effect = [
+            _chunk(b"before"),  # プリロール
+            _chunk(b"speech"),  # 発話開始
+            _chunk(b"silent1"),
+            _chunk(b"silent2"),  # 発話終了判定
+        ]
+        mock_vad.is_speech_frame.side_effect = [False, True, False, False]
+
+        listener = ContinuousListener(
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=100,
+            silence_ms=200,
+            pre_roll_ms=100,
+            observer=mock_observer,
+        )
+
+        # Act
+        result = next(listener.listen())
+
+        # Assert
+        mock_observer.on_speech_start.assert_called_once()
+        fed = [c.args[0] for c in mock_observer.on_speech_chunk.call_args_list]
+        assert fed == [
+            _chunk(b"before"),
+            _chunk(b"speech"),
+            _chunk(b"silent1"),
+            _chunk(b"silent2"),
+        ]
+        mock_observer.on_speech_end.assert_called_once_with(result)
+
+    def test_splits_long_utterance_at_max_duration(self) -> None:
+        """上限を超える発話は区切ってyieldし、続きを発話開始を待たずに録音する."""
+        # Arrange
+        mock_recorder = MagicMock()
+        mock_vad = MagicMock()
+
+        mock_recorder.read_chunk.side_effect = [
+            _chunk(b"speech1"),  # 発話開始
+            _chunk(b"speech2"),  # 上限（200ms）に達したので区切る
+            _chunk(b"speech3"),  # 続き
+            _chunk(b"silent1"),
+            _chunk(b"silent2"),  # 発話終了判定
+        ]
+        mock_vad.is_speech_frame.side_effect = [True, True, True, False, False]
+
+        listener = ContinuousListener(
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=100,
+            silence_ms=200,
+            pre_roll_ms=0,
+            max_utterance_ms=200,
+        )
+
+        # Act
+        utterances = listener.listen()
+        first = next(utterances)
+        second = next(utterances)
+
+        # Assert
+        assert first == _chunk(b"speech1") + _chunk(b"speech2")
+        assert second == _chunk(b"speech3")
+
+    def test_keeps_only_latest_audio_when_observer_receives_chunks(self) -> None:
+        """オブザーバーが音声を受け取る場合は区切らず、古いチャンクを捨てて上限内に収める."""
+        # Arrange
+        mock_recorder = MagicMock()
+        mock_vad = MagicMock()
+        mock_observer = MagicMock()
+
+        mock_recorder.read_chunk.side_effect = [
+            _chunk(b"speech1"),  # 発話開始
+            _chunk(b"speech2"),
+            _chunk(b"speech3"),  # 上限を超えたので最古のチャンクを捨てる
+            _chunk(b"silent1"),
+            _chunk(b"silent2"),  # 発話終了判定
+        ]
+        mock_vad.is_speech_frame.side_effect = [True, True, True, False, False]
+
+        listener = ContinuousListener(
+            recorder=mock_recorder,
+            vad=mock_vad,
+            min_speech_ms=100,
+            silence_ms=200,
+            pre_roll_ms=0,
+            max_utterance_ms=200,
+            observer=mock_observer,
+        )
+
+        # Act
+        result = next(listener.listen())
+
+        # Assert
+        mock_observer.on_speech_start.assert_called_once()
+        assert mock_observer.on_speech_chunk.call_count == 5
+        assert result == _chunk(b"speech3")
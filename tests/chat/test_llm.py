@@ -1,12 +1,21 @@
 """LLMモジュールのテスト."""
 
+import socket
+import threading
+from collections.abc import Iterator
 from typing import Protocol
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from voivoi.chat.llm.adapter import OllamaAdapter
-from voivoi.chat.llm.port import LLMConnectionError, LLMMessage, LLMPort
+from voivoi.chat.llm.port import (
+    LLMConnectionError,
+    LLMMessage,
+    LLMPort,
+    LLMStream,
+    LLMUsage,
+)
 
 
 class TestLLMMessage:
@@ -48,6 +57,56 @@ class TestLLMPort:
         assert issubclass(LLMPort, Protocol)
 
 
+class TestLLMStream:
+    """LLMStreamのテスト."""
+
+    def test_cancel_stops_iteration_and_closes_source(self) -> None:
+        """取り消すと次の断片を返さずに反復を終え、元のストリームを閉じる."""
+        # Arrange
+        closed: list[bool] = []
+
+        def chunks() -> Iterator[str]:
+            try:
+                yield "昔々、"
+                yield "あるところに"
+            finally:
+                closed.append(True)
+
+        stream = LLMStream(chunks())
+
+        # Act
+        first = next(stream)
+        stream.cancel()
+        rest = list(stream)
+
+        # Assert
+        assert first == "昔々、"
+        assert rest == []
+        assert stream.cancelled is True
+        assert closed == [True]
+
+    def test_cancel_calls_on_cancel_and_ignores_resulting_error(self) -> None:
+        """取り消すとon_cancelで接続を切り、それによる元のストリームのエラーは送出しない."""
+        # Arrange
+        disconnected = threading.Event()
+
+        def chunks() -> Iterator[str]:
+            # プロンプトの評価中（最初の断片が届く前）に接続を切られる
+            disconnected.wait(timeout=1)
+            raise LLMConnectionError("connection closed")
+            yield ""
+
+        stream = LLMStream(chunks(), on_cancel=disconnected.set)
+
+        # Act
+        stream.cancel()
+        rest = list(stream)
+
+        # Assert
+        assert disconnected.is_set()
+        assert rest == []
+
+
 class TestOllamaAdapter:
     """OllamaAdapterのテスト."""
 
@@ -57,7 +116,9 @@ class TestOllamaAdapter:
     ) -> None:
         """Ollamaからの応答を返す."""
         # Arrange
-        mock_ollama.chat.return_value = {"message": {"content": "こんにちは！"}}
+        mock_ollama.Client.return_value.chat.return_value = {
+            "message": {"content": "こんにちは！"}
+        }
         llm = OllamaAdapter(model="llama3.1")
         messages = [LLMMessage(role="user", content="挨拶して")]
 
@@ -73,7 +134,9 @@ class TestOllamaAdapter:
     ) -> None:
         """設定されたモデルでメッセージを送信する."""
         # Arrange
-        mock_ollama.chat.return_value = {"message": {"content": "応答"}}
+        mock_ollama.Client.return_value.chat.return_value = {
+            "message": {"content": "応答"}
+        }
         llm = OllamaAdapter(model="gemma2")
         messages = [LLMMessage(role="user", content="テスト")]
 
@@ -81,16 +144,20 @@ class TestOllamaAdapter:
         llm.generate(messages)
 
         # Assert
-        mock_ollama.chat.assert_called_once_with(
+        mock_ollama.Client.return_value.chat.assert_called_once_with(
             model="gemma2",
             messages=[{"role": "user", "content": "テスト"}],
+            options={"num_ctx": 8192},
+            keep_alive=-1,
         )
 
     @patch("voivoi.chat.llm.adapter.ollama")
     def test_generate_passes_conversation_history(self, mock_ollama: MagicMock) -> None:
         """会話履歴を含めてOllamaに送信する."""
         # Arrange
-        mock_ollama.chat.return_value = {"message": {"content": "東京です"}}
+        mock_ollama.Client.return_value.chat.return_value = {
+            "message": {"content": "東京です"}
+        }
         llm = OllamaAdapter(model="llama3.1")
         messages = [
             LLMMessage(role="user", content="私は日本に住んでいます"),
@@ -102,16 +169,250 @@ class TestOllamaAdapter:
         result = llm.generate(messages)
 
         # Assert
-        mock_ollama.chat.assert_called_once_with(
+        mock_ollama.Client.return_value.chat.assert_called_once_with(
             model="llama3.1",
             messages=[
                 {"role": "user", "content": "私は日本に住んでいます"},
                 {"role": "assistant", "content": "日本のどこにお住まいですか？"},
                 {"role": "user", "content": "首都です"},
             ],
+            options={"num_ctx": 8192},
+            keep_alive=-1,
         )
         assert result == "東京です"
 
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_stream_yields_response_chunks_in_order(
+        self, mock_ollama: MagicMock
+    ) -> None:
+        """ストリーミングで届いた応答の断片を順に返す（空の断片は除く）."""
+        # Arrange
+        mock_ollama.Client.return_value.chat.return_value = iter(
+            [
+                {"message": {"content": "こんにちは"}},
+                {"message": {"content": "！"}},
+                {"message": {"content": ""}},
+            ]
+        )
+        llm = OllamaAdapter(model="gemma2")
+        messages = [LLMMessage(role="user", content="挨拶して")]
+
+        # Act
+        chunks = list(llm.stream(messages))
+
+        # Assert
+        assert chunks == ["こんにちは", "！"]
+        mock_ollama.Client.return_value.chat.assert_called_once_with(
+            model="gemma2",
+            messages=[{"role": "user", "content": "挨拶して"}],
+            stream=True,
+            options={"num_ctx": 8192},
+            keep_alive=-1,
+        )
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_stream_records_prompt_usage_from_final_chunk(
+        self, mock_ollama: MagicMock
+    ) -> None:
+        """最後の断片の統計から、評価したプロンプトのトークン数と時間を記録する."""
+        # Arrange
+        mock_ollama.Client.return_value.chat.return_value = iter(
+            [
+                {"message": {"content": "はい"}, "done": False},
+                {
+                    "message": {"content": ""},
+                    "done": True,
+                    "prompt_eval_count": 12,
+                    "prompt_eval_duration": 48_000_000,
+                },
+            ]
+        )
+        llm = OllamaAdapter(model="gemma2")
+
+        # Act
+        list(llm.stream([LLMMessage(role="user", content="元気？")]))
+
+        # Assert
+        assert llm.last_usage == LLMUsage(prompt_tokens=12, prefill_ms=48.0)
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_stream_keeps_options_stable_across_requests(
+        self, mock_ollama: MagicMock
+    ) -> None:
+        """KVキャッシュを再利用させるため、すべてのリクエストで同じオプションを送る."""
+        # Arrange
+        mock_client = mock_ollama.Client.return_value
+        mock_client.chat.side_effect = lambda **kwargs: iter([])
+        llm = OllamaAdapter(model="gemma2", num_ctx=4096)
+
+        # Act
+        llm.warm_up()
+        list(llm.stream([LLMMessage(role="user", content="1")]))
+        list(llm.stream([LLMMessage(role="user", content="2")]))
+
+        # Assert
+        assert [c.kwargs["options"] for c in mock_client.chat.call_args_list] == [
+            {"num_ctx": 4096}
+        ] * 3
+        assert llm.last_usage is None  # 最後の断片が届かなければ記録しない
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_cancel_closes_ollama_stream(self, mock_ollama: MagicMock) -> None:
+        """ストリームを取り消すと、Ollamaのストリーム（接続）を閉じる."""
+        # Arrange
+        closed: list[bool] = []
+
+        def chunks() -> Iterator[dict[str, object]]:
+            try:
+                yield {"message": {"content": "昔々、"}}
+                yield {"message": {"content": "あるところに"}}
+            finally:
+                closed.append(True)
+
+        mock_ollama.Client.return_value.chat.return_value = chunks()
+        llm = OllamaAdapter(model="gemma2")
+        stream = llm.stream([LLMMessage(role="user", content="お話して")])
+
+        # Act
+        next(stream)
+        stream.cancel()
+        list(stream)
+
+        # Assert
+        assert closed == [True]
+
+    def test_cancel_disconnects_during_prompt_evaluation(self) -> None:
+        """最初の断片が届く前でも、取り消すとすぐに接続を切って反復を終える."""
+        # Arrange
+        server = socket.create_server(("127.0.0.1", 0))
+        accepted = threading.Event()
+        disconnected = threading.Event()
+
+        def serve() -> None:
+            # リクエストを受け取ったまま応答しない（プロンプトの評価中）
+            conn, _ = server.accept()
+            with conn:
+                accepted.set()
+                while conn.recv(4096):
+                    pass
+                disconnected.set()
+
+        threading.Thread(target=serve, daemon=True).start()
+        port = server.getsockname()[1]
+        llm = OllamaAdapter(model="gemma2", host=f"http://127.0.0.1:{port}")
+        stream = llm.stream([LLMMessage(role="user", content="お話して")])
+        results: list[list[str]] = []
+        consumer = threading.Thread(
+            target=lambda: results.append(list(stream)), daemon=True
+        )
+
+        # Act
+        consumer.start()
+        assert accepted.wait(timeout=5)
+        stream.cancel()
+        consumer.join(timeout=5)
+
+        # Assert
+        server.close()
+        assert results == [[]]
+        assert disconnected.wait(timeout=5)
+
+    def test_stream_reuses_connection(self) -> None:
+        """取り消せるストリーミングでも、続けて送るリクエストは同じ接続を使い回す."""
+        # Arrange
+        server = socket.create_server(("127.0.0.1", 0))
+        connections: list[socket.socket] = []
+        body = '{"message": {"role": "assistant", "content": "はい"}, "done": true}\n'.encode()
+        response = (
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+        )
+
+        def serve() -> None:
+            conn, _ = server.accept()
+            connections.append(conn)
+            with conn, conn.makefile("rb") as reader:
+                while True:
+                    headers = b""
+                    while not headers.endswith(b"\r\n\r\n"):
+                        line = reader.readline()
+                        if not line:
+                            return
+                        headers += line
+                    length = next(
+                        int(line.split(b":")[1])
+                        for line in headers.lower().split(b"\r\n")
+                        if line.startswith(b"content-length:")
+                    )
+                    reader.read(length)
+                    conn.sendall(response)
+
+        threading.Thread(target=serve, daemon=True).start()
+        port = server.getsockname()[1]
+        llm = OllamaAdapter(model="gemma2", host=f"http://127.0.0.1:{port}")
+        messages = [LLMMessage(role="user", content="こんにちは")]
+
+        # Act
+        first = list(llm.stream(messages))
+        second = list(llm.stream(messages))
+
+        # Assert
+        server.close()
+        assert first == second == ["はい"]
+        assert len(connections) == 1
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_warm_up_loads_model_without_messages(self, mock_ollama: MagicMock) -> None:
+        """ウォームアップではメッセージなしでモデルを読み込ませる."""
+        # Arrange
+        llm = OllamaAdapter(model="gemma2")
+
+        # Act
+        llm.warm_up()
+
+        # Assert
+        mock_ollama.Client.return_value.chat.assert_called_once_with(
+            model="gemma2", messages=[], options={"num_ctx": 8192}, keep_alive=-1
+        )
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_creates_client_with_configured_host_and_timeout(
+        self, mock_ollama: MagicMock
+    ) -> None:
+        """設定したホストとタイムアウトでクライアントを作り、リクエストで使い回す."""
+        # Arrange
+        mock_client = mock_ollama.Client.return_value
+        mock_client.chat.return_value = {"message": {"content": "応答"}}
+
+        # Act
+        llm = OllamaAdapter(
+            model="gemma2", host="http://gpu-box:11434", timeout=30.0, keep_alive="1h"
+        )
+        llm.generate([LLMMessage(role="user", content="1")])
+        llm.generate([LLMMessage(role="user", content="2")])
+
+        # Assert
+        # 2つ目はストリーミング用（取り消し時に実行中の接続だけを切る）
+        [client, stream_client] = mock_ollama.Client.call_args_list
+        assert client.kwargs == {"host": "http://gpu-box:11434", "timeout": 30.0}
+        assert stream_client.kwargs["host"] == "http://gpu-box:11434"
+        assert mock_client.chat.call_count == 2
+        assert mock_client.chat.call_args.kwargs["keep_alive"] == "1h"
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_unload_releases_model(self, mock_ollama: MagicMock) -> None:
+        """アンロードではkeep_alive=0でモデルをメモリから外す."""
+        # Arrange
+        llm = OllamaAdapter(model="gemma2")
+
+        # Act
+        llm.unload()
+
+        # Assert
+        mock_ollama.Client.return_value.chat.assert_called_once_with(
+            model="gemma2", messages=[], options={"num_ctx": 8192}, keep_alive=0
+        )
+
 
 class TestLLMConnectionError:
     """LLMConnectionErrorのテスト."""
@@ -129,10 +430,45 @@ class TestLLMConnectionError:
         # Arrange
         from ollama import ResponseError
 
-        mock_ollama.chat.side_effect = ResponseError("connection refused")
+        mock_ollama.Client.return_value.chat.side_effect = ResponseError(
+            "connection refused"
+        )
         llm = OllamaAdapter(model="llama3.1")
         messages = [LLMMessage(role="user", content="こんにちは")]
 
         # Act & Assert
         with pytest.raises(LLMConnectionError):
             llm.generate(messages)
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_stream_raises_connection_error_when_ollama_unavailable(
+        self, mock_ollama: MagicMock
+    ) -> None:
+        """ストリーミング中にOllamaが利用できない場合、LLMConnectionErrorを発生させる."""
+        # Arrange
+        from ollama import ResponseError
+
+        mock_ollama.Client.return_value.chat.side_effect = ResponseError(
+            "connection refused"
+        )
+        llm = OllamaAdapter(model="llama3.1")
+        messages = [LLMMessage(role="user", content="こんにちは")]
+
+        # Act & Assert
+        with pytest.raises(LLMConnectionError):
+            list(llm.stream(messages))
+
+    @patch("voivoi.chat.llm.adapter.ollama")
+    def test_generate_raises_connection_error_on_timeout(
+        self, mock_ollama: MagicMock
+    ) -> None:
+        """タイムアウトした場合、LLMConnectionErrorを発生させる."""
+        # Arrange
+        import httpx
+
+        mock_ollama.Client.return_value.chat.side_effect = httpx.ReadTimeout("timeout")
+        llm = OllamaAdapter(model="llama3.1")
+
+        # Act & Assert
+        with pytest.raises(LLMConnectionError):
+            llm.generate([LLMMessage(role="user", content="こんにちは")])
@@ -0,0 +1,119 @@
+"""音量メーターモジュールのテスト."""
+
+import numpy as np
+import pytest
+
+from voivoi.chat.audio.meter import (
+    SILENCE_DBFS,
+    measure,
+    measure_batch,
+    peak,
+    rms,
+    rms_level,
+)
+
+
+def _pcm(*values: int) -> bytes:
+    """int16のサンプル値からPCMバイト列を作る."""
+    return np.array(values, dtype=np.int16).tobytes()
+
+
+class TestRmsLevel:
+    """rms_levelのテスト."""
+
+    def test_returns_normalized_rms(self) -> None:
+        """16-bitの最大値で正規化したRMSを返す."""
+        # Arrange
+        data = b"\x00\x40" * 1024  # 16384（最大値の約半分）
+
+        # Act
+        level = rms_level(data)
+
+        # Assert
+        assert level == pytest.approx(16384 / 32767)
+
+    def test_returns_zero_for_empty_data(self) -> None:
+        """空のデータは0.0を返す."""
+        # Act & Assert
+        assert rms_level(b"") == 0.0
+
+    def test_clips_level_to_one(self) -> None:
+        """最小値（-32768）のみのデータでも1.0を超えない."""
+        # Act & Assert
+        assert rms_level(_pcm(-32768, -32768)) == 1.0
+
+
+class TestMeasure:
+    """measureのテスト."""
+
+    def test_returns_rms_peak_and_dbfs(self) -> None:
+        """RMS・ピーク・dBFSを計算する."""
+        # Arrange
+        data = _pcm(16384, -16384, 16384, -32767)
+
+        # Act
+        level = measure(data)
+
+        # Assert
+        assert level.peak == pytest.approx(1.0)
+        assert level.rms == pytest.approx(rms_level(data))
+        assert level.dbfs == pytest.approx(20 * np.log10(level.rms))
+
+    def test_silence_is_floored_to_silence_dbfs(self) -> None:
+        """完全な無音はSILENCE_DBFSになる."""
+        # Act
+        level = measure(_pcm(0, 0, 0, 0))
+
+        # Assert
+        assert level.rms == 0.0
+        assert level.dbfs == pytest.approx(SILENCE_DBFS)
+
+
+class TestMeasureBatch:
+    """measure_batchのテスト."""
+
+    def test_matches_per_chunk_measurement(self) -> None:
+        """一括計算の結果はチャンクごとの計算と一致する."""
+        # Arrange
+        rng = np.random.default_rng(0)
+        chunks = [
+            rng.integers(-20000, 20000, 256, dtype=np.int16).tobytes() for _ in range(8)
+        ]
+
+        # Act
+        levels = measure_batch(chunks)
+
+        # Assert
+        assert len(levels) == 8
+        for chunk, level in zip(chunks, levels, strict=True):
+            expected = measure(chunk)
+            assert level.rms == pytest.approx(expected.rms)
+            assert level.peak == pytest.approx(expected.peak)
+            assert level.dbfs == pytest.approx(expected.dbfs)
+
+    def test_handles_chunks_of_different_lengths(self) -> None:
+        """長さの異なるチャンクも計算できる."""
+        # Act
+        levels = measure_batch([_pcm(100, -100), _pcm(0, 0, 0)])
+
+        # Assert
+        assert levels[0].peak == pytest.approx(100 / 32767)
+        assert levels[1].rms == 0.0
+
+    def test_returns_empty_list_for_no_chunks(self) -> None:
+        """チャンクがない場合は空リストを返す."""
+        # Act & Assert
+        assert measure_batch([]) == []
+
+
+class TestFrameFunctions:
+    """2次元配列を受け取る関数のテスト."""
+
+    def test_rms_and_peak_are_computed_per_frame(self) -> None:
+        """最後の軸に沿ってフレームごとに計算する."""
+        # Arrange
+        frames = np.array([[0, 0], [-32768, 32767]], dtype=np.int16)
+
+        # Act & Assert
+        assert rms(frames).tolist() == pytest.approx([0.0, 1.0])
+        assert peak(frames).tolist() == pytest.approx([0.0, 1.0])
@@ -0,0 +1,41 @@
+"""応答時間の計測モジュールのテスト."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+from voivoi.chat.metrics import FirstTokenTimer
+
+
+class TestFirstTokenTimer:
+    """FirstTokenTimerのテスト."""
+
+    @patch("voivoi.chat.metrics.time.perf_counter")
+    def test_measures_time_until_first_chunk(
+        self, mock_perf_counter: MagicMock
+    ) -> None:
+        """反復の開始から最初の断片が届くまでの時間を計る."""
+        # Arrange
+        mock_perf_counter.side_effect = [10.0, 10.25]
+        timer = FirstTokenTimer(["こんにちは", "！"])
+
+        # Act
+        chunks = list(timer)
+
+        # Assert
+        assert chunks == ["こんにちは", "！"]
+        assert timer.elapsed_ms == 250.0
+
+    def test_elapsed_is_none_when_no_chunk_arrives(self) -> None:
+        """断片が1つも届かなかった場合はNoneのままにする."""
+
+        # Arrange
+        def empty() -> Iterator[str]:
+            yield from ()
+
+        timer = FirstTokenTimer(empty())
+
+        # Act
+        list(timer)
+
+        # Assert
+        assert timer.elapsed_ms is None
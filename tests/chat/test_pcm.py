@@ -0,0 +1,74 @@
+"""PCM音声データ変換モジュールのテスト."""
+
+import numpy as np
+
+from voivoi.chat.audio.pcm import duration_ms, to_float32, to_frames, to_samples
+
+
+class TestToSamples:
+    """to_samplesのテスト."""
+
+    def test_returns_int16_samples_from_bytes(self) -> None:
+        """PCMバイト列をint16のサンプル配列として返す."""
+        # Arrange
+        data = np.array([0, 1, -1, 32767, -32768], dtype=np.int16).tobytes()
+
+        # Act
+        samples = to_samples(data)
+
+        # Assert
+        assert samples.tolist() == [0, 1, -1, 32767, -32768]
+
+    def test_does_not_copy_data(self) -> None:
+        """元のバイト列をコピーせずに参照する."""
+        # Arrange
+        data = b"\x00\x40" * 4
+
+        # Act
+        samples = to_samples(data)
+
+        # Assert
+        assert not samples.flags.owndata
+        assert not samples.flags.writeable
+
+
+class TestToFrames:
+    """to_framesのテスト."""
+
+    def test_reshapes_samples_into_frames_dropping_remainder(self) -> None:
+        """フレーム単位の2次元配列にし、端数のサンプルは切り捨てる."""
+        # Arrange
+        data = np.arange(10, dtype=np.int16).tobytes()
+
+        # Act
+        frames = to_frames(data, frame_size=4)
+
+        # Assert
+        assert frames.shape == (2, 4)
+        assert frames[1].tolist() == [4, 5, 6, 7]
+
+
+class TestToFloat32:
+    """to_float32のテスト."""
+
+    def test_normalizes_samples_to_unit_range(self) -> None:
+        """int16のサンプルを-1.0〜1.0のfloat32に正規化する."""
+        # Arrange
+        data = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+
+        # Act
+        audio = to_float32(data)
+
+        # Assert
+        assert audio.dtype == np.float32
+        assert audio.tolist() == [0.0, 0.5, -1.0]
+
+
+class TestDurationMs:
+    """duration_msのテスト."""
+
+    def test_returns_duration_of_pcm_data(self) -> None:
+        """サンプルレートから再生時間を計算する."""
+        # Act & Assert
+        assert duration_ms(b"\x00\x00" * 1600) == 100.0
+        assert duration_ms(b"\x00\x00" * 1600, sample_rate=8000) == 200.0
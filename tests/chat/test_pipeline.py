@@ -0,0 +1,159 @@
+"""文単位の読み上げパイプラインモジュールのテスト."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from voivoi.chat.tts.pipeline import SentenceSplitter, SpeechPipeline
+
+
+class TestSentenceSplitter:
+    """SentenceSplitterのテスト."""
+
+    def test_splits_at_japanese_punctuation(self) -> None:
+        """日本語の句読点（。！？）で区切る."""
+        # Arrange
+        splitter = SentenceSplitter()
+
+        # Act
+        sentences = splitter.feed("こんにちは！今日はいい天気ですね。散歩しますか？")
+
+        # Assert
+        assert sentences == ["こんにちは！", "今日はいい天気ですね。"]
+        assert splitter.flush() == "散歩しますか？"
+
+    def test_joins_sentence_split_across_chunks(self) -> None:
+        """断片をまたぐ文は区切りが届くまで溜める."""
+        # Arrange
+        splitter = SentenceSplitter()
+
+        # Act
+        first = splitter.feed("今日は")
+        second = splitter.feed("晴れです。明")
+
+        # Assert
+        assert first == []
+        assert second == ["今日は晴れです。"]
+
+    def test_keeps_closing_bracket_with_sentence(self) -> None:
+        """句読点の直後の閉じ括弧は同じ文に含める."""
+        # Arrange
+        splitter = SentenceSplitter()
+
+        # Act
+        sentences = splitter.feed("「はい。」と")
+
+        # Assert
+        assert sentences == ["「はい。」"]
+
+    def test_splits_english_only_before_whitespace(self) -> None:
+        """英語の句読点は直後が空白の場合だけ区切る（小数点では区切らない）."""
+        # Arrange
+        splitter = SentenceSplitter()
+
+        # Act
+        sentences = splitter.feed("Pi is 3.14. Really? Yes")
+
+        # Assert
+        assert sentences == ["Pi is 3.14.", " Really?"]
+        assert splitter.flush() == " Yes"
+
+
+class TestSpeechPipeline:
+    """SpeechPipelineのテスト."""
+
+    def test_speaks_each_sentence_in_order(self) -> None:
+        """文ごとに順に読み上げ、残りはブロックを抜けるときに読み上げる."""
+        # Arrange
+        mock_tts = MagicMock()
+
+        # Act
+        with SpeechPipeline(mock_tts) as speech:
+            chunks = list(speech.speak_along(["こんにちは。", "元気", "ですか"]))
+
+        # Assert
+        assert chunks == ["こんにちは。", "元気", "ですか"]
+        spoken = [c.args[0] for c in mock_tts.speak.call_args_list]
+        assert spoken == ["こんにちは。", "元気ですか"]
+        assert speech.first_audio_at is not None
+
+    def test_speaks_first_sentence_while_generation_continues(self) -> None:
+        """最初の文は残りの生成を待たずに読み上げを始める."""
+        # Arrange
+        started = threading.Event()
+        mock_tts = MagicMock()
+        mock_tts.speak.side_effect = lambda _: started.set()
+
+        # Act & Assert
+        with SpeechPipeline(mock_tts) as speech:
+            speech.feed("こんにちは。")
+            speech.feed("続")
+            assert started.wait(timeout=1)
+
+    def test_discards_pending_sentences_on_error(self) -> None:
+        """ブロック内で例外が発生した場合、区切りの来ていない残りは読み上げない."""
+        # Arrange
+        mock_tts = MagicMock()
+
+        # Act
+        with pytest.raises(RuntimeError), SpeechPipeline(mock_tts) as speech:
+            speech.feed("途中まで")
+            raise RuntimeError("LLM error")
+
+        # Assert
+        mock_tts.speak.assert_not_called()
+
+    def test_reraises_tts_error_in_caller(self) -> None:
+        """読み上げの失敗は呼び出し元のスレッドで送出する."""
+        # Arrange
+        mock_tts = MagicMock()
+        mock_tts.speak.side_effect = OSError("audio device")
+
+        # Act & Assert
+        with (
+            pytest.raises(OSError, match="audio device"),
+            SpeechPipeline(mock_tts) as s,
+        ):
+            s.feed("こんにちは。次")
+
+    def test_cancel_drops_pending_sentences_and_stops_tts(self) -> None:
+        """cancelで未着手の文を取り消し、TTSの読み上げを止める."""
+        # Arrange
+        mock_tts = MagicMock()
+
+        # Act
+        with SpeechPipeline(mock_tts) as speech:
+            speech.cancel()
+            speech.feed("こんにちは。元気ですか？")
+
+        # Assert
+        mock_tts.cancel.assert_called_once()
+        mock_tts.speak.assert_not_called()
+        assert speech.spoken_text == ""
+
+    def test_cancel_after_exit_started_does_not_hang(self) -> None:
+        """ブロックを抜けて完了を待っている間にcancelしても、ワーカーが終了する."""
+        # Arrange
+        mock_tts = MagicMock()
+        speech = SpeechPipeline(mock_tts)
+
+        def speak(_: str) -> None:
+            # 読み上げ中に、ブロックを抜けた後の割り込みで取り消される
+            threading.Event().wait(timeout=0.1)
+            speech.cancel()
+
+        mock_tts.speak.side_effect = speak
+
+        def run() -> None:
+            with speech:
+                speech.feed("一文目。二文目。三文目")
+
+        # Act
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=2)
+
+        # Assert
+        assert not thread.is_alive()
+        mock_tts.speak.assert_called_once_with("一文目。")
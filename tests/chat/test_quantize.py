@@ -0,0 +1,99 @@
+"""Whisperモデルのint8動的量子化モジュールのテスト."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import torch
+from whisper.model import ModelDimensions, Whisper
+
+from voivoi.chat.stt.quantize import load_quantized_model, quantize_model
+
+
+def _tiny_model() -> Whisper:
+    """テスト用の小さなWhisperモデルを作る（重みはランダム）."""
+    dims = ModelDimensions(
+        n_mels=80,
+        n_audio_ctx=16,
+        n_audio_state=32,
+        n_audio_head=2,
+        n_audio_layer=1,
+        n_vocab=64,
+        n_text_ctx=8,
+        n_text_state=32,
+        n_text_head=2,
+        n_text_layer=1,
+    )
+    return Whisper(dims).eval()
+
+
+class TestQuantizeModel:
+    """quantize_modelのテスト."""
+
+    def test_replaces_linear_layers_with_int8_dynamic_linear(self) -> None:
+        """Linear層をint8の動的量子化Linearに置き換える."""
+        # Act
+        model = quantize_model(_tiny_model())
+
+        # Assert
+        linears = [m for m in model.modules() if isinstance(m, torch.nn.Linear)]
+        quantized = [
+            m
+            for m in model.modules()
+            if isinstance(m, torch.ao.nn.quantized.dynamic.Linear)
+        ]
+        assert linears == []
+        assert len(quantized) > 0
+        assert all(m.weight().dtype == torch.qint8 for m in quantized)
+
+    def test_quantized_model_runs_encoder(self) -> None:
+        """量子化後もエンコーダーで推論できる."""
+        # Arrange
+        model = quantize_model(_tiny_model())
+        mel = torch.zeros(1, 80, 32)
+
+        # Act
+        features = model.embed_audio(mel)
+
+        # Assert
+        assert features.shape == (1, 16, 32)
+
+
+class TestLoadQuantizedModel:
+    """load_quantized_modelのテスト."""
+
+    @patch("voivoi.chat.stt.quantize.whisper")
+    def test_caches_quantized_model_for_later_loads(
+        self, mock_whisper: MagicMock, tmp_path: Path
+    ) -> None:
+        """量子化したモデルを保存し、2回目以降は変換せずに読み込む."""
+        # Arrange
+        mock_whisper.load_model.side_effect = lambda *_, **__: _tiny_model()
+
+        # Act
+        load_quantized_model("tiny", tmp_path)
+        cached = load_quantized_model("tiny", tmp_path)
+
+        # Assert
+        mock_whisper.load_model.assert_called_once_with("tiny", device="cpu")
+        assert len(list(tmp_path.glob("tiny-int8-*.pt"))) == 1
+        assert any(
+            isinstance(m, torch.ao.nn.quantized.dynamic.Linear)
+            for m in cached.modules()
+        )
+
+    @patch("voivoi.chat.stt.quantize.whisper")
+    def test_rebuilds_unreadable_cache(
+        self, mock_whisper: MagicMock, tmp_path: Path
+    ) -> None:
+        """キャッシュが壊れている場合は量子化し直す."""
+        # Arrange
+        mock_whisper.load_model.side_effect = lambda *_, **__: _tiny_model()
+        cache_path = tmp_path / f"tiny-int8-torch{torch.__version__}.pt"
+        cache_path.write_bytes(b"broken")
+
+        # Act
+        load_quantized_model("tiny", tmp_path)
+
+        # Assert
+        mock_whisper.load_model.assert_called_once()
+        assert cache_path.stat().st_size > len(b"broken")
@@ -0,0 +1,85 @@
+"""リングバッファモジュールのテスト."""
+
+import threading
+
+import pytest
+
+from voivoi.chat.audio.ring import FrameRingBuffer
+
+
+class TestFrameRingBuffer:
+    """FrameRingBufferのテスト."""
+
+    def test_pops_frames_in_fifo_order(self) -> None:
+        """書き込んだ順にフレームを読み出す."""
+        # Arrange
+        ring = FrameRingBuffer(capacity=3, frame_bytes=2)
+
+        # Act
+        ring.push(b"a1")
+        ring.push(b"b2")
+
+        # Assert
+        assert ring.pop() == b"a1"
+        assert ring.pop() == b"b2"
+        assert len(ring) == 0
+
+    def test_wraps_around_capacity(self) -> None:
+        """容量を超えて読み書きしても順序を保つ."""
+        # Arrange
+        ring = FrameRingBuffer(capacity=2, frame_bytes=1)
+
+        # Act
+        popped = []
+        for frame in (b"a", b"b", b"c", b"d", b"e"):
+            ring.push(frame)
+            popped.append(ring.pop())
+
+        # Assert
+        assert popped == [b"a", b"b", b"c", b"d", b"e"]
+
+    def test_drops_new_frames_and_counts_when_full(self) -> None:
+        """満杯のときは新しいフレームを破棄し、件数を記録する."""
+        # Arrange
+        ring = FrameRingBuffer(capacity=2, frame_bytes=1)
+
+        # Act
+        results = [ring.push(frame) for frame in (b"a", b"b", b"c")]
+
+        # Assert
+        assert results == [True, True, False]
+        assert ring.dropped_count == 1
+        assert ring.written_count == 2
+        assert ring.pop() == b"a"
+        assert ring.pop() == b"b"
+
+    def test_pop_returns_none_on_timeout(self) -> None:
+        """タイムアウトまでにフレームが届かなければNoneを返す."""
+        # Arrange
+        ring = FrameRingBuffer(capacity=2, frame_bytes=1)
+
+        # Act & Assert
+        assert ring.pop(timeout=0.01) is None
+
+    def test_pop_waits_for_frame_from_another_thread(self) -> None:
+        """別スレッドから書き込まれたフレームを待って読み出す."""
+        # Arrange
+        ring = FrameRingBuffer(capacity=2, frame_bytes=1)
+        timer = threading.Timer(0.01, ring.push, args=(b"x",))
+
+        # Act
+        timer.start()
+        frame = ring.pop(timeout=5.0)
+        timer.join()
+
+        # Assert
+        assert frame == b"x"
+
+    def test_push_rejects_frame_of_wrong_size(self) -> None:
+        """フレームサイズが異なる場合はエラー."""
+        # Arrange
+        ring = FrameRingBuffer(capacity=2, frame_bytes=2)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="frame"):
+            ring.push(b"abc")
@@ -0,0 +1,203 @@
+"""RoutingLLM（小さいモデルと大きいモデルの振り分け）モジュールのテスト."""
+
+import threading
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from voivoi.chat.llm.adapter import OllamaAdapter
+from voivoi.chat.llm.port import LLMConnectionError, LLMMessage, LLMStream, LLMUsage
+from voivoi.chat.llm.router import RouteLatency, RoutingLLM, _to_latency
+
+
+def _llm(*chunks: str) -> MagicMock:
+    """指定した断片を返すLLMのモックを作る."""
+    llm = MagicMock(spec=OllamaAdapter)
+    llm.stream.side_effect = lambda messages: LLMStream(iter(chunks))
+    return llm
+
+
+def _failing_llm() -> MagicMock:
+    """ストリーミングの開始時に接続エラーになるLLMのモックを作る."""
+
+    def failing(_: list[LLMMessage]) -> Iterator[str]:
+        raise LLMConnectionError("connection refused")
+        yield ""
+
+    llm = MagicMock(spec=OllamaAdapter)
+    llm.stream.side_effect = lambda messages: LLMStream(failing(messages))
+    return llm
+
+
+def _messages(text: str) -> list[LLMMessage]:
+    """ユーザーの発話1件のメッセージリストを作る."""
+    return [LLMMessage(role="user", content=text)]
+
+
+class TestRoutingLLM:
+    """RoutingLLMのテスト."""
+
+    def test_short_utterance_goes_to_fast_model(self) -> None:
+        """max_fast_chars以下の発話は小さいモデルで応答する."""
+        # Arrange
+        primary = _llm("大きいモデル")
+        fast = _llm("小さいモデル")
+        router = RoutingLLM(primary=primary, fast=fast, max_fast_chars=5)
+
+        # Act
+        response = "".join(router.stream(_messages("こんにちは")))
+
+        # Assert
+        assert response == "小さいモデル"
+        primary.stream.assert_not_called()
+        [latency] = router.latencies
+        assert latency.route == "fast"
+        assert latency.count == 1
+
+    def test_long_utterance_goes_to_primary_model(self) -> None:
+        """max_fast_charsを超える発話は大きいモデルで応答する."""
+        # Arrange
+        primary = _llm("大きいモデル")
+        fast = _llm("小さいモデル")
+        router = RoutingLLM(primary=primary, fast=fast, max_fast_chars=5)
+
+        # Act
+        response = "".join(router.stream(_messages("明日の天気を教えてください")))
+
+        # Assert
+        assert response == "大きいモデル"
+        fast.stream.assert_not_called()
+        assert [latency.route for latency in router.latencies] == ["primary"]
+
+    def test_hedges_to_fast_model_when_primary_is_slow(self) -> None:
+        """大きいモデルが期限内に答えなければ小さいモデルにも送り、先に答えた方を使う."""
+        # Arrange
+        release = threading.Event()
+        closed = threading.Event()
+
+        def slow(_: list[LLMMessage]) -> Iterator[str]:
+            try:
+                release.wait(timeout=1)
+                yield "大きいモデル"
+            finally:
+                closed.set()
+
+        primary = MagicMock(spec=OllamaAdapter)
+        primary.stream.side_effect = lambda messages: LLMStream(slow(messages))
+        fast = _llm("小さい", "モデル")
+        router = RoutingLLM(
+            primary=primary, fast=fast, max_fast_chars=0, hedge_after_ms=10
+        )
+
+        # Act
+        response = "".join(router.stream(_messages("明日の天気は？")))
+        release.set()
+
+        # Assert
+        assert response == "小さいモデル"
+        assert [latency.route for latency in router.latencies] == ["hedge"]
+        # 大きいモデルのストリームは取り消され、次の断片で閉じられる
+        assert closed.wait(timeout=1)
+
+    def test_does_not_hedge_when_primary_answers_in_time(self) -> None:
+        """大きいモデルが期限内に答えれば小さいモデルには送らない."""
+        # Arrange
+        primary = _llm("大きいモデル")
+        fast = _llm("小さいモデル")
+        router = RoutingLLM(
+            primary=primary, fast=fast, max_fast_chars=0, hedge_after_ms=1000
+        )
+
+        # Act
+        response = "".join(router.stream(_messages("明日の天気は？")))
+
+        # Assert
+        assert response == "大きいモデル"
+        fast.stream.assert_not_called()
+
+    def test_falls_back_to_fast_model_when_primary_fails(self) -> None:
+        """大きいモデルが失敗した場合は期限を待たずに小さいモデルで応答する."""
+        # Arrange
+        router = RoutingLLM(
+            primary=_failing_llm(),
+            fast=_llm("小さいモデル"),
+            max_fast_chars=0,
+            hedge_after_ms=10_000,
+        )
+
+        # Act
+        response = "".join(router.stream(_messages("明日の天気は？")))
+
+        # Assert
+        assert response == "小さいモデル"
+
+    def test_raises_when_both_models_fail(self) -> None:
+        """両方のモデルが失敗した場合はエラーを送出する."""
+        # Arrange
+        router = RoutingLLM(
+            primary=_failing_llm(),
+            fast=_failing_llm(),
+            max_fast_chars=0,
+            hedge_after_ms=10,
+        )
+
+        # Act & Assert
+        with pytest.raises(LLMConnectionError):
+            list(router.stream(_messages("明日の天気は？")))
+
+    def test_cancel_is_forwarded_to_model_stream(self) -> None:
+        """取り消すと、最初の断片を待たずにモデルのストリームを取り消す."""
+        # Arrange
+        primary = MagicMock(spec=OllamaAdapter)
+        inner = LLMStream(iter(["大きいモデル"]))
+        primary.stream.return_value = inner
+        router = RoutingLLM(
+            primary=primary, fast=_llm("小さいモデル"), max_fast_chars=0
+        )
+
+        # Act
+        stream = router.stream(_messages("明日の天気は？"))
+        stream.cancel()
+
+        # Assert
+        assert inner.cancelled is True
+        assert list(stream) == []
+
+    def test_reports_usage_of_answering_model_and_unloads_both(self) -> None:
+        """応答したモデルのプロンプト評価量を返し、終了時は両方をアンロードする."""
+        # Arrange
+        primary = _llm("大きいモデル")
+        fast = _llm("小さいモデル")
+        fast.last_usage = LLMUsage(prompt_tokens=8, prefill_ms=12.0)
+        router = RoutingLLM(primary=primary, fast=fast, max_fast_chars=5)
+
+        # Act
+        list(router.stream(_messages("はい")))
+        router.unload()
+
+        # Assert
+        assert router.last_usage == LLMUsage(prompt_tokens=8, prefill_ms=12.0)
+        primary.unload.assert_called_once()
+        fast.unload.assert_called_once()
+
+
+class TestToLatency:
+    """_to_latencyのテスト."""
+
+    def test_computes_percentiles(self) -> None:
+        """最初のトークンまでの時間の百分位数を求める."""
+        # Act
+        latency = _to_latency("primary", [float(ms) for ms in range(100, 1100, 10)])
+
+        # Assert
+        assert latency == RouteLatency(
+            route="primary", count=100, p50_ms=595.0, p90_ms=991.0, p99_ms=1080.1
+        )
+
+    def test_single_sample_is_every_percentile(self) -> None:
+        """記録が1件なら、その値をすべての百分位数とする."""
+        # Act & Assert
+        assert _to_latency("fast", [250.0]) == RouteLatency(
+            route="fast", count=1, p50_ms=250.0, p90_ms=250.0, p99_ms=250.0
+        )
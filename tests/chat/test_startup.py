@@ -0,0 +1,91 @@
+"""起動時のコンポーネント読み込みモジュールのテスト."""
+
+import threading
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+from voivoi.chat.llm.port import LLMPort, LLMStream
+from voivoi.chat.startup import BackgroundLoader, DeferredLLM, DeferredSTT, DeferredTTS
+from voivoi.chat.stt.port import STTPort, TranscribeResult
+from voivoi.chat.tts.port import TTSPort
+
+
+class TestBackgroundLoader:
+    """BackgroundLoaderのテスト."""
+
+    def test_submit_returns_future_of_component(self) -> None:
+        """初期化したコンポーネントをFutureで返す."""
+        # Arrange
+        loader = BackgroundLoader()
+
+        # Act
+        future = loader.submit("STT", lambda: "component")
+
+        # Assert
+        assert future.result(timeout=1) == "component"
+        loader.shutdown()
+
+    def test_loads_components_concurrently(self) -> None:
+        """複数のコンポーネントを並行して初期化する."""
+        # Arrange
+        loader = BackgroundLoader(max_workers=2)
+        barrier = threading.Barrier(2, timeout=1)
+
+        # Act
+        # 並行に実行されなければBarrierがタイムアウトする
+        first = loader.submit("STT", barrier.wait)
+        second = loader.submit("LLM", barrier.wait)
+
+        # Assert
+        assert {first.result(timeout=2), second.result(timeout=2)} == {0, 1}
+        loader.shutdown()
+
+    def test_reports_timing_of_each_component(self) -> None:
+        """コンポーネントごとの初期化時間を記録して通知する."""
+        # Arrange
+        reported: list[str] = []
+        loader = BackgroundLoader(on_loaded=lambda name, _: reported.append(name))
+
+        # Act
+        loader.submit("STT", lambda: None)
+        loader.submit("TTS", lambda: None)
+        loader.shutdown()
+
+        # Assert
+        assert sorted(reported) == ["STT", "TTS"]
+        assert set(loader.timings) == {"STT", "TTS"}
+        assert all(seconds >= 0 for seconds in loader.timings.values())
+
+
+class TestDeferredComponents:
+    """初期化中のコンポーネントを包むクラスのテスト."""
+
+    def test_deferred_components_delegate_after_loading(self) -> None:
+        """初期化の完了後に実体へ処理を委譲する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        mock_llm = MagicMock()
+        mock_llm.stream.return_value = LLMStream(iter(["こんにちは", "！"]))
+        mock_tts = MagicMock()
+        stt_future: Future[STTPort] = Future()
+        llm_future: Future[LLMPort] = Future()
+        tts_future: Future[TTSPort] = Future()
+        stt_future.set_result(mock_stt)
+        llm_future.set_result(mock_llm)
+        tts_future.set_result(mock_tts)
+        stt = DeferredSTT(stt_future)
+        llm = DeferredLLM(llm_future)
+        tts = DeferredTTS(tts_future)
+
+        # Act
+        text = stt.transcribe(b"audio").text
+        response = "".join(llm.stream([]))
+        tts.speak(response)
+
+        # Assert
+        assert text == "こんにちは"
+        assert response == "こんにちは！"
+        mock_tts.speak.assert_called_once_with("こんにちは！")
@@ -0,0 +1,209 @@
+"""StreamingTranscriber（逐次文字起こし）モジュールのテスト."""
+
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from unittest.mock import MagicMock
+
+import pytest
+
+from voivoi.chat.stt.port import SilentAudioError, TranscribeResult, TranscribeSegment
+from voivoi.chat.stt.streaming import StreamingTranscriber
+
+# 16kHz・16-bitで1秒分のチャンク
+ONE_SECOND = b"\x01\x00" * 16000
+
+
+class _ImmediateExecutor(Executor):
+    """submitした処理をその場で実行するExecutor（例外はsubmitから送出される）."""
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., object], /, *args: object, **kwargs: object
+    ) -> Future[object]:
+        future: Future[object] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _result(*segments: tuple[float, float, str]) -> TranscribeResult:
+    """セグメントから文字起こし結果を作る."""
+    return TranscribeResult(
+        text="".join(text for _, _, text in segments).strip(),
+        no_speech_prob=0.1,
+        segments=tuple(
+            TranscribeSegment(start, end, text) for start, end, text in segments
+        ),
+    )
+
+
+class TestStreamingTranscriber:
+    """StreamingTranscriberのテスト."""
+
+    def test_does_not_decode_until_step_of_audio_arrives(self) -> None:
+        """step_ms分の音声が溜まるまでは再認識しない."""
+        # Arrange
+        mock_stt = MagicMock()
+        stream = StreamingTranscriber(
+            stt=mock_stt, executor=_ImmediateExecutor(), step_ms=1000
+        )
+
+        # Act
+        stream.feed(ONE_SECOND[: len(ONE_SECOND) // 2])
+
+        # Assert
+        mock_stt.transcribe.assert_not_called()
+
+    def test_commits_segments_that_agree_across_two_decodes(self) -> None:
+        """連続する2回の認識で一致したセグメントを確定する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            _result((0.0, 0.8, "今日は"), (0.8, 1.0, "い")),
+            _result((0.0, 0.8, "今日は"), (0.8, 1.6, "いい天気"), (1.6, 2.0, "で")),
+        ]
+        partials: list[str] = []
+        stream = StreamingTranscriber(
+            stt=mock_stt,
+            executor=_ImmediateExecutor(),
+            step_ms=1000,
+            on_partial=partials.append,
+        )
+
+        # Act
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+
+        # Assert
+        assert stream.committed_text == "今日は"
+        assert partials == ["今日は"]
+
+    def test_reports_hypothesis_including_uncommitted_segments(self) -> None:
+        """再認識のたびに、確定済みと未確定を合わせた認識結果を通知する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            _result((0.0, 0.8, "今日は"), (0.8, 1.0, "い")),
+            _result((0.0, 0.8, "今日は"), (0.8, 1.6, "いい天気")),
+            _result((0.0, 0.8, "いい天気"), (0.8, 1.2, "ですね")),
+        ]
+        hypotheses: list[str] = []
+        stream = StreamingTranscriber(
+            stt=mock_stt,
+            executor=_ImmediateExecutor(),
+            step_ms=1000,
+            on_hypothesis=hypotheses.append,
+        )
+
+        # Act
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+
+        # Assert
+        assert hypotheses == ["今日はい", "今日はいい天気", "今日はいい天気ですね"]
+
+    def test_does_not_commit_last_segment(self) -> None:
+        """最後のセグメントは一致しても確定しない（発話途中の可能性があるため）."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            _result((0.0, 1.0, "今日は")),
+            _result((0.0, 1.0, "今日は")),
+        ]
+        stream = StreamingTranscriber(
+            stt=mock_stt, executor=_ImmediateExecutor(), step_ms=1000
+        )
+
+        # Act
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+
+        # Assert
+        assert stream.committed_text == ""
+
+    def test_commits_all_but_last_segment_when_window_exceeds_limit(self) -> None:
+        """未確定部分が上限を超えたら、一致を待たずに最後以外のセグメントを確定する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            _result((0.0, 1.0, "今日は"), (1.0, 1.5, "いい天気")),
+            _result((0.0, 1.0, "いい天気ですね")),
+        ]
+        stream = StreamingTranscriber(
+            stt=mock_stt,
+            executor=_ImmediateExecutor(),
+            step_ms=2000,
+            max_window_ms=2000,
+        )
+
+        # Act
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+        result = stream.finish()
+
+        # Assert（最後のセグメントの音声は次の窓との重なりとして残る）
+        assert result.text == "今日はいい天気ですね"
+        tail = mock_stt.transcribe.call_args.args[0]
+        assert len(tail) == len(ONE_SECOND)
+
+    def test_drops_silent_window_that_exceeds_limit(self) -> None:
+        """上限を超えた窓が無音なら、その音声を保持し続けない."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            SilentAudioError("無音"),
+            _result((0.0, 1.0, "こんにちは")),
+        ]
+        stream = StreamingTranscriber(
+            stt=mock_stt,
+            executor=_ImmediateExecutor(),
+            step_ms=2000,
+            max_window_ms=2000,
+        )
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+
+        # Act
+        result = stream.finish()
+
+        # Assert
+        assert result.text == "こんにちは"
+        tail = mock_stt.transcribe.call_args.args[0]
+        assert len(tail) == len(ONE_SECOND)
+
+    def test_finish_transcribes_only_uncommitted_tail(self) -> None:
+        """発話終了時は確定済みの区間を除いた末尾だけを認識する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            _result((0.0, 0.5, "今日は"), (0.5, 1.0, "い")),
+            _result((0.0, 0.5, "今日は"), (0.5, 2.0, "いい天気")),
+            _result((0.0, 1.5, "いい天気ですね")),
+        ]
+        stream = StreamingTranscriber(
+            stt=mock_stt, executor=_ImmediateExecutor(), step_ms=1000
+        )
+        stream.feed(ONE_SECOND)
+        stream.feed(ONE_SECOND)
+
+        # Act
+        result = stream.finish()
+
+        # Assert
+        assert result.text == "今日はいい天気ですね"
+        tail = mock_stt.transcribe.call_args.args[0]
+        assert len(tail) == len(ONE_SECOND) * 2 - len(ONE_SECOND) // 2
+
+    def test_finish_raises_silent_audio_error_when_nothing_recognized(self) -> None:
+        """何も認識できなかった場合はSilentAudioErrorを送出する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = SilentAudioError("無音")
+        stream = StreamingTranscriber(
+            stt=mock_stt, executor=_ImmediateExecutor(), step_ms=1000
+        )
+        stream.feed(ONE_SECOND)
+
+        # Act & Assert
+        with pytest.raises(SilentAudioError):
+            stream.finish()
@@ -1,12 +1,21 @@
 """STTモジュールのテスト."""
 
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from voivoi.chat.stt.adapter import WhisperAdapter
-from voivoi.chat.stt.port import SilentAudioError, TranscribeResult
+from voivoi.chat.stt.faster_adapter import FasterWhisperAdapter
+from voivoi.chat.stt.port import (
+    DecodingOptions,
+    SilentAudioError,
+    TranscribeResult,
+    TranscribeSegment,
+)
 
 
 class TestWhisperAdapter:
@@ -73,6 +82,182 @@ class TestWhisperAdapter:
         # Assert
         assert result.text == "テスト"
 
+    @patch("voivoi.chat.stt.adapter.whisper")
+    def test_transcribe_passes_pcm_bytes_as_float32_array(
+        self, mock_whisper: MagicMock
+    ) -> None:
+        """PCMのバイト列はファイルを介さずfloat32配列として渡す."""
+        # Arrange
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = {
+            "text": "こんにちは",
+            "segments": [{"no_speech_prob": 0.1}],
+        }
+        mock_whisper.load_model.return_value = mock_model
+        stt = WhisperAdapter()
+        pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+
+        # Act
+        stt.transcribe(pcm)
+
+        # Assert
+        audio = mock_model.transcribe.call_args.args[0]
+        assert audio.dtype == np.float32
+        assert audio.tolist() == [0.0, 0.5, -1.0]
+
+    @patch("voivoi.chat.stt.adapter.whisper")
+    def test_transcribe_returns_segments_with_timestamps(
+        self, mock_whisper: MagicMock
+    ) -> None:
+        """セグメントごとの時刻とテキストを返す."""
+        # Arrange
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = {
+            "text": "今日はいい天気",
+            "segments": [
+                {"no_speech_prob": 0.1, "start": 0.0, "end": 0.8, "text": "今日は"},
+                {"no_speech_prob": 0.1, "start": 0.8, "end": 1.6, "text": "いい天気"},
+            ],
+        }
+        mock_whisper.load_model.return_value = mock_model
+        stt = WhisperAdapter()
+
+        # Act
+        result = stt.transcribe(Path("/tmp/test.wav"))
+
+        # Assert
+        assert result.segments == (
+            TranscribeSegment(start=0.0, end=0.8, text="今日は"),
+            TranscribeSegment(start=0.8, end=1.6, text="いい天気"),
+        )
+
+    @patch("voivoi.chat.stt.quantize.load_quantized_model")
+    @patch("voivoi.chat.stt.adapter.whisper")
+    def test_loads_quantized_model_when_quantize_enabled(
+        self, mock_whisper: MagicMock, mock_load_quantized: MagicMock
+    ) -> None:
+        """quantizeを指定した場合、int8量子化済みのモデルを読み込む."""
+        # Act
+        WhisperAdapter(model_name="small", quantize=True, cache_dir=Path("/tmp/q"))
+
+        # Assert
+        mock_load_quantized.assert_called_once_with("small", Path("/tmp/q"))
+        mock_whisper.load_model.assert_not_called()
+
+    @patch("voivoi.chat.stt.adapter.whisper")
+    def test_transcribe_applies_decoding_options(self, mock_whisper: MagicMock) -> None:
+        """デコード設定をWhisperの引数に変換して渡す（beam_size=1は貪欲法）."""
+        # Arrange
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = {
+            "text": "こんにちは",
+            "segments": [{"no_speech_prob": 0.1}],
+        }
+        mock_whisper.load_model.return_value = mock_model
+        decoding = DecodingOptions(
+            beam_size=1,
+            best_of=1,
+            temperatures=(0.0,),
+            condition_on_previous_text=False,
+        )
+        stt = WhisperAdapter(decoding=decoding)
+
+        # Act
+        stt.transcribe(Path("/tmp/test.wav"))
+
+        # Assert
+        kwargs = mock_model.transcribe.call_args.kwargs
+        assert kwargs["beam_size"] is None
+        assert kwargs["temperature"] == (0.0,)
+        assert kwargs["condition_on_previous_text"] is False
+
+    @patch("voivoi.chat.stt.adapter.DecodeGuard")
+    @patch("voivoi.chat.stt.adapter.get_tokenizer")
+    @patch("voivoi.chat.stt.adapter.whisper")
+    def test_transcribe_returns_partial_text_when_decode_is_aborted(
+        self,
+        mock_whisper: MagicMock,
+        mock_get_tokenizer: MagicMock,
+        mock_guard_class: MagicMock,
+    ) -> None:
+        """暴走デコードを打ち切った場合、生成済みのテキストをtruncatedとして返す."""
+        # Arrange
+        from voivoi.chat.stt.guard import DecodeAbortedError
+
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = DecodeAbortedError("repetition detected")
+        mock_whisper.load_model.return_value = mock_model
+        mock_guard_class.return_value.partial_text = "ありがとうございます。"
+        decoding = DecodingOptions(max_tokens_per_second=15.0, max_decode_seconds=5.0)
+        stt = WhisperAdapter(decoding=decoding)
+
+        # Act（4秒の発話）
+        result = stt.transcribe(np.zeros(4 * 16000, dtype=np.int16).tobytes())
+
+        # Assert
+        assert result.text == "ありがとうございます。"
+        assert result.truncated is True
+        kwargs = mock_guard_class.call_args.kwargs
+        assert kwargs["max_tokens"] == 60
+        assert kwargs["max_seconds"] == 5.0
+
+    @patch("voivoi.chat.stt.adapter.DecodeGuard")
+    @patch("voivoi.chat.stt.adapter.get_tokenizer")
+    @patch("voivoi.chat.stt.adapter.whisper")
+    def test_transcribe_raises_when_aborted_decode_has_no_text(
+        self,
+        mock_whisper: MagicMock,
+        mock_get_tokenizer: MagicMock,
+        mock_guard_class: MagicMock,
+    ) -> None:
+        """打ち切るまでにテキストを生成していない場合、SilentAudioErrorを送出する."""
+        # Arrange
+        from voivoi.chat.stt.guard import DecodeAbortedError
+
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = DecodeAbortedError("time limit exceeded")
+        mock_whisper.load_model.return_value = mock_model
+        mock_guard_class.return_value.partial_text = ""
+        stt = WhisperAdapter(decoding=DecodingOptions(max_decode_seconds=5.0))
+
+        # Act & Assert
+        with pytest.raises(SilentAudioError):
+            stt.transcribe(Path("/tmp/test.wav"))
+
+    @patch("voivoi.chat.stt.adapter.whisper.load_model")
+    def test_no_speech_prob_runs_single_decoder_step(
+        self, mock_load_model: MagicMock
+    ) -> None:
+        """エンコーダーとデコーダー1ステップで無音確率（0〜1）を返す."""
+        # Arrange
+        import torch
+        from whisper.model import ModelDimensions, Whisper
+
+        dims = ModelDimensions(
+            n_mels=80,
+            n_audio_ctx=1500,
+            n_audio_state=32,
+            n_audio_head=2,
+            n_audio_layer=1,
+            n_vocab=51865,
+            n_text_ctx=8,
+            n_text_state=32,
+            n_text_head=2,
+            n_text_layer=1,
+        )
+        model = Whisper(dims).eval()
+        # 未初期化のパラメーター（位置埋め込み）を含むため、乱数で埋める
+        for parameter in model.parameters():
+            torch.nn.init.normal_(parameter, std=0.02)
+        mock_load_model.return_value = model
+        stt = WhisperAdapter()
+
+        # Act
+        prob = stt.no_speech_prob(np.zeros(16000, dtype=np.int16).tobytes())
+
+        # Assert
+        assert 0.0 <= prob <= 1.0
+
 
 class TestTranscribeResult:
     """TranscribeResultのテスト."""
@@ -128,3 +313,73 @@ class TestSilentAudioError:
         # Act & Assert
         with pytest.raises(SilentAudioError):
             stt.transcribe(audio_path)
+
+
+class TestFasterWhisperAdapter:
+    """FasterWhisperAdapterのテスト."""
+
+    @pytest.fixture
+    def mock_model(self) -> Iterator[MagicMock]:
+        """faster_whisperモジュールを差し替え、WhisperModelのモックを返す."""
+        mock_module = MagicMock()
+        with patch.dict(sys.modules, {"faster_whisper": mock_module}):
+            yield mock_module.WhisperModel.return_value
+
+    def test_loads_model_on_cpu_with_int8(self, mock_model: MagicMock) -> None:
+        """CPU上でint8の計算精度でモデルを読み込む."""
+        # Act
+        FasterWhisperAdapter(model_name="small")
+
+        # Assert
+        whisper_model = sys.modules["faster_whisper"].WhisperModel
+        whisper_model.assert_called_once_with(
+            "small", device="cpu", compute_type="int8", cpu_threads=0
+        )
+
+    def test_transcribe_joins_segments_with_configured_language(
+        self, mock_model: MagicMock
+    ) -> None:
+        """設定された言語で文字起こしし、セグメントを結合したテキストを返す."""
+        # Arrange
+        mock_model.transcribe.return_value = (
+            iter(
+                [
+                    MagicMock(start=0.0, end=0.8, text="今日は", no_speech_prob=0.1),
+                    MagicMock(start=0.8, end=1.6, text="いい天気", no_speech_prob=0.1),
+                ]
+            ),
+            MagicMock(),
+        )
+        stt = FasterWhisperAdapter(language="en")
+        pcm = np.array([0, 16384], dtype=np.int16).tobytes()
+
+        # Act
+        result = stt.transcribe(pcm)
+
+        # Assert
+        assert result.text == "今日はいい天気"
+        assert result.segments[1] == TranscribeSegment(0.8, 1.6, "いい天気")
+        audio = mock_model.transcribe.call_args.args[0]
+        assert audio.dtype == np.float32
+        assert mock_model.transcribe.call_args.kwargs == {"language": "en"}
+
+    def test_transcribe_raises_silent_audio_error_when_no_segments(
+        self, mock_model: MagicMock
+    ) -> None:
+        """セグメントがない場合、SilentAudioErrorを発生させる."""
+        # Arrange
+        mock_model.transcribe.return_value = (iter([]), MagicMock())
+        stt = FasterWhisperAdapter()
+
+        # Act & Assert
+        with pytest.raises(SilentAudioError):
+            stt.transcribe(Path("/tmp/test.wav"))
+
+    def test_raises_import_error_with_install_hint_when_not_installed(self) -> None:
+        """faster-whisperが未インストールの場合、導入方法を示すエラーを発生させる."""
+        # Act & Assert
+        with (
+            patch.dict(sys.modules, {"faster_whisper": None}),
+            pytest.raises(ImportError, match="--extra faster-whisper"),
+        ):
+            FasterWhisperAdapter()
@@ -1,5 +1,7 @@
 """TTSモジュールのテスト."""
 
+import threading
+from collections.abc import Callable
 from unittest.mock import MagicMock, patch
 
 from voivoi.chat.tts.adapter import Pyttsx3Adapter
@@ -22,3 +24,120 @@ class TestPyttsx3Adapter:
         # Assert
         mock_engine.say.assert_called_once_with("こんにちは")
         mock_engine.runAndWait.assert_called_once()
+
+    @patch("voivoi.chat.tts.adapter.pyttsx3")
+    def test_warm_up_initializes_engine_without_speaking(
+        self, mock_pyttsx3: MagicMock
+    ) -> None:
+        """ウォームアップではエンジンを初期化するだけで読み上げない."""
+        # Arrange
+        mock_engine = MagicMock()
+        mock_pyttsx3.init.return_value = mock_engine
+        tts = Pyttsx3Adapter()
+
+        # Act
+        tts.warm_up()
+
+        # Assert
+        mock_pyttsx3.init.assert_called_once()
+        mock_engine.say.assert_not_called()
+
+    @patch("voivoi.chat.tts.adapter.pyttsx3")
+    def test_reuses_engine_across_utterances(self, mock_pyttsx3: MagicMock) -> None:
+        """エンジンを使い回す設定では、読み上げごとに初期化しない."""
+        # Arrange
+        mock_engine = MagicMock()
+        mock_pyttsx3.init.return_value = mock_engine
+        tts = Pyttsx3Adapter(reuse_engine=True)
+
+        # Act
+        tts.warm_up()
+        tts.speak("こんにちは")
+        tts.speak("さようなら")
+
+        # Assert
+        mock_pyttsx3.init.assert_called_once()
+        assert mock_engine.say.call_count == 2
+
+    @patch("voivoi.chat.tts.adapter.pyttsx3")
+    def test_reinitializes_engine_per_utterance_when_not_reused(
+        self, mock_pyttsx3: MagicMock
+    ) -> None:
+        """エンジンを使い回さない設定（macOS）では、読み上げごとに初期化して止める."""
+        # Arrange
+        mock_engine = MagicMock()
+        mock_pyttsx3.init.return_value = mock_engine
+        tts = Pyttsx3Adapter(reuse_engine=False)
+
+        # Act
+        tts.speak("こんにちは")
+        tts.speak("さようなら")
+
+        # Assert
+        assert mock_pyttsx3.init.call_count == 2
+        assert mock_engine.stop.call_count == 2
+
+    @patch("voivoi.chat.tts.adapter.pyttsx3")
+    def test_speak_async_returns_without_waiting_and_notifies_completion(
+        self, mock_pyttsx3: MagicMock
+    ) -> None:
+        """speak_asyncは読み上げを待たずに返り、完了をFutureで通知する."""
+        # Arrange
+        release = threading.Event()
+        mock_engine = MagicMock()
+        mock_engine.runAndWait.side_effect = lambda: release.wait(timeout=1)
+        mock_pyttsx3.init.return_value = mock_engine
+        tts = Pyttsx3Adapter()
+        done = threading.Event()
+
+        # Act
+        future = tts.speak_async("こんにちは")
+        future.add_done_callback(lambda _: done.set())
+
+        # Assert
+        assert not done.is_set()
+        release.set()
+        assert done.wait(timeout=1)
+
+    @patch("voivoi.chat.tts.adapter.pyttsx3")
+    def test_cancel_stops_current_and_drops_pending_utterances(
+        self, mock_pyttsx3: MagicMock
+    ) -> None:
+        """cancelで読み上げ中の音声を止め、予約済みの読み上げを取り消す."""
+        # Arrange
+        speaking = threading.Event()
+        stopped = threading.Event()
+        stopped_on: list[str] = []
+        callbacks: dict[str, Callable[..., None]] = {}
+        mock_engine = MagicMock()
+        mock_engine.connect.side_effect = callbacks.__setitem__
+
+        def run_and_wait() -> None:
+            # 読み上げが止められるまで、単語ごとにstarted-wordを通知する
+            speaking.set()
+            for _ in range(100):
+                if stopped.wait(timeout=0.01):
+                    return
+                callbacks["started-word"]("word", 0, 1)
+
+        def stop() -> None:
+            stopped_on.append(threading.current_thread().name)
+            stopped.set()
+
+        mock_engine.runAndWait.side_effect = run_and_wait
+        mock_engine.stop.side_effect = stop
+        mock_pyttsx3.init.return_value = mock_engine
+        tts = Pyttsx3Adapter(reuse_engine=True)
+        current = tts.speak_async("1つ目")
+        pending = tts.speak_async("2つ目")
+        assert speaking.wait(timeout=1)
+
+        # Act
+        tts.cancel()
+
+        # Assert
+        current.result(timeout=1)
+        assert pending.cancelled()
+        mock_engine.say.assert_called_once_with("1つ目")
+        # エンジンはcancelを呼んだスレッドではなく、ワーカーのコールバックから止める
+        assert stopped_on == ["tts"]
@@ -1,6 +1,15 @@
 """VAD（音声検出）モジュールのテスト."""
 
-from voivoi.chat.audio.vad import ThresholdVAD
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from voivoi.chat.audio.vad import (
+    AdaptiveVAD,
+    SpectralVAD,
+    ThresholdVAD,
+    extract_features,
+)
 
 
 class TestThresholdVAD:
@@ -48,3 +57,196 @@ class TestThresholdVAD:
         # デフォルト閾値は0.02（環境ノイズを考慮した低めの値）
         assert vad.is_speech(0.03) is True
         assert vad.is_speech(0.01) is False
+
+    def test_is_speech_frame_uses_rms_of_samples(self) -> None:
+        """フレームのRMSが閾値を超えたら発話中と判定する."""
+        # Arrange
+        vad = ThresholdVAD(threshold=0.1)
+        loud = np.full(512, 8000, dtype=np.int16)
+        quiet = np.full(512, 100, dtype=np.int16)
+
+        # Act & Assert
+        assert vad.is_speech_frame(loud) is True
+        assert vad.is_speech_frame(quiet) is False
+
+
+SAMPLE_RATE = 16000
+FRAME_SIZE = 512
+
+
+def _voiced(f0: float, n_frames: int = 4) -> NDArray[np.int16]:
+    """倍音を含む有声音に似た信号を作る."""
+    t = np.arange(FRAME_SIZE * n_frames) / SAMPLE_RATE
+    wave = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 15))
+    return (wave / np.abs(wave).max() * 8000).astype(np.int16)
+
+
+def _white_noise(n_frames: int = 4) -> NDArray[np.int16]:
+    """白色雑音を作る."""
+    rng = np.random.default_rng(0)
+    return rng.normal(0, 3000, FRAME_SIZE * n_frames).astype(np.int16)
+
+
+def _hum(n_frames: int = 4) -> NDArray[np.int16]:
+    """60Hzのハム音を作る."""
+    t = np.arange(FRAME_SIZE * n_frames) / SAMPLE_RATE
+    return (8000 * np.sin(2 * np.pi * 60 * t)).astype(np.int16)
+
+
+class TestExtractFeatures:
+    """extract_featuresのテスト."""
+
+    def test_noise_is_flatter_and_crosses_zero_more_than_voice(self) -> None:
+        """雑音は有声音よりスペクトルが平坦で、ゼロ交差率が高い."""
+        # Arrange
+        voice = _voiced(200).reshape(-1, FRAME_SIZE)
+        noise = _white_noise().reshape(-1, FRAME_SIZE)
+
+        # Act
+        voice_features = extract_features(voice)
+        noise_features = extract_features(noise)
+
+        # Assert
+        assert voice_features.flatness.max() < noise_features.flatness.min()
+        assert voice_features.zcr.max() < noise_features.zcr.min()
+        assert voice_features.energy.shape == (4,)
+
+
+class TestSpectralVAD:
+    """SpectralVADのテスト."""
+
+    def test_detects_voiced_signal_as_speech(self) -> None:
+        """有声音を発話と判定する."""
+        # Arrange
+        vad = SpectralVAD()
+
+        # Act & Assert
+        assert vad.is_speech_frame(_voiced(120)[:FRAME_SIZE]) is True
+
+    def test_rejects_loud_broadband_noise(self) -> None:
+        """音量が大きくても広帯域の雑音は発話と判定しない."""
+        # Arrange
+        vad = SpectralVAD()
+
+        # Act & Assert
+        assert vad.is_speech_frame(_white_noise()[:FRAME_SIZE]) is False
+
+    def test_rejects_low_frequency_hum(self) -> None:
+        """ゼロ交差率の低いハム音は発話と判定しない."""
+        # Arrange
+        vad = SpectralVAD()
+
+        # Act & Assert
+        assert vad.is_speech_frame(_hum()[:FRAME_SIZE]) is False
+
+    def test_rejects_quiet_voice_below_energy_threshold(self) -> None:
+        """音量が閾値以下なら有声音でも発話と判定しない."""
+        # Arrange
+        vad = SpectralVAD(energy_threshold=0.5)
+
+        # Act & Assert
+        assert vad.is_speech_frame(_voiced(200)[:FRAME_SIZE]) is False
+
+    def test_detect_classifies_each_frame_of_pcm_bytes(self) -> None:
+        """PCMバイト列をフレームごとに一括判定する."""
+        # Arrange
+        vad = SpectralVAD()
+        silence = np.zeros(FRAME_SIZE * 2, dtype=np.int16)
+        data = np.concatenate([silence, _voiced(200, 2), _white_noise(2)]).tobytes()
+
+        # Act
+        result = vad.detect(data, FRAME_SIZE)
+
+        # Assert
+        assert result.tolist() == [False, False, True, True, False, False]
+
+
+def _noise_frame(amplitude: int) -> NDArray[np.int16]:
+    """指定した振幅の一定音量フレームを作る（32ミリ秒）."""
+    return np.full(FRAME_SIZE, amplitude, dtype=np.int16)
+
+
+class TestAdaptiveVAD:
+    """AdaptiveVADのテスト."""
+
+    def test_does_not_detect_speech_during_calibration(self) -> None:
+        """雑音レベルの推定中は発話と判定しない."""
+        # Arrange
+        vad = AdaptiveVAD(calibration_ms=100)
+
+        # Act
+        results = [vad.is_speech_frame(_noise_frame(20000)) for _ in range(3)]
+
+        # Assert
+        assert results == [False, False, False]
+        assert vad.noise_floor is None
+        assert vad.threshold is None
+
+    def test_sets_threshold_relative_to_calibrated_noise_floor(self) -> None:
+        """推定した雑音レベルにマージンを掛けた値を閾値にする."""
+        # Arrange
+        vad = AdaptiveVAD(calibration_ms=100, margin=3.0, min_threshold=0.0)
+
+        # Act
+        for _ in range(4):  # 128ミリ秒
+            vad.is_speech_frame(_noise_frame(1000))
+
+        # Assert
+        assert vad.is_calibrated is True
+        assert vad.noise_floor == pytest.approx(1000 / 32767)
+        assert vad.threshold == pytest.approx(3000 / 32767)
+        assert vad.is_speech_frame(_noise_frame(4000)) is True
+        assert vad.is_speech_frame(_noise_frame(2000)) is False
+
+    def test_threshold_does_not_fall_below_minimum(self) -> None:
+        """無音の部屋でも閾値は最小値を下回らない."""
+        # Arrange
+        vad = AdaptiveVAD(calibration_ms=32, min_threshold=0.01)
+
+        # Act
+        vad.is_speech_frame(_noise_frame(0))
+
+        # Assert
+        assert vad.threshold == 0.01
+
+    def test_tracks_rising_noise_floor(self) -> None:
+        """雑音が大きくなると閾値も追従して上がる."""
+        # Arrange
+        vad = AdaptiveVAD(
+            calibration_ms=100,
+            tracking_window_ms=320,
+            noise_percentile=10.0,
+            max_speech_ms=160,
+        )
+        for _ in range(4):
+            vad.is_speech_frame(_noise_frame(300))
+        quiet_threshold = vad.threshold
+
+        # Act
+        # 空調が動き始めて雑音が大きくなる（max_speech_msを超えて続き、時間窓を埋める）
+        first = vad.is_speech_frame(_noise_frame(3000))
+        for _ in range(15):
+            last = vad.is_speech_frame(_noise_frame(3000))
+
+        # Assert
+        assert quiet_threshold is not None
+        assert vad.threshold is not None
+        assert vad.threshold > quiet_threshold
+        assert first is True
+        assert last is False
+
+    def test_keeps_detecting_speech_longer_than_tracking_window(self) -> None:
+        """時間窓より長く続く発話でも、雑音レベルが上がらずに発話と判定し続ける."""
+        # Arrange
+        vad = AdaptiveVAD(calibration_ms=100, tracking_window_ms=320)
+        for _ in range(4):
+            vad.is_speech_frame(_noise_frame(300))
+        quiet_threshold = vad.threshold
+
+        # Act
+        # 時間窓（10フレーム）の3倍の長さの途切れない発話
+        results = [vad.is_speech_frame(_noise_frame(3000)) for _ in range(30)]
+
+        # Assert
+        assert all(results)
+        assert vad.threshold == quiet_threshold
@@ -1,19 +1,44 @@
 """ChatOrchestrator（音声チャット統合）モジュールのテスト."""
 
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from voivoi.chat.llm.port import LLMMessage
+from voivoi.chat.llm.adapter import OllamaAdapter
+from voivoi.chat.llm.port import LLMMessage, LLMStream, LLMUsage
 from voivoi.chat.orchestrator import ChatOrchestrator
 from voivoi.chat.stt.port import TranscribeResult
 
+# 割り込みと判定される大きな声（正規化RMS 0.5、16kHzで100ms）
+_LOUD_CHUNK = b"\xff\x3f" * 1600
+# VADは発話とみなすが、割り込みには足りない小さな声（正規化RMS 約0.03）
+_QUIET_CHUNK = b"\xe8\x03" * 1600
+
+
+class _ImmediateExecutor(Executor):
+    """submitした処理をその場で実行するExecutor."""
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., object], /, *args: object, **kwargs: object
+    ) -> Future[object]:
+        future: Future[object] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _speak(voice_chat: ChatOrchestrator, *chunks: bytes) -> None:
+    """リスナーのスレッドからの発話開始と音声チャンクの通知を再現する."""
+    voice_chat.on_speech_start()
+    for chunk in chunks:
+        voice_chat.on_speech_chunk(chunk)
+
 
 class TestChatOrchestrator:
     """ChatOrchestratorのテスト."""
 
-    @patch("voivoi.chat.orchestrator.save_wav")
     def test_process_audio_transcribes_and_generates_response(
-        self, mock_save_wav: MagicMock, tmp_path: Path
+        self,
     ) -> None:
         """音声データを文字起こしし、LLMで応答を生成し、音声で読み上げる."""
         # Arrange
@@ -24,23 +49,24 @@ class TestChatOrchestrator:
         mock_stt.transcribe.return_value = TranscribeResult(
             text="こんにちは", no_speech_prob=0.1
         )
-        mock_llm.generate.return_value = "こんにちは！何かお手伝いできますか？"
-
-        voice_chat = ChatOrchestrator(
-            stt=mock_stt, llm=mock_llm, tts=mock_tts, temp_dir=tmp_path
+        mock_llm.stream.return_value = LLMStream(
+            iter(["こんにちは！何かお手伝いできますか？"])
         )
 
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=mock_tts)
+
         # Act
         voice_chat.process_audio(b"audio_data")
 
         # Assert
-        mock_stt.transcribe.assert_called_once()
-        mock_llm.generate.assert_called_once()
-        mock_tts.speak.assert_called_once_with("こんにちは！何かお手伝いできますか？")
+        mock_stt.transcribe.assert_called_once_with(b"audio_data")
+        mock_llm.stream.assert_called_once()
+        # 応答は文ごとに読み上げる
+        spoken = [c.args[0] for c in mock_tts.speak.call_args_list]
+        assert spoken == ["こんにちは！", "何かお手伝いできますか？"]
 
-    @patch("voivoi.chat.orchestrator.save_wav")
     def test_process_audio_includes_conversation_history(
-        self, mock_save_wav: MagicMock, tmp_path: Path
+        self,
     ) -> None:
         """会話履歴を含めてLLMに送信する."""
         # Arrange
@@ -52,14 +78,12 @@ class TestChatOrchestrator:
             TranscribeResult(text="こんにちは", no_speech_prob=0.1),
             TranscribeResult(text="今日の天気は？", no_speech_prob=0.1),
         ]
-        mock_llm.generate.side_effect = [
-            "こんにちは！",
-            "今日は晴れです。",
+        mock_llm.stream.side_effect = [
+            LLMStream(iter(["こんにちは！"])),
+            LLMStream(iter(["今日は", "晴れです。"])),
         ]
 
-        voice_chat = ChatOrchestrator(
-            stt=mock_stt, llm=mock_llm, tts=mock_tts, temp_dir=tmp_path
-        )
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=mock_tts)
 
         # Act
         voice_chat.process_audio(b"audio1")
@@ -67,7 +91,7 @@ class TestChatOrchestrator:
 
         # Assert
         # 2回目のLLM呼び出しには会話履歴が含まれる
-        calls = mock_llm.generate.call_args_list
+        calls = mock_llm.stream.call_args_list
         second_call_messages = calls[1][0][0]
         assert len(second_call_messages) == 3  # user, assistant, user
         assert second_call_messages[0] == LLMMessage(role="user", content="こんにちは")
@@ -78,9 +102,8 @@ class TestChatOrchestrator:
             role="user", content="今日の天気は？"
         )
 
-    @patch("voivoi.chat.orchestrator.save_wav")
     def test_process_audio_skips_silent_audio(
-        self, mock_save_wav: MagicMock, tmp_path: Path
+        self,
     ) -> None:
         """無音の場合はLLM呼び出しをスキップする."""
         # Arrange
@@ -92,27 +115,23 @@ class TestChatOrchestrator:
 
         mock_stt.transcribe.side_effect = SilentAudioError("無音")
 
-        voice_chat = ChatOrchestrator(
-            stt=mock_stt, llm=mock_llm, tts=mock_tts, temp_dir=tmp_path
-        )
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=mock_tts)
 
         # Act
         voice_chat.process_audio(b"silent_audio")
 
         # Assert
-        mock_llm.generate.assert_not_called()
+        mock_llm.stream.assert_not_called()
         mock_tts.speak.assert_not_called()
 
-    def test_get_chat_returns_empty_chat_initially(self, tmp_path: Path) -> None:
+    def test_get_chat_returns_empty_chat_initially(self) -> None:
         """会話開始前は空のChatを返す."""
         # Arrange
         mock_stt = MagicMock()
         mock_llm = MagicMock()
         mock_tts = MagicMock()
 
-        voice_chat = ChatOrchestrator(
-            stt=mock_stt, llm=mock_llm, tts=mock_tts, temp_dir=tmp_path
-        )
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=mock_tts)
 
         # Act
         chat = voice_chat.get_chat()
@@ -120,9 +139,8 @@ class TestChatOrchestrator:
         # Assert
         assert chat.messages == []
 
-    @patch("voivoi.chat.orchestrator.save_wav")
     def test_get_chat_returns_conversation_history(
-        self, mock_save_wav: MagicMock, tmp_path: Path
+        self,
     ) -> None:
         """音声入力ごとにユーザー発話とAI応答がChatに追加される."""
         # Arrange
@@ -133,11 +151,9 @@ class TestChatOrchestrator:
         mock_stt.transcribe.return_value = TranscribeResult(
             text="こんにちは", no_speech_prob=0.1
         )
-        mock_llm.generate.return_value = "こんにちは！"
+        mock_llm.stream.return_value = LLMStream(iter(["こんにちは！"]))
 
-        voice_chat = ChatOrchestrator(
-            stt=mock_stt, llm=mock_llm, tts=mock_tts, temp_dir=tmp_path
-        )
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=mock_tts)
 
         # Act
         voice_chat.process_audio(b"audio")
@@ -149,3 +165,439 @@ class TestChatOrchestrator:
         assert chat.messages[0].content == "こんにちは"
         assert chat.messages[1].role == "assistant"
         assert chat.messages[1].content == "こんにちは！"
+
+    @patch("voivoi.chat.orchestrator.save_wav")
+    def test_process_audio_does_not_write_wav_by_default(
+        self, mock_save_wav: MagicMock
+    ) -> None:
+        """デバッグモードでなければWAVファイルを書き出さない."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        mock_llm.stream.return_value = LLMStream(iter(["こんにちは！"]))
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=MagicMock())
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        mock_save_wav.assert_not_called()
+
+    def test_process_audio_saves_unique_wav_per_turn_in_debug_mode(
+        self, tmp_path: Path
+    ) -> None:
+        """デバッグモードでは発話ごとに別名のWAVファイルを保存する."""
+        # Arrange
+        from voivoi.chat.stt.port import SilentAudioError
+
+        mock_stt = MagicMock()
+        mock_stt.transcribe.side_effect = SilentAudioError("無音")
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=MagicMock(), tts=MagicMock(), debug_audio_dir=tmp_path
+        )
+
+        # Act
+        voice_chat.process_audio(b"\x00\x00" * 10)
+        voice_chat.process_audio(b"\x00\x00" * 10)
+
+        # Assert
+        files = sorted(tmp_path.glob("*.wav"))
+        assert len(files) == 2
+        assert all(f.name.startswith(voice_chat.get_chat().id) for f in files)
+
+    def test_streaming_mode_uses_incremental_transcription(self) -> None:
+        """逐次文字起こしモードでは発話中に渡された音声から文字起こしする."""
+        # Arrange
+        from voivoi.chat.stt.port import TranscribeSegment
+
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは",
+            no_speech_prob=0.1,
+            segments=(TranscribeSegment(0.0, 0.5, "こんにちは"),),
+        )
+        mock_llm.stream.return_value = LLMStream(iter(["こんにちは！"]))
+        mock_executor = MagicMock()
+        mock_executor.submit.side_effect = lambda fn, *args: MagicMock(
+            result=MagicMock(return_value=fn(*args))
+        )
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt,
+            llm=mock_llm,
+            tts=MagicMock(),
+            streaming=True,
+            executor=mock_executor,
+        )
+
+        # Act
+        voice_chat.on_speech_start()
+        voice_chat.on_speech_chunk(b"\x01\x00" * 100)
+        voice_chat.on_speech_end(b"full_audio")
+        voice_chat.process_audio(b"full_audio")
+
+        # Assert
+        # 発話全体ではなく、逐次文字起こしに渡された未確定部分を認識する
+        mock_stt.transcribe.assert_called_once_with(b"\x01\x00" * 100)
+        mock_executor.submit.assert_called_once()
+        assert voice_chat.get_chat().messages[0].content == "こんにちは"
+
+    def test_long_utterance_is_transcribed_in_windows_as_one_turn(self) -> None:
+        """長い発話は窓ごとに重ねて文字起こしし、発話終了時に1つのターンにまとめる."""
+        # Arrange
+        from voivoi.chat.stt.port import TranscribeSegment
+
+        one_second = b"\x01\x00" * 16000
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            TranscribeResult(
+                text="今日はいい",
+                no_speech_prob=0.1,
+                segments=(
+                    TranscribeSegment(0.0, 1.5, "今日は"),
+                    TranscribeSegment(1.5, 2.0, "いい"),
+                ),
+            ),
+            TranscribeResult(text="いい天気ですね", no_speech_prob=0.1),
+        ]
+        mock_llm.stream.return_value = LLMStream(iter(["そうですね。"]))
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt,
+            llm=mock_llm,
+            tts=MagicMock(),
+            executor=_ImmediateExecutor(),
+            window_ms=2000,
+        )
+
+        # Act
+        _speak(voice_chat, one_second, one_second, one_second)
+        voice_chat.on_speech_end(one_second)
+        voice_chat.process_audio(one_second)
+
+        # Assert
+        # 2回目は1つ目の窓の最後のセグメント（0.5秒）と続きの1秒を認識する
+        tail = mock_stt.transcribe.call_args.args[0]
+        assert len(tail) == len(one_second) * 3 // 2
+        [user, _] = voice_chat.get_chat().messages
+        assert user.content == "今日はいい天気ですね"
+        mock_llm.stream.assert_called_once()
+
+    def test_process_audio_records_time_to_first_token_and_audio(self) -> None:
+        """ターンごとに最初のトークンと最初の読み上げまでの時間を記録する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        mock_llm.stream.return_value = LLMStream(iter(["こんにちは", "！"]))
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=MagicMock())
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        [metrics] = voice_chat.metrics
+        assert metrics.turn == 1
+        assert metrics.ttft_ms is not None
+        assert metrics.ttft_ms >= 0
+        assert metrics.ttfa_ms is not None
+        assert metrics.ttfa_ms >= metrics.ttft_ms
+
+    def test_process_audio_sends_history_through_context_window(self) -> None:
+        """contextを渡すと予算内に収めた履歴を送り、応答の後に要約を判断させる."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_context = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        mock_llm.stream.return_value = LLMStream(iter(["こんにちは！"]))
+        mock_context.build.return_value = [LLMMessage(role="user", content="要約済み")]
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=mock_llm, tts=MagicMock(), context=mock_context
+        )
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        mock_llm.stream.assert_called_once_with(
+            [LLMMessage(role="user", content="要約済み")]
+        )
+        [messages] = mock_context.compact.call_args.args
+        assert [m.content for m in messages] == ["こんにちは", "こんにちは！"]
+
+    def test_process_audio_records_prefill_reported_by_llm(self) -> None:
+        """LLMが報告したプロンプトの評価量をターンごとに記録する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock(spec=OllamaAdapter)
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        mock_llm.stream.return_value = LLMStream(iter(["こんにちは！"]))
+        mock_llm.last_usage = LLMUsage(prompt_tokens=15, prefill_ms=40.0)
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=MagicMock())
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        [metrics] = voice_chat.metrics
+        assert metrics.prompt_tokens == 15
+        assert metrics.prefill_ms == 40.0
+
+    def test_speech_interrupts_response_when_barge_in_enabled(self) -> None:
+        """応答中に話し始めたら生成と読み上げを中断し、中断された応答として記録する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_tts = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="長い話をして", no_speech_prob=0.1
+        )
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=mock_llm, tts=mock_tts, barge_in=True
+        )
+        closed: list[bool] = []
+
+        def stream(_: list[LLMMessage]) -> Iterator[str]:
+            try:
+                yield "昔々、"
+                # 応答の生成中にユーザーが話し始める（リスナーのスレッドからの通知）
+                _speak(voice_chat, _LOUD_CHUNK, _LOUD_CHUNK)
+                yield "あるところに"
+                yield "おじいさんが"
+            finally:
+                closed.append(True)
+
+        mock_llm.stream.side_effect = lambda messages: LLMStream(stream(messages))
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        mock_tts.cancel.assert_called_once()
+        assert closed == [True]  # 生成を打ち切った
+        assistant = voice_chat.get_chat().messages[-1]
+        assert assistant.role == "assistant"
+        assert assistant.content == "昔々、"
+        assert assistant.interrupted is True
+
+    def test_brief_or_quiet_sound_does_not_interrupt_response(self) -> None:
+        """短い大きな音（咳など）や小さな音（読み上げの回り込みなど）では中断しない."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=mock_llm, tts=MagicMock(), barge_in=True
+        )
+
+        def stream(_: list[LLMMessage]) -> Iterator[str]:
+            yield "こんにちは。"
+            _speak(voice_chat, _LOUD_CHUNK, _QUIET_CHUNK, _LOUD_CHUNK)
+            _speak(voice_chat, *[_QUIET_CHUNK] * 10)
+            yield "元気です。"
+
+        mock_llm.stream.side_effect = lambda messages: LLMStream(stream(messages))
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        assistant = voice_chat.get_chat().messages[-1]
+        assert assistant.content == "こんにちは。元気です。"
+        assert assistant.interrupted is False
+
+    def test_stop_command_is_not_sent_to_llm(self) -> None:
+        """「ストップ」などの音声コマンドはLLMに送らず、会話履歴にも残さない."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="ストップ。", no_speech_prob=0.1
+        )
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=mock_llm, tts=MagicMock(), barge_in=True
+        )
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        mock_llm.stream.assert_not_called()
+        assert voice_chat.get_chat().messages == []
+
+    def test_stop_command_interrupts_response_when_barge_in_disabled(self) -> None:
+        """応答中の発話が途中で「ストップ」と認識されたら、barge_inによらず中断する."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_tts = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.side_effect = [
+            TranscribeResult(text="長い話をして", no_speech_prob=0.1),
+            TranscribeResult(text="ストップ", no_speech_prob=0.1),
+        ]
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=mock_llm, tts=mock_tts, executor=_ImmediateExecutor()
+        )
+
+        def stream(_: list[LLMMessage]) -> Iterator[str]:
+            yield "昔々、"
+            # 1秒分の音声が溜まった時点で途中の認識結果を確かめる
+            _speak(voice_chat, *[_QUIET_CHUNK] * 10)
+            yield "あるところに"
+
+        mock_llm.stream.side_effect = lambda messages: LLMStream(stream(messages))
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        mock_tts.cancel.assert_called_once()
+        assistant = voice_chat.get_chat().messages[-1]
+        assert assistant.content == "昔々、"
+        assert assistant.interrupted is True
+
+    def test_interrupt_cancels_reply_waiting_for_next_chunk(self) -> None:
+        """他スレッドからの中断で生成中のストリームを取り消し、1度目だけTrueを返す."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="長い話をして", no_speech_prob=0.1
+        )
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=MagicMock())
+        results: list[bool] = []
+
+        def stream(_: list[LLMMessage]) -> Iterator[str]:
+            yield "昔々、"
+            # Ctrl+Cなどでメインスレッドから中断される
+            results.append(voice_chat.interrupt())
+            results.append(voice_chat.interrupt())
+            yield "あるところに"
+
+        mock_llm.stream.side_effect = lambda messages: LLMStream(stream(messages))
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        assert results == [True, False]
+        assert voice_chat.interrupt() is False  # ターンの外では何もしない
+        assistant = voice_chat.get_chat().messages[-1]
+        assert assistant.content == "昔々、"
+        assert assistant.interrupted is True
+
+    def test_interrupt_before_llm_skips_response(self) -> None:
+        """文字起こし中に中断された場合は、そのターンでは応答しない."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=mock_llm, tts=MagicMock(), barge_in=True
+        )
+
+        def transcribe(_: bytes) -> TranscribeResult:
+            _speak(voice_chat, _LOUD_CHUNK, _LOUD_CHUNK)
+            return TranscribeResult(text="ええと", no_speech_prob=0.1)
+
+        mock_stt.transcribe.side_effect = transcribe
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        mock_llm.stream.assert_not_called()
+        [message] = voice_chat.get_chat().messages
+        assert message.content == "ええと"
+
+    def test_speech_does_not_interrupt_when_barge_in_disabled(self) -> None:
+        """barge_inが無効なら、話し始めても応答を中断しない."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=MagicMock())
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+
+        def stream(_: list[LLMMessage]) -> Iterator[str]:
+            yield "こんにちは。"
+            _speak(voice_chat, _LOUD_CHUNK, _LOUD_CHUNK)
+            yield "元気です。"
+
+        mock_llm.stream.side_effect = lambda messages: LLMStream(stream(messages))
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        assistant = voice_chat.get_chat().messages[-1]
+        assert assistant.content == "こんにちは。元気です。"
+        assert assistant.interrupted is False
+
+    def test_speech_during_response_is_ignored_when_barge_in_disabled(self) -> None:
+        """barge_inが無効なら、応答中に録音した発話（読み上げの回り込み）は捨てる."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        voice_chat = ChatOrchestrator(stt=mock_stt, llm=mock_llm, tts=MagicMock())
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        ignored: list[bool] = []
+
+        def stream(_: list[LLMMessage]) -> Iterator[str]:
+            yield "こんにちは。"
+            # 読み上げの音声がマイクに回り込み、応答中に発話として検出される
+            _speak(voice_chat, _QUIET_CHUNK)
+            voice_chat.on_speech_end(_QUIET_CHUNK)
+            ignored.append(voice_chat.last_utterance_ignored)
+
+        mock_llm.stream.side_effect = lambda messages: LLMStream(stream(messages))
+
+        # Act
+        voice_chat.process_audio(b"audio")
+        _speak(voice_chat, _QUIET_CHUNK)
+        voice_chat.on_speech_end(_QUIET_CHUNK)
+
+        # Assert
+        assert ignored == [True]
+        assert voice_chat.last_utterance_ignored is False  # 応答の後の発話は捨てない
+
+    def test_speech_during_response_is_kept_when_barge_in_enabled(self) -> None:
+        """barge_inが有効なら、応答中の発話は割り込みとして次のターンにする."""
+        # Arrange
+        mock_stt = MagicMock()
+        mock_llm = MagicMock()
+        voice_chat = ChatOrchestrator(
+            stt=mock_stt, llm=mock_llm, tts=MagicMock(), barge_in=True
+        )
+        mock_stt.transcribe.return_value = TranscribeResult(
+            text="こんにちは", no_speech_prob=0.1
+        )
+        ignored: list[bool] = []
+
+        def stream(_: list[LLMMessage]) -> Iterator[str]:
+            yield "こんにちは。"
+            _speak(voice_chat, _LOUD_CHUNK, _LOUD_CHUNK)
+            voice_chat.on_speech_end(_LOUD_CHUNK * 2)
+            ignored.append(voice_chat.last_utterance_ignored)
+
+        mock_llm.stream.side_effect = lambda messages: LLMStream(stream(messages))
+
+        # Act
+        voice_chat.process_audio(b"audio")
+
+        # Assert
+        assert ignored == [False]
@@ -1,9 +1,11 @@
-"""WAVファイル保存モジュールのテスト."""
+"""WAVファイル読み書きモジュールのテスト."""
 
 import wave
 from pathlib import Path
 
-from voivoi.chat.audio.wav import save_wav
+import pytest
+
+from voivoi.chat.audio.wav import load_wav, save_wav
 
 
 class TestSaveWav:
@@ -25,3 +27,34 @@ class TestSaveWav:
             assert wf.getsampwidth() == 2  # 16-bit
             assert wf.getframerate() == 16000  # Whisper用サンプルレート
             assert wf.readframes(wf.getnframes()) == audio_data
+
+
+class TestLoadWav:
+    """load_wavのテスト."""
+
+    def test_loads_audio_data_saved_by_save_wav(self, tmp_path: Path) -> None:
+        """save_wavで保存した音声データを読み込む."""
+        # Arrange
+        audio_data = b"\x00\x10" * 1000
+        wav_path = tmp_path / "test.wav"
+        save_wav(audio_data, wav_path)
+
+        # Act
+        result = load_wav(wav_path)
+
+        # Assert
+        assert result == audio_data
+
+    def test_rejects_unexpected_format(self, tmp_path: Path) -> None:
+        """16kHz・モノラル・16-bit以外のWAVファイルは拒否する."""
+        # Arrange
+        wav_path = tmp_path / "stereo.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(2)
+            wf.setsampwidth(2)
+            wf.setframerate(44100)
+            wf.writeframes(b"\x00" * 400)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="44100 Hz"):
+            load_wav(wav_path)
@@ -82,6 +82,21 @@ class TestSaveConfig:
         assert 'language = "ja"' in content
         assert "enabled = true" in content
 
+    def test_save_config_round_trips_decoding_profiles(self, tmp_path) -> None:
+        """保存したデコードプロファイルを読み込めること."""
+        # Arrange
+        config_file = tmp_path / "config.toml"
+        config = Config()
+
+        # Act
+        save_config(config, config_file)
+        loaded = load_config(config_file)
+
+        # Assert
+        assert "[stt.profiles.fast]" in config_file.read_text()
+        assert loaded is not None
+        assert loaded.stt.profiles == config.stt.profiles
+
     def test_save_config_creates_parent_directory(self, tmp_path) -> None:
         """親ディレクトリが存在しない場合、作成すること."""
         # Arrange
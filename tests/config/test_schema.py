@@ -4,7 +4,9 @@ import pytest
 from pydantic import ValidationError
 
 from voivoi.config.schema import (
+    AudioConfig,
     Config,
+    DecodingProfile,
     LLMConfig,
     LLMModel,
     STTConfig,
@@ -37,6 +39,38 @@ class TestLLMConfig:
         with pytest.raises(ValidationError):
             LLMConfig(model="invalid-model")  # type: ignore[arg-type]
 
+    def test_llm_config_keeps_model_loaded_by_default(self) -> None:
+        """デフォルトではセッション中ずっとモデルを常駐させること."""
+        # Act
+        config = LLMConfig()
+
+        # Assert
+        assert config.keep_alive == -1
+        assert config.timeout > 0
+
+    def test_llm_config_accepts_duration_keep_alive(self) -> None:
+        """keep_aliveに期間の文字列を指定できること."""
+        # Act
+        config = LLMConfig(keep_alive="30m")
+
+        # Assert
+        assert config.keep_alive == "30m"
+
+    def test_llm_config_disables_response_cache_by_default(self) -> None:
+        """応答キャッシュはデフォルトで無効であること."""
+        # Act
+        config = LLMConfig()
+
+        # Assert
+        assert config.cache.enabled is False
+        assert config.cache.max_depth == 1
+
+    def test_llm_config_rejects_non_positive_num_ctx(self) -> None:
+        """num_ctxに0以下を指定するとエラーになること."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            LLMConfig(num_ctx=0)
+
 
 class TestSTTConfig:
     """STTConfig のテスト."""
@@ -49,6 +83,67 @@ class TestSTTConfig:
         # Assert
         assert config.language == "ja"
 
+    def test_stt_config_enables_streaming_by_default(self) -> None:
+        """デフォルトで逐次文字起こしが有効であること."""
+        # Act
+        config = STTConfig()
+
+        # Assert
+        assert config.streaming is True
+
+    def test_stt_config_uses_whisper_backend_by_default(self) -> None:
+        """デフォルトのバックエンドがwhisperで、計算精度がint8であること."""
+        # Act
+        config = STTConfig()
+
+        # Assert
+        assert config.backend == "whisper"
+        assert config.compute_type == "int8"
+
+    def test_stt_config_rejects_invalid_backend(self) -> None:
+        """許可されていないバックエンドを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            STTConfig(backend="invalid")  # type: ignore[arg-type]
+
+    def test_stt_config_has_named_decoding_profiles(self) -> None:
+        """fast・balanced・accurateのデコードプロファイルを持ち、balancedを使うこと."""
+        # Act
+        config = STTConfig()
+
+        # Assert
+        assert {"fast", "balanced", "accurate"} <= set(config.profiles)
+        assert config.decoding == config.profiles["balanced"]
+        assert config.profiles["fast"].temperatures == [0.0]
+
+    def test_stt_config_merges_custom_profiles_with_defaults(self) -> None:
+        """ユーザー定義のプロファイルを既定のプロファイルに追加すること."""
+        # Act
+        config = STTConfig(
+            profile="tiny",
+            profiles={"tiny": DecodingProfile(threads=2)},  # type: ignore[dict-item]
+        )
+
+        # Assert
+        assert config.decoding.threads == 2
+        assert "balanced" in config.profiles
+
+    def test_stt_config_overrides_only_given_fields_of_default_profile(self) -> None:
+        """既定と同名のプロファイルは、指定した項目だけを上書きすること."""
+        # Act
+        config = STTConfig(profiles={"balanced": {"beam_size": 3}})  # type: ignore[dict-item]
+
+        # Assert
+        assert config.decoding.beam_size == 3
+        assert config.decoding.best_of == 2
+        assert config.decoding.temperatures == [0.0, 0.4]
+
+    def test_stt_config_rejects_unknown_profile(self) -> None:
+        """定義されていないプロファイルを拒否すること."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            STTConfig(profile="unknown")
+
     def test_stt_config_accepts_valid_language(self) -> None:
         """許可された言語コードを受け入れること."""
         # Act & Assert
@@ -93,6 +188,35 @@ class TestTTSConfig:
         assert config.enabled is True
 
 
+class TestAudioConfig:
+    """AudioConfig のテスト."""
+
+    def test_audio_config_has_default_durations(self) -> None:
+        """発話検出の時間設定にデフォルト値があること."""
+        # Act
+        config = AudioConfig()
+
+        # Assert
+        assert config.pre_roll_ms == 300
+        assert config.silence_ms == 1000
+        assert config.min_speech_ms == 200
+
+    def test_audio_config_disables_barge_in_by_default(self) -> None:
+        """応答中の割り込みはデフォルトで無効であること."""
+        # Act
+        config = AudioConfig()
+
+        # Assert
+        assert config.barge_in is False
+        assert config.barge_in_threshold == 0.05
+
+    def test_audio_config_rejects_non_positive_silence(self) -> None:
+        """無音時間に0以下を指定した場合は拒否すること."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            AudioConfig(silence_ms=0)
+
+
 class TestConfig:
     """Config のテスト."""
 
@@ -1,5 +1,6 @@
 """Chat/Messageドメインモデルのテスト."""
 
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -138,6 +139,31 @@ class TestChatPersistence:
         assert loaded_chat.messages[1].role == "assistant"
         assert loaded_chat.messages[1].content == "はい、こんにちは"
 
+    def test_save_chat_records_interrupted_flag_only_when_interrupted(self, tmp_path):
+        """中断されたメッセージだけにinterruptedを記録し、読み込みで復元する."""
+        # Arrange
+        import json
+
+        from voivoi.chat.domain.models import Chat
+        from voivoi.chat.domain.repository import load_chat, save_chat
+
+        chat = Chat.create()
+        chat.add_message("user", "長い話をして")
+        chat.add_message("assistant", "昔々、", interrupted=True)
+        path = tmp_path / f"{chat.id}.jsonl"
+
+        # Act
+        save_chat(chat, path)
+        loaded_chat = load_chat(path)
+
+        # Assert
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert "interrupted" not in lines[0]
+        assert lines[1]["interrupted"] is True
+        assert loaded_chat is not None
+        assert loaded_chat.messages[0].interrupted is False
+        assert loaded_chat.messages[1].interrupted is True
+
     def test_load_chat_returns_none_when_file_not_exists(self, tmp_path):
         """load_chatはファイルが存在しない場合Noneを返す."""
         # Arrange
@@ -151,6 +177,22 @@ class TestChatPersistence:
         # Assert
         assert result is None
 
+    def test_save_summary_writes_text_and_covered_count(self, tmp_path):
+        """save_summaryは要約の本文と要約済みのメッセージ数をJSONで保存する."""
+        # Arrange
+        from voivoi.chat.domain.models import ChatSummary
+        from voivoi.chat.domain.repository import save_summary
+
+        path = tmp_path / "chat.summary.json"
+        summary = ChatSummary(text="- 旅行の計画を立てている", covered=6)
+
+        # Act
+        save_summary(summary, path)
+
+        # Assert
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data == {"text": "- 旅行の計画を立てている", "covered": 6}
+
     def test_list_chats_returns_all_chats_in_directory(self, tmp_path):
         """list_chatsはディレクトリ内の全チャットを返す."""
         # Arrange
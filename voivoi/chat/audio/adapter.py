@@ -2,28 +2,61 @@
 
 from __future__ import annotations
 
-import struct
-from typing import Self
+import math
+from dataclasses import dataclass
+from typing import Final, Self
 
 import pyaudio
 
+from voivoi.chat.audio.pcm import SAMPLE_WIDTH
+from voivoi.chat.audio.ring import FrameRingBuffer
+
 # 録音設定
 SAMPLE_RATE = 16000  # Whisperが期待するサンプルレート
 CHANNELS = 1  # モノラル
-CHUNK_SIZE = 1024  # 1チャンクあたりのフレーム数
+CHUNK_SIZE = 512  # 1チャンクあたりのフレーム数（32ミリ秒）
 FORMAT = pyaudio.paInt16  # 16-bit signed integer
 
+# バックグラウンド録音時のリングバッファ容量（秒）
+DEFAULT_BUFFER_SECONDS: Final[float] = 60.0
+# バッファ読み出し時の待機間隔（秒）。Ctrl+Cに応答できるよう短く区切る
+READ_POLL_INTERVAL: Final[float] = 0.1
+
+
+@dataclass(frozen=True)
+class CaptureStats:
+    """録音の統計情報."""
+
+    captured_chunks: int  # 録音したチャンク数
+    dropped_chunks: int  # バッファ満杯で破棄したチャンク数
+    input_overflows: int  # PortAudioが入力オーバーフローを報告した回数
+    buffered_chunks: int  # 未読のチャンク数
+
 
 class PyAudioAdapter:
-    """PyAudioを使用した音声録音実装."""
+    """PyAudioを使用した音声録音実装.
+
+    buffer_secondsを指定するとコールバックAPIで録音し、リングバッファに蓄積する。
+    パイプラインの処理中もバックグラウンドで録音が続くため、発話を取りこぼさない。
+    """
 
     def __init__(
         self,
         sample_rate: int = SAMPLE_RATE,
         channels: int = CHANNELS,
         chunk_size: int = CHUNK_SIZE,
+        buffer_seconds: float | None = None,
     ) -> None:
         self._chunk_size = chunk_size
+        self._captured_chunks = 0
+        self._input_overflows = 0
+        self._ring: FrameRingBuffer | None = None
+        if buffer_seconds is not None:
+            self._ring = FrameRingBuffer(
+                capacity=math.ceil(buffer_seconds * sample_rate / chunk_size),
+                frame_bytes=chunk_size * channels * SAMPLE_WIDTH,
+            )
+
         self._pa = pyaudio.PyAudio()
         self._stream = self._pa.open(
             format=FORMAT,
@@ -31,25 +64,47 @@ class PyAudioAdapter:
             rate=sample_rate,
             input=True,
             frames_per_buffer=chunk_size,
+            stream_callback=self._on_audio if self._ring is not None else None,
+        )
+
+    def read_chunk(self) -> bytes:
+        """1チャンク分の音声データを読み取る."""
+        if self._ring is None:
+            # exception_on_overflow=False でオーバーフロー時もエラーにしない
+            data = self._stream.read(self._chunk_size, exception_on_overflow=False)
+            self._captured_chunks += 1
+        else:
+            data = self._ring.pop(timeout=READ_POLL_INTERVAL)
+            while data is None:
+                data = self._ring.pop(timeout=READ_POLL_INTERVAL)
+        return data
+
+    @property
+    def stats(self) -> CaptureStats:
+        """録音の統計情報を取得する."""
+        if self._ring is None:
+            return CaptureStats(
+                captured_chunks=self._captured_chunks,
+                dropped_chunks=0,
+                input_overflows=0,
+                buffered_chunks=0,
+            )
+        return CaptureStats(
+            captured_chunks=self._ring.written_count + self._ring.dropped_count,
+            dropped_chunks=self._ring.dropped_count,
+            input_overflows=self._input_overflows,
+            buffered_chunks=len(self._ring),
         )
 
-    def read_chunk(self) -> tuple[bytes, float]:
-        """1チャンク分の音声データを読み取り、データと音量レベルを返す."""
-        # exception_on_overflow=False でオーバーフロー時もエラーにしない
-        data = self._stream.read(self._chunk_size, exception_on_overflow=False)
-        level = self._calculate_level(data)
-        return data, level
-
-    def _calculate_level(self, data: bytes) -> float:
-        """音声データから正規化された音量レベル（0.0〜1.0）を計算する."""
-        # 16-bit signed integerとしてアンパック
-        samples = struct.unpack(f"<{len(data) // 2}h", data)
-        if not samples:
-            return 0.0
-        # RMS（二乗平均平方根）で音量を計算
-        rms = (sum(s * s for s in samples) / len(samples)) ** 0.5
-        # 16-bit signed integerの最大値で正規化
-        return min(1.0, rms / 32767.0)
+    def _on_audio(
+        self, in_data: bytes | None, frame_count: int, time_info: object, status: int
+    ) -> tuple[None, int]:
+        """PortAudioの録音スレッドから呼ばれ、チャンクをリングバッファに積む."""
+        if status & pyaudio.paInputOverflow:
+            self._input_overflows += 1
+        if in_data is not None and self._ring is not None:
+            self._ring.push(in_data)
+        return None, pyaudio.paContinue
 
     def close(self) -> None:
         """リソースを解放する."""
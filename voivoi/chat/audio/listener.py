@@ -2,31 +2,69 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Iterator
-from typing import Final
+from itertools import islice
+from typing import Final, Protocol
 
+from voivoi.chat.audio.pcm import SAMPLE_RATE, duration_ms, to_samples
 from voivoi.chat.audio.port import AudioRecorderPort
 from voivoi.chat.audio.vad import VADPort
 
 # デフォルト設定
-DEFAULT_MIN_SPEECH_CHUNKS: Final[int] = 3  # 最小発話チャンク数（ノイズ除去用）
-DEFAULT_SILENCE_CHUNKS: Final[int] = 15  # 発話終了と判定するまでの無音チャンク数（約1秒）
+DEFAULT_MIN_SPEECH_MS: Final[int] = 200  # 最小発話時間（ノイズ除去用）
+DEFAULT_SILENCE_MS: Final[int] = 1000  # 発話終了と判定するまでの無音時間
+DEFAULT_PRE_ROLL_MS: Final[int] = 300  # 発話開始の直前から遡って含める時間
+DEFAULT_MAX_UTTERANCE_MS: Final[int] = 30000  # 1回の発話として保持する音声の上限
+
+
+class SpeechObserver(Protocol):
+    """発話の進行を受け取るインターフェース（逐次文字起こし用）.
+
+    最小発話時間に満たずに破棄された発話ではon_speech_endは呼ばれず、
+    次の発話のon_speech_startが続く。
+    """
+
+    def on_speech_start(self) -> None: ...
+
+    def on_speech_chunk(self, data: bytes) -> None: ...
+
+    def on_speech_end(self, audio_data: bytes) -> None: ...
 
 
 class ContinuousListener:
-    """常時監視で発話を検出し、音声データを返す."""
+    """常時監視で発話を検出し、音声データを返す.
+
+    時間はチャンク数ではなく音声データの長さから計算するため、
+    チャンクサイズを変えても同じ設定で動作する。
+
+    発話がmax_utterance_msを超えた場合、observerがあれば音声は渡し済み
+    （observerが窓ごとに文字起こしして発話の終わりで1つにまとめる）のため、区切らずに
+    古いチャンクを捨て、yieldする音声は直近のmax_utterance_ms分になる。observerが
+    なければその時点で区切ってyieldし、続きを次の発話として録音する。
+    どちらの場合も保持する音声は上限内に収まる。
+    """
 
     def __init__(
         self,
         recorder: AudioRecorderPort,
         vad: VADPort,
-        min_speech_chunks: int = DEFAULT_MIN_SPEECH_CHUNKS,
-        silence_chunks: int = DEFAULT_SILENCE_CHUNKS,
+        min_speech_ms: int = DEFAULT_MIN_SPEECH_MS,
+        silence_ms: int = DEFAULT_SILENCE_MS,
+        pre_roll_ms: int = DEFAULT_PRE_ROLL_MS,
+        max_utterance_ms: int = DEFAULT_MAX_UTTERANCE_MS,
+        sample_rate: int = SAMPLE_RATE,
+        observer: SpeechObserver | None = None,
     ) -> None:
         self._recorder = recorder
         self._vad = vad
-        self._min_speech_chunks = min_speech_chunks
-        self._silence_chunks = silence_chunks
+        self._min_speech_ms = min_speech_ms
+        self._silence_ms = silence_ms
+        self._pre_roll_ms = pre_roll_ms
+        self._max_utterance_ms = max_utterance_ms
+        self._sample_rate = sample_rate
+        self._observer = observer
+        self._continuing = False  # 上限で区切った発話の続きを録音する場合True
 
     def listen(self) -> Iterator[bytes]:
         """発話を検出するたびに音声データをyieldする."""
@@ -37,38 +75,78 @@ class ContinuousListener:
 
     def _capture_speech(self) -> bytes | None:
         """発話を1回分キャプチャする."""
-        chunks: list[bytes] = []
-        speech_chunks = 0
-        silence_count = 0
-
-        # 発話開始を待つ
-        while True:
-            data, level = self._recorder.read_chunk()
-            if self._vad.is_speech(level):
-                chunks.append(data)
-                speech_chunks = 1
-                break
+        if self._continuing:
+            # 上限で区切った発話の続きは、発話開始を待たずに録音を始める
+            self._continuing = False
+            chunks: deque[bytes] = deque()
+            speech_ms = 0.0
+        else:
+            chunks = deque(self._wait_for_onset())
+            speech_ms = self._duration_ms(chunks[-1])
+        if self._observer is not None:
+            self._observer.on_speech_start()
+            for chunk in chunks:
+                self._observer.on_speech_chunk(chunk)
+        speech_end = len(chunks)  # 最後の発話チャンクの直後の位置
+        chunks_ms = sum(self._duration_ms(chunk) for chunk in chunks)
+        silence_ms = 0.0
 
         # 発話中のデータを収集
         while True:
-            data, level = self._recorder.read_chunk()
+            data = self._recorder.read_chunk()
+            chunks.append(data)
+            chunks_ms += self._duration_ms(data)
+            if self._observer is not None:
+                self._observer.on_speech_chunk(data)
 
-            if self._vad.is_speech(level):
-                chunks.append(data)
-                speech_chunks += 1
-                silence_count = 0
+            if self._vad.is_speech_frame(to_samples(data)):
+                speech_end = len(chunks)
+                speech_ms += self._duration_ms(data)
+                silence_ms = 0.0
             else:
-                silence_count += 1
                 # 短い無音は発話の一部として含める（息継ぎなど）
-                if silence_count < self._silence_chunks:
-                    chunks.append(data)
-                else:
+                silence_ms += self._duration_ms(data)
+                if silence_ms >= self._silence_ms:
                     # 発話終了
                     break
 
-        # 最小発話チャンク数に満たない場合は無視（ノイズ）
-        if speech_chunks < self._min_speech_chunks:
+            if chunks_ms < self._max_utterance_ms:
+                continue
+            if self._observer is not None:
+                # 音声はオブザーバー（窓ごとの文字起こし）に渡し済みのため、古いものから捨てる
+                while chunks_ms > self._max_utterance_ms:
+                    chunks_ms -= self._duration_ms(chunks.popleft())
+                    speech_end = max(speech_end - 1, 0)
+            elif silence_ms == 0:
+                # 発話の途中でも区切って先に処理し、続きは次の発話として録音する
+                # （無音が続く間は区切らず、発話終了の判定を待つ）
+                self._continuing = True
+                break
+
+        # 最小発話時間に満たない場合は無視（ノイズ）
+        if speech_ms < self._min_speech_ms:
             return None
 
         # 末尾の無音チャンクを除去
-        return b"".join(chunks[: -(self._silence_chunks - 1)])
+        audio_data = b"".join(islice(chunks, speech_end))
+        if self._observer is not None:
+            self._observer.on_speech_end(audio_data)
+        return audio_data
+
+    def _wait_for_onset(self) -> list[bytes]:
+        """発話開始を待ち、プリロールと最初の発話チャンクを返す."""
+        # 発話開始を待ちながら、直前の音声をプリロールとして保持する
+        pre_roll: deque[bytes] = deque()
+        pre_roll_ms = 0.0
+        while True:
+            data = self._recorder.read_chunk()
+            if self._vad.is_speech_frame(to_samples(data)):
+                return [*pre_roll, data]
+            pre_roll.append(data)
+            pre_roll_ms += self._duration_ms(data)
+            while pre_roll_ms > self._pre_roll_ms:
+                pre_roll_ms -= self._duration_ms(pre_roll.popleft())
+
+    def _duration_ms(self, data: bytes) -> float:
+        """チャンクの長さ（ミリ秒）を返す."""
+        return duration_ms(data, self._sample_rate)
@@ -0,0 +1,89 @@
+"""音量メーター（RMS / ピーク / dBFS）モジュール."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voivoi.chat.audio.pcm import SAMPLE_WIDTH, to_samples
+
+MAX_AMPLITUDE: Final[float] = 32767.0  # 16-bit signed integerの最大値
+SILENCE_DBFS: Final[float] = -120.0  # 完全な無音を表すdBFSの下限
+_MIN_LEVEL: Final[float] = 10 ** (SILENCE_DBFS / 20)
+
+
+@dataclass(frozen=True)
+class AudioLevel:
+    """1チャンク分の音量."""
+
+    rms: float  # 正規化RMS（0.0〜1.0）
+    peak: float  # 正規化ピーク（0.0〜1.0）
+    dbfs: float  # RMSのdBFS表現（SILENCE_DBFS〜0.0）
+
+
+def rms(samples: NDArray[np.int16]) -> NDArray[np.float64]:
+    """最後の軸に沿って正規化RMS（0.0〜1.0）を計算する."""
+    if samples.shape[-1] == 0:
+        return np.zeros(samples.shape[:-1])
+    x = samples.astype(np.float64)
+    mean_square = np.einsum("...i,...i->...", x, x) / samples.shape[-1]
+    return np.minimum(np.sqrt(mean_square) / MAX_AMPLITUDE, 1.0)
+
+
+def peak(samples: NDArray[np.int16]) -> NDArray[np.float64]:
+    """最後の軸に沿って正規化ピーク（0.0〜1.0）を計算する."""
+    if samples.shape[-1] == 0:
+        return np.zeros(samples.shape[:-1])
+    # -32768の絶対値がint16に収まらないためint32で計算する
+    amplitude = np.abs(samples.astype(np.int32)).max(axis=-1)
+    return np.minimum(amplitude / MAX_AMPLITUDE, 1.0)
+
+
+def to_dbfs(level: NDArray[np.float64] | float) -> NDArray[np.float64]:
+    """正規化レベルをdBFSに変換する（無音はSILENCE_DBFSに丸める）."""
+    return 20 * np.log10(np.maximum(level, _MIN_LEVEL))
+
+
+def rms_level(data: bytes) -> float:
+    """PCMバイト列から正規化RMS（0.0〜1.0）を計算する."""
+    # 録音スレッドで毎チャンク呼ばれるため、1次元の内積で最小限の処理にする
+    samples = to_samples(data)
+    if not len(samples):
+        return 0.0
+    x = samples.astype(np.float64)
+    return min(1.0, math.sqrt(float(np.dot(x, x)) / len(x)) / MAX_AMPLITUDE)
+
+
+def measure(data: bytes) -> AudioLevel:
+    """PCMバイト列からRMS・ピーク・dBFSを計算する."""
+    samples = to_samples(data)
+    level = rms(samples)
+    return AudioLevel(
+        rms=float(level), peak=float(peak(samples)), dbfs=float(to_dbfs(level))
+    )
+
+
+def measure_batch(chunks: Sequence[bytes]) -> list[AudioLevel]:
+    """複数チャンクのRMS・ピーク・dBFSをまとめて計算する.
+
+    全チャンクが同じ長さの場合は2次元配列として一括で計算する。
+    """
+    if not chunks:
+        return []
+    if len({len(chunk) for chunk in chunks}) != 1:
+        return [measure(chunk) for chunk in chunks]
+
+    frame_size = len(chunks[0]) // SAMPLE_WIDTH
+    frames = to_samples(b"".join(chunks)).reshape(len(chunks), frame_size)
+    levels = rms(frames)
+    peaks = peak(frames)
+    dbfs = to_dbfs(levels)
+    return [
+        AudioLevel(rms=float(r), peak=float(p), dbfs=float(d))
+        for r, p, d in zip(levels, peaks, dbfs, strict=True)
+    ]
@@ -0,0 +1,41 @@
+"""PCM音声データ変換モジュール."""
+
+from __future__ import annotations
+
+from typing import Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+SAMPLE_RATE: Final[int] = 16000  # Whisperが期待するサンプルレート
+# 16-bit signed integer（リトルエンディアン）
+SAMPLE_DTYPE: Final = np.dtype("<i2")
+SAMPLE_WIDTH: Final[int] = SAMPLE_DTYPE.itemsize
+# int16を-1.0〜1.0に正規化する係数（Whisperのload_audioと同じ）
+_FLOAT_SCALE: Final = np.float32(1 / 32768)
+
+
+def to_samples(data: bytes) -> NDArray[np.int16]:
+    """PCMバイト列をコピーせずにint16配列として参照する."""
+    return np.frombuffer(data, dtype=SAMPLE_DTYPE)
+
+
+def to_float32(data: bytes) -> NDArray[np.float32]:
+    """PCMバイト列をWhisperが受け付ける-1.0〜1.0のfloat32配列に変換する."""
+    # 読み取り専用のビューから変換と正規化を1回の確保で行う
+    return np.multiply(to_samples(data), _FLOAT_SCALE, dtype=np.float32)
+
+
+def to_frames(data: bytes, frame_size: int) -> NDArray[np.int16]:
+    """PCMバイト列を（フレーム数, frame_size）の2次元配列として参照する.
+
+    端数のサンプルは切り捨てる。
+    """
+    samples = to_samples(data)
+    n_frames = len(samples) // frame_size
+    return samples[: n_frames * frame_size].reshape(n_frames, frame_size)
+
+
+def duration_ms(data: bytes, sample_rate: int = SAMPLE_RATE) -> float:
+    """PCMバイト列の再生時間（ミリ秒）を返す."""
+    return len(data) / SAMPLE_WIDTH / sample_rate * 1000
@@ -8,7 +8,7 @@ from typing import Protocol, Self
 class AudioRecorderPort(Protocol):
     """音声録音プロバイダーのインターフェース（依存注入用）."""
 
-    def read_chunk(self) -> tuple[bytes, float]: ...
+    def read_chunk(self) -> bytes: ...
     def close(self) -> None: ...
     def __enter__(self) -> Self: ...
     def __exit__(self, *args: object) -> None: ...
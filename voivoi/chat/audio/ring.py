@@ -0,0 +1,74 @@
+"""固定長フレームのリングバッファモジュール."""
+
+from __future__ import annotations
+
+import threading
+
+
+class FrameRingBuffer:
+    """単一プロデューサー・単一コンシューマー向けの固定長フレームリングバッファ.
+
+    書き込み位置は録音コールバックだけが、読み出し位置は消費側だけが更新するため
+    ロックを使わない。満杯のときは新しいフレームを破棄して件数を記録する。
+    """
+
+    def __init__(self, capacity: int, frame_bytes: int) -> None:
+        if capacity <= 0 or frame_bytes <= 0:
+            msg = "capacity and frame_bytes must be positive"
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._frame_bytes = frame_bytes
+        self._buffer = memoryview(bytearray(capacity * frame_bytes))
+        self._write_count = 0  # 書き込んだ総フレーム数（プロデューサーのみ更新）
+        self._read_count = 0  # 読み出した総フレーム数（コンシューマーのみ更新）
+        self._dropped_count = 0
+        self._available = threading.Event()
+
+    @property
+    def capacity(self) -> int:
+        """保持できる最大フレーム数."""
+        return self._capacity
+
+    @property
+    def written_count(self) -> int:
+        """書き込んだ総フレーム数."""
+        return self._write_count
+
+    @property
+    def dropped_count(self) -> int:
+        """満杯のため破棄した総フレーム数."""
+        return self._dropped_count
+
+    def __len__(self) -> int:
+        """未読のフレーム数."""
+        return self._write_count - self._read_count
+
+    def push(self, frame: bytes) -> bool:
+        """フレームを書き込む。満杯の場合は破棄してFalseを返す."""
+        if len(frame) != self._frame_bytes:
+            msg = f"frame must be {self._frame_bytes} bytes, got {len(frame)}"
+            raise ValueError(msg)
+        if len(self) >= self._capacity:
+            self._dropped_count += 1
+            return False
+
+        start = (self._write_count % self._capacity) * self._frame_bytes
+        self._buffer[start : start + self._frame_bytes] = frame
+        self._write_count += 1
+        self._available.set()
+        return True
+
+    def pop(self, timeout: float | None = None) -> bytes | None:
+        """最も古いフレームを読み出す。timeout秒以内に届かなければNoneを返す."""
+        while not len(self):
+            self._available.clear()
+            # clear()の直前に書き込まれた場合の取りこぼしを防ぐため再確認する
+            if len(self):
+                break
+            if not self._available.wait(timeout):
+                return None
+
+        start = (self._read_count % self._capacity) * self._frame_bytes
+        frame = bytes(self._buffer[start : start + self._frame_bytes])
+        self._read_count += 1
+        return frame
@@ -2,15 +2,62 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Final, Protocol
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voivoi.chat.audio.meter import rms
+from voivoi.chat.audio.pcm import SAMPLE_RATE, to_frames
 
 DEFAULT_THRESHOLD: float = 0.02
+# 白色雑音（≈0.56）や空調音のような広帯域ノイズを除外する上限
+DEFAULT_MAX_FLATNESS: Final[float] = 0.2
+# 商用電源のハム音（50/60Hz ≈ 0.007）を除外する下限
+DEFAULT_MIN_ZCR: Final[float] = 0.01
+# 摩擦音を含む発話を許容しつつ白色雑音（≈0.5）を除外する上限
+DEFAULT_MAX_ZCR: Final[float] = 0.4
+_POWER_EPSILON: Final[float] = 1e-10
+
+# AdaptiveVADの設定
+DEFAULT_CALIBRATION_MS: Final[int] = 1000  # 起動直後に雑音レベルを推定する時間
+DEFAULT_TRACKING_WINDOW_MS: Final[int] = 10000  # 雑音レベルの追従に使う時間窓
+DEFAULT_NOISE_PERCENTILE: Final[float] = 10.0  # 時間窓内で雑音レベルとみなす百分位
+DEFAULT_NOISE_MARGIN: Final[float] = 3.0  # 閾値 = 雑音レベル × マージン（約+10dB）
+DEFAULT_MIN_THRESHOLD: Final[float] = 0.005  # 無音室でも下回らない閾値
+# これより長く途切れずに続く「発話」は、雑音レベルの変化とみなして追従する
+DEFAULT_MAX_SPEECH_MS: Final[int] = 30000
 
 
 class VADPort(Protocol):
     """VADプロバイダーのインターフェース（依存注入用）."""
 
-    def is_speech(self, audio_level: float) -> bool: ...
+    def is_speech_frame(self, samples: NDArray[np.int16]) -> bool: ...
+
+
+@dataclass(frozen=True)
+class FrameFeatures:
+    """フレームごとの音響特徴量."""
+
+    energy: NDArray[np.float64]  # 正規化RMS（0.0〜1.0）
+    zcr: NDArray[np.float64]  # ゼロ交差率（1サンプルあたり、0.0〜1.0）
+    flatness: NDArray[np.float64]  # スペクトル平坦度（0.0:音声的〜1.0:雑音的）
+
+
+def extract_features(frames: NDArray[np.int16]) -> FrameFeatures:
+    """（フレーム数, サンプル数）の配列から特徴量を一括で計算する."""
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[..., 1:] != signs[..., :-1], axis=-1)
+
+    window = np.hanning(frames.shape[-1])
+    spectrum = np.fft.rfft(frames * window, axis=-1)[..., 1:]  # 直流成分を除く
+    power = spectrum.real**2 + spectrum.imag**2 + _POWER_EPSILON
+    flatness = np.exp(np.mean(np.log(power), axis=-1)) / np.mean(power, axis=-1)
+
+    return FrameFeatures(energy=rms(frames), zcr=zcr, flatness=flatness)
 
 
 class ThresholdVAD:
@@ -22,3 +69,119 @@ class ThresholdVAD:
     def is_speech(self, audio_level: float) -> bool:
         """音量レベルから発話中かどうかを判定する."""
         return audio_level > self._threshold
+
+    def is_speech_frame(self, samples: NDArray[np.int16]) -> bool:
+        """フレームの音量から発話中かどうかを判定する."""
+        return self.is_speech(float(rms(samples)))
+
+
+class SpectralVAD:
+    """エネルギー・ゼロ交差率・スペクトル平坦度を組み合わせたVAD実装.
+
+    音量だけでは区別できない空調音（平坦なスペクトル）やハム音（低いゼロ交差率）を
+    発話として扱わないため、無駄な文字起こしを減らせる。
+    """
+
+    def __init__(
+        self,
+        energy_threshold: float = DEFAULT_THRESHOLD,
+        max_flatness: float = DEFAULT_MAX_FLATNESS,
+        min_zcr: float = DEFAULT_MIN_ZCR,
+        max_zcr: float = DEFAULT_MAX_ZCR,
+    ) -> None:
+        self._energy_threshold = energy_threshold
+        self._max_flatness = max_flatness
+        self._min_zcr = min_zcr
+        self._max_zcr = max_zcr
+
+    def is_speech_frame(self, samples: NDArray[np.int16]) -> bool:
+        """1フレームが発話かどうかを判定する."""
+        return bool(self.classify(samples[np.newaxis])[0])
+
+    def classify(self, frames: NDArray[np.int16]) -> NDArray[np.bool_]:
+        """（フレーム数, サンプル数）の配列をフレームごとに一括判定する."""
+        features = extract_features(frames)
+        return (
+            (features.energy > self._energy_threshold)
+            & (features.flatness < self._max_flatness)
+            & (features.zcr >= self._min_zcr)
+            & (features.zcr <= self._max_zcr)
+        )
+
+    def detect(self, data: bytes, frame_size: int) -> NDArray[np.bool_]:
+        """PCMバイト列をframe_sizeごとに区切って一括判定する（オフライン用）."""
+        return self.classify(to_frames(data, frame_size))
+
+
+class AdaptiveVAD:
+    """雑音レベルを推定して閾値を自動調整するVAD実装.
+
+    起動直後のcalibration_msの間は発話と判定せず、音量から雑音レベルを推定する。
+    以降は直近tracking_window_msの音量の下位百分位を雑音レベルとして追従するため、
+    空調のオン・オフなどで部屋の雑音が変わっても閾値が合わせて変化する。
+    長い発話で雑音レベルが上がらないよう、発話と判定したフレームは時間窓に加えない。
+    ただし、max_speech_msを超えて途切れない場合は雑音が大きくなったとみなし、
+    再び時間窓に加えて追従する。
+    """
+
+    def __init__(
+        self,
+        calibration_ms: int = DEFAULT_CALIBRATION_MS,
+        tracking_window_ms: int = DEFAULT_TRACKING_WINDOW_MS,
+        noise_percentile: float = DEFAULT_NOISE_PERCENTILE,
+        margin: float = DEFAULT_NOISE_MARGIN,
+        min_threshold: float = DEFAULT_MIN_THRESHOLD,
+        max_speech_ms: int = DEFAULT_MAX_SPEECH_MS,
+        sample_rate: int = SAMPLE_RATE,
+    ) -> None:
+        self._calibration_ms = calibration_ms
+        self._tracking_window_ms = tracking_window_ms
+        self._noise_percentile = noise_percentile
+        self._margin = margin
+        self._min_threshold = min_threshold
+        self._max_speech_ms = max_speech_ms
+        self._sample_rate = sample_rate
+        self._levels: deque[float] | None = None  # 最初のフレームで長さを決める
+        self._elapsed_ms = 0.0
+        self._speech_ms = 0.0  # 発話と判定したフレームが途切れずに続いている時間
+        self._noise_floor: float | None = None
+
+    @property
+    def is_calibrated(self) -> bool:
+        """雑音レベルの推定が完了したかどうか."""
+        return self._noise_floor is not None
+
+    @property
+    def noise_floor(self) -> float | None:
+        """現在の雑音レベル（正規化RMS）。推定前はNone."""
+        return self._noise_floor
+
+    @property
+    def threshold(self) -> float | None:
+        """現在の発話判定閾値（正規化RMS）。推定前はNone."""
+        if self._noise_floor is None:
+            return None
+        return max(self._min_threshold, self._noise_floor * self._margin)
+
+    def is_speech_frame(self, samples: NDArray[np.int16]) -> bool:
+        """フレームの音量を雑音レベルと比較して発話中かどうかを判定する."""
+        if not len(samples):
+            return False
+        level = float(rms(samples))
+        frame_ms = len(samples) / self._sample_rate * 1000
+        if self._levels is None:
+            window = max(1, math.ceil(self._tracking_window_ms / frame_ms))
+            self._levels = deque(maxlen=window)
+
+        # 推定前は判定しない（閾値が定まっていないため）
+        threshold = self.threshold
+        is_speech = threshold is not None and level > threshold
+        self._speech_ms = self._speech_ms + frame_ms if is_speech else 0.0
+        if not is_speech or self._speech_ms > self._max_speech_ms:
+            self._levels.append(level)
+        self._elapsed_ms += frame_ms
+        if self._elapsed_ms >= self._calibration_ms:
+            self._noise_floor = float(
+                np.percentile(self._levels, self._noise_percentile)
+            )
+        return is_speech
@@ -1,4 +1,4 @@
-"""WAVファイル保存モジュール."""
+"""WAVファイル読み書きモジュール."""
 
 from __future__ import annotations
 
@@ -18,3 +18,19 @@ def save_wav(audio_data: bytes, path: Path) -> None:
         wf.setsampwidth(SAMPLE_WIDTH)
         wf.setframerate(SAMPLE_RATE)
         wf.writeframes(audio_data)
+
+
+def load_wav(path: Path) -> bytes:
+    """Whisperが期待するフォーマットのWAVファイルから音声データを読み込む.
+
+    Raises:
+        ValueError: 16kHz・モノラル・16-bit以外のWAVファイルの場合
+    """
+    with wave.open(str(path), "rb") as wf:
+        actual = (wf.getframerate(), wf.getnchannels(), wf.getsampwidth())
+        if actual != (SAMPLE_RATE, CHANNELS, SAMPLE_WIDTH):
+            raise ValueError(
+                f"{path}: expected 16 kHz mono 16-bit PCM, got "
+                f"{actual[0]} Hz, {actual[1]} ch, {actual[2] * 8}-bit"
+            )
+        return wf.readframes(wf.getnframes())
@@ -1,19 +1,23 @@
 """Chat CLI コマンド."""
 
+from __future__ import annotations
+
+import contextlib
+import statistics
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from voivoi.chat.audio.adapter import PyAudioAdapter
-from voivoi.chat.audio.listener import ContinuousListener
-from voivoi.chat.audio.vad import ThresholdVAD
-from voivoi.chat.domain.models import Chat
+from voivoi.chat.domain.models import Chat, ChatSummary
 from voivoi.chat.domain.paths import get_chats_dir
-from voivoi.chat.domain.repository import list_chats, load_chat, save_chat
-from voivoi.chat.llm.adapter import OllamaAdapter
-from voivoi.chat.orchestrator import ChatOrchestrator
-from voivoi.chat.stt.adapter import WhisperAdapter
-from voivoi.chat.tts.adapter import Pyttsx3Adapter
+from voivoi.chat.domain.repository import (
+    list_chats,
+    load_chat,
+    save_chat,
+    save_summary,
+)
 from voivoi.chat.ui import (
     print_ai_message,
     print_info,
@@ -22,54 +26,378 @@ from voivoi.chat.ui import (
 )
 from voivoi.config.loader import load_config
 from voivoi.config.paths import get_config_file
+from voivoi.config.schema import Config, DecodingProfile, STTBackend, VADType
+
+# 音声処理のバックエンド（torch・whisper・pyaudioなど）は読み込みに数秒かかるため、
+# 音声チャットを開始するときに初めてimportする
+if TYPE_CHECKING:
+    from voivoi.chat.audio.listener import ContinuousListener
+    from voivoi.chat.audio.vad import VADPort
+    from voivoi.chat.llm.port import LLMPort
+    from voivoi.chat.metrics import TurnMetrics
+    from voivoi.chat.orchestrator import ChatOrchestrator
+    from voivoi.chat.stt.gate import NoSpeechDetector
+    from voivoi.chat.stt.port import DecodingOptions, STTPort
+    from voivoi.chat.tts.port import TTSPort
 
 app = typer.Typer()
 
 
-def save_session(chat: Chat, chats_dir: Path) -> None:
-    """会話履歴をファイルに保存する."""
+def save_session(
+    chat: Chat, chats_dir: Path, summary: ChatSummary | None = None
+) -> None:
+    """会話履歴と古いターンの要約をファイルに保存する."""
     if not chat.messages:
         return
 
     chats_dir.mkdir(parents=True, exist_ok=True)
     save_chat(chat, chats_dir / f"{chat.id}.jsonl")
+    # 古いターンはLLMに要約の形で送っているため、その要約もチャットと並べて残す
+    if summary is not None:
+        save_summary(summary, chats_dir / f"{chat.id}.summary.json")
+
+
+def create_vad(vad_type: VADType) -> VADPort:
+    """設定に応じたVADを作成する."""
+    from voivoi.chat.audio.vad import AdaptiveVAD, SpectralVAD, ThresholdVAD
+
+    if vad_type is VADType.THRESHOLD:
+        return ThresholdVAD()
+    if vad_type is VADType.SPECTRAL:
+        return SpectralVAD()
+    return AdaptiveVAD()
+
+
+def create_decoding_options(profile: DecodingProfile) -> DecodingOptions:
+    """設定のデコードプロファイルからデコード設定を作成する."""
+    from voivoi.chat.stt.port import DecodingOptions
+
+    return DecodingOptions(
+        beam_size=profile.beam_size,
+        best_of=profile.best_of,
+        temperatures=tuple(profile.temperatures),
+        compression_ratio_threshold=profile.compression_ratio_threshold,
+        logprob_threshold=profile.logprob_threshold,
+        condition_on_previous_text=profile.condition_on_previous_text,
+        threads=profile.threads,
+        max_tokens_per_second=profile.max_tokens_per_second,
+        max_decode_seconds=profile.max_decode_seconds,
+    )
+
+
+def _load_stt(config: Config) -> STTPort:
+    """設定されたバックエンドでWhisperモデルを読み込む."""
+    decoding = create_decoding_options(config.stt.decoding)
+    if config.stt.backend is STTBackend.FASTER_WHISPER:
+        from voivoi.chat.stt.faster_adapter import FasterWhisperAdapter
+
+        # faster-whisperでは信号の特徴量による判定のみ行う
+        faster = FasterWhisperAdapter(
+            model_name=config.stt.model,
+            language=config.stt.language,
+            compute_type=config.stt.compute_type,
+            decoding=decoding,
+        )
+        return _with_silence_precheck(config, faster, detector=None)
+
+    from voivoi.chat.stt.adapter import WhisperAdapter
+
+    whisper_stt = WhisperAdapter(
+        model_name=config.stt.model,
+        language=config.stt.language,
+        quantize=config.stt.quantize,
+        decoding=decoding,
+    )
+    # モデルによる判定はエンコーダーを1回余分に実行するため、逐次文字起こしでは
+    # 窓ごとの認識が倍の時間にならないよう、信号の特徴量による判定のみ行う
+    detector = None if config.stt.streaming else whisper_stt
+    return _with_silence_precheck(config, whisper_stt, detector=detector)
+
+
+def _with_silence_precheck(
+    config: Config, stt: STTPort, detector: NoSpeechDetector | None
+) -> STTPort:
+    """設定に応じて無音の事前判定を挟む."""
+    if not config.stt.silence_precheck:
+        return stt
+
+    from voivoi.chat.stt.gate import SpeechGate
+
+    return SpeechGate(stt, detector=detector)
+
+
+def _report_silence_precheck(stt_future: Future[STTPort]) -> None:
+    """無音の事前判定でフルデコードを省いた回数を表示する."""
+    from voivoi.chat.stt.gate import SpeechGate
+
+    if not stt_future.done() or stt_future.exception() is not None:
+        return
+    stt = stt_future.result()
+    if isinstance(stt, SpeechGate) and (stats := stt.stats).rejected:
+        total = stats.rejected + stats.passed
+        print_status(
+            f"Skipped {stats.rejected}/{total} silent segments before decoding"
+        )
+
+
+def _load_llm(config: Config) -> LLMPort:
+    """Ollamaにモデルを読み込ませる（振り分けを有効にした場合は小さいモデルも）."""
+    from voivoi.chat.llm.adapter import OllamaAdapter
+    from voivoi.chat.llm.cache import CachedLLM, get_cache_dir
+    from voivoi.chat.llm.router import RoutingLLM
+
+    def load(model: str) -> OllamaAdapter:
+        llm = OllamaAdapter(
+            model=model,
+            host=config.llm.host,
+            timeout=config.llm.timeout,
+            keep_alive=config.llm.keep_alive,
+            num_ctx=config.llm.num_ctx,
+        )
+        llm.warm_up()
+        return llm
+
+    llm: LLMPort = load(config.llm.model)
+    if config.llm.route_max_chars or config.llm.hedge_after_ms:
+        llm = RoutingLLM(
+            primary=llm,
+            fast=load(config.llm.fast_model),
+            max_fast_chars=config.llm.route_max_chars,
+            hedge_after_ms=config.llm.hedge_after_ms or None,
+        )
+    cache = config.llm.cache
+    if cache.enabled:
+        llm = CachedLLM(
+            llm,
+            model=config.llm.model,
+            path=get_cache_dir() / "llm.json",
+            fast_model=config.llm.fast_model,
+            ttl_seconds=cache.ttl_seconds,
+            max_entries=cache.max_entries,
+            max_depth=cache.max_depth,
+            window=cache.window,
+        )
+    return llm
+
+
+def _summary_llm(llm: LLMPort) -> LLMPort:
+    """会話の要約に使う大きいモデルを返す.
+
+    要約は応答とは別のスレッドで作るため、直前の応答の経路や評価量を記録する
+    キャッシュと振り分けを通さない（要約のリクエストはどちらの対象にもならない）。
+    """
+    from voivoi.chat.llm.cache import CachedLLM
+    from voivoi.chat.llm.router import RoutingLLM
+
+    if isinstance(llm, CachedLLM):
+        llm = llm.llm
+    if isinstance(llm, RoutingLLM):
+        llm = llm.primary
+    return llm
+
+
+def _unload_llm(llm_future: Future[LLMPort]) -> None:
+    """セッションの終了時にOllamaからモデルをアンロードする."""
+    from voivoi.chat.llm.port import LLMConnectionError, UnloadableLLM
+
+    if not llm_future.done() or llm_future.exception() is not None:
+        return
+    llm = llm_future.result()
+    if isinstance(llm, UnloadableLLM):
+        # 終了処理のため、Ollamaに接続できなくても無視する
+        with contextlib.suppress(LLMConnectionError):
+            llm.unload()
+
+
+def _report_llm(llm_future: Future[LLMPort]) -> None:
+    """応答キャッシュのヒット率と、モデルの経路ごとの応答時間（百分位数）を表示する."""
+    from voivoi.chat.llm.cache import CachedLLM
+    from voivoi.chat.llm.router import RoutingLLM
+
+    if not llm_future.done() or llm_future.exception() is not None:
+        return
+    llm = llm_future.result()
+    if isinstance(llm, CachedLLM):
+        stats = llm.stats
+        print_status(f"Response cache: {stats.hits} hits, {stats.misses} misses")
+        llm = llm.llm
+    if not isinstance(llm, RoutingLLM):
+        return
+    for latency in llm.latencies:
+        print_status(
+            f"Route {latency.route}: {latency.count} turns, time to first token "
+            f"p50 {latency.p50_ms:.0f} ms / p90 {latency.p90_ms:.0f} ms / "
+            f"p99 {latency.p99_ms:.0f} ms"
+        )
+
+
+def _load_tts() -> TTSPort:
+    """音声合成エンジンを初期化する."""
+    from voivoi.chat.tts.adapter import Pyttsx3Adapter
+
+    tts = Pyttsx3Adapter()
+    tts.warm_up()
+    return tts
+
+
+def _report_latency(metrics: list[TurnMetrics]) -> None:
+    """最初のトークンと最初の読み上げまでの時間（中央値）とプレフィル量を表示する."""
+    ttfts = [m.ttft_ms for m in metrics if m.ttft_ms is not None]
+    ttfas = [m.ttfa_ms for m in metrics if m.ttfa_ms is not None]
+    prefills = [
+        (m.turn, m.prompt_tokens, m.prefill_ms)
+        for m in metrics
+        if m.prompt_tokens is not None and m.prefill_ms is not None
+    ]
+    if ttfts:
+        print_status(
+            f"Median time to first token: {statistics.median(ttfts):.0f} ms "
+            f"({len(ttfts)} turns)"
+        )
+    if ttfas:
+        print_status(
+            f"Median time to first audio: {statistics.median(ttfas):.0f} ms "
+            f"({len(ttfas)} turns)"
+        )
+    # KVキャッシュが効いていれば、ターンが進んでもプレフィルは新しい発話の分だけで済む
+    for turn, tokens, prefill_ms in prefills:
+        print_status(f"Turn {turn} prefill: {tokens} tokens in {prefill_ms:.0f} ms")
+
+
+def _report_loaded(name: str, seconds: float) -> None:
+    """コンポーネントの初期化にかかった時間を表示する."""
+    print_status(f"{name} ready ({seconds:.1f}s)")
 
 
 @app.callback(invoke_without_command=True)
-def chat_start(ctx: typer.Context) -> None:
+def chat_start(
+    ctx: typer.Context,
+    save_audio: Annotated[
+        Path | None,
+        typer.Option(help="Save each utterance as a WAV file in this directory."),
+    ] = None,
+) -> None:
     """Start voice chat (default command)."""
     if ctx.invoked_subcommand is not None:
         return
 
+    from voivoi.chat.audio.adapter import DEFAULT_BUFFER_SECONDS, PyAudioAdapter
+    from voivoi.chat.audio.listener import ContinuousListener
+    from voivoi.chat.context import ContextWindow
+    from voivoi.chat.orchestrator import ChatOrchestrator
+    from voivoi.chat.startup import (
+        BackgroundLoader,
+        DeferredLLM,
+        DeferredSTT,
+        DeferredTTS,
+    )
+
     # 設定を読み込む（存在しない場合はデフォルト設定を使用）
     config = load_config(get_config_file())
     if config is None:
-        from voivoi.config.schema import Config
-
         config = Config()
 
-    # 各コンポーネントを初期化
-    stt = WhisperAdapter(model_name=config.stt.model, language=config.stt.language)
-    llm = OllamaAdapter(model=config.llm.model)
-    tts = Pyttsx3Adapter()
-    vad = ThresholdVAD()
+    # 重いコンポーネントはバックグラウンドで並行して初期化し、先に録音を始める。
+    # 初期化中の発話はリングバッファに溜まり、初期化の完了後に順に処理される
+    loader = BackgroundLoader(on_loaded=_report_loaded)
+    stt_future = loader.submit("STT", lambda: _load_stt(config))
+    stt = DeferredSTT(stt_future)
+    llm_future = loader.submit("LLM", lambda: _load_llm(config))
+    llm = DeferredLLM(llm_future)
+    tts = DeferredTTS(loader.submit("TTS", _load_tts))
+    vad = create_vad(config.audio.vad)
+    # 古いターンの要約は応答とは別のスレッドで作る
+    summarizer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary")
+    summary_llm = DeferredLLM(
+        summarizer.submit(lambda: _summary_llm(llm_future.result()))
+    )
+    context = ContextWindow(
+        llm=summary_llm, executor=summarizer, budget_tokens=config.llm.context_tokens
+    )
 
-    voice_chat = ChatOrchestrator(stt=stt, llm=llm, tts=tts)
+    voice_chat = ChatOrchestrator(
+        stt=stt,
+        llm=llm,
+        tts=tts,
+        debug_audio_dir=save_audio,
+        streaming=config.stt.streaming,
+        barge_in=config.audio.barge_in,
+        context=context,
+        barge_in_ms=config.audio.min_speech_ms,
+        barge_in_threshold=config.audio.barge_in_threshold,
+        window_ms=config.audio.max_utterance_ms,
+    )
+    # 応答は別スレッドで処理し、応答中もリスナーで発話を検出できるようにする
+    turns = ThreadPoolExecutor(max_workers=1, thread_name_prefix="turn")
 
-    print_info("Voice chat started. Press Ctrl+C to exit.")
+    print_info(
+        "Voice chat started. Press Ctrl+C to cancel a response, "
+        "or to exit while listening."
+    )
     print_status("Listening...")
 
-    with PyAudioAdapter() as recorder:
-        listener = ContinuousListener(recorder=recorder, vad=vad)
+    # 処理中も録音を続け、発話をリングバッファに蓄積する
+    with PyAudioAdapter(buffer_seconds=DEFAULT_BUFFER_SECONDS) as recorder:
+        listener = ContinuousListener(
+            recorder=recorder,
+            vad=vad,
+            min_speech_ms=config.audio.min_speech_ms,
+            silence_ms=config.audio.silence_ms,
+            pre_roll_ms=config.audio.pre_roll_ms,
+            max_utterance_ms=config.audio.max_utterance_ms,
+            observer=voice_chat,
+        )
 
         try:
-            for audio_data in listener.listen():
-                print_status("Processing...")
-                voice_chat.process_audio(audio_data)
-                print_status("Listening...")
+            _run_turns(listener, voice_chat, turns)
         except KeyboardInterrupt:
-            save_session(voice_chat.get_chat(), get_chats_dir())
+            voice_chat.interrupt()
+            turns.shutdown(wait=True, cancel_futures=True)
+            _report_silence_precheck(stt_future)
+            _report_latency(voice_chat.metrics)
+            _report_llm(llm_future)
             print_info("\nVoice chat ended.")
+        finally:
+            turns.shutdown(wait=False, cancel_futures=True)
+            # 例外で終了した場合も、それまでの会話と要約を残す
+            save_session(voice_chat.get_chat(), get_chats_dir(), context.summary)
+            summarizer.shutdown(wait=False, cancel_futures=True)
+            voice_chat.close()
+            loader.shutdown()
+            _unload_llm(llm_future)
+
+
+def _run_turns(
+    listener: ContinuousListener, voice_chat: ChatOrchestrator, turns: Executor
+) -> None:
+    """発話ごとにターンを処理する.
+
+    応答中に録音した発話（読み上げの回り込みなど）は、オーケストレーターが捨てた
+    場合はターンにしない。
+    応答中のCtrl+Cはそのターンの生成と読み上げだけを取り消し、聞き取りを続ける。
+    待機中（または取り消し中）のCtrl+CはKeyboardInterruptとして送出する。
+    """
+    turn: Future[None] | None = None
+    while True:
+        try:
+            for audio_data in listener.listen():
+                if voice_chat.last_utterance_ignored:
+                    continue
+                if turn is not None and turn.done():
+                    turn.result()  # 前のターンで発生した例外を送出する
+                turn = turns.submit(_respond, voice_chat, audio_data)
+            return
+        except KeyboardInterrupt:
+            if not voice_chat.interrupt():
+                raise
+            print_status("Response cancelled. Press Ctrl+C again to exit.")
+
+
+def _respond(voice_chat: ChatOrchestrator, audio_data: bytes) -> None:
+    """発話に応答する（ターン処理スレッド）."""
+    print_status("Processing...")
+    voice_chat.process_audio(audio_data)
+    print_status("Listening...")
 
 
 @app.command("list")
@@ -0,0 +1,159 @@
+"""LLMに送る会話履歴のトークン予算管理（古いターンの要約）モジュール."""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Executor, Future
+from typing import Final
+
+from voivoi.chat.domain.models import ChatSummary, Message
+from voivoi.chat.llm.port import LLMMessage, LLMPort
+
+DEFAULT_BUDGET_TOKENS: Final[int] = 6144  # 応答の分を残したコンテキスト長
+# 履歴がこの割合を超えたら、古いターンの要約をバックグラウンドで始める
+SUMMARIZE_RATIO: Final[float] = 0.75
+# 要約後に原文のまま残す直近のターンの割合
+KEEP_RECENT_RATIO: Final[float] = 0.5
+# ロールや区切りなど、メッセージ1件ごとにかかるトークン数
+MESSAGE_OVERHEAD_TOKENS: Final[int] = 4
+
+SUMMARY_INSTRUCTION: Final[str] = (
+    "以下はユーザーとアシスタントの会話です。以降の応答に必要な事実・決定事項・"
+    "話題の流れを残し、箇条書きで簡潔に要約してください。要約だけを出力してください。"
+)
+SUMMARY_PREFIX: Final[str] = "これまでの会話の要約:\n"
+
+
+@functools.lru_cache(maxsize=4096)
+def estimate_tokens(text: str) -> int:
+    """テキストのトークン数を見積もる（結果はキャッシュされる）.
+
+    トークナイザーを読み込まずに済むよう、ASCII文字は4文字で1トークン、
+    それ以外（日本語など）は1文字で1トークンとして多めに見積もる。
+    """
+    ascii_chars = sum(1 for c in text if c.isascii())
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def message_tokens(content: str) -> int:
+    """メッセージ1件のトークン数を見積もる."""
+    return estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+
+
+class ContextWindow:
+    """会話履歴をトークン予算内に収めてLLMに渡す.
+
+    履歴が予算のSUMMARIZE_RATIOを超えると、直近のターンだけを残して古いターンを
+    要約にまとめる。要約はexecutor上で応答の後に作るため、ターンの応答を待たせない。
+    要約ができるまでに予算を超えた場合は、古いメッセージから送らずに済ませる。
+    要約に失敗した場合は、次のcompactで改めて要約する。
+
+    要約を更新するとプロンプトの先頭が変わり、LLMのKVキャッシュは一度作り直しになる。
+    そのため要約はターンごとではなく、予算の半分程度ずつまとめて行う。
+    """
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        executor: Executor,
+        budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+        summary: ChatSummary | None = None,
+    ) -> None:
+        self._llm = llm
+        self._executor = executor
+        self._budget_tokens = budget_tokens
+        self._lock = threading.Lock()
+        self._summary = summary
+        self._pending: Future[None] | None = None
+
+    @property
+    def summary(self) -> ChatSummary | None:
+        """古いターンの要約（まだ要約していなければNone）."""
+        with self._lock:
+            return self._summary
+
+    def build(self, messages: Sequence[Message]) -> list[LLMMessage]:
+        """要約と要約していないメッセージから、予算内のLLMへのメッセージを作る."""
+        summary = self._usable_summary(messages)
+        covered = summary.covered if summary is not None else 0
+        head: list[LLMMessage] = []
+        budget = self._budget_tokens
+        if summary is not None:
+            head.append(
+                LLMMessage(role="system", content=SUMMARY_PREFIX + summary.text)
+            )
+            budget -= message_tokens(head[0].content)
+
+        recent = messages[covered:]
+        start = 0
+        total = sum(message_tokens(m.content) for m in recent)
+        # 最新のメッセージは予算を超えても必ず送る
+        while total > budget and start < len(recent) - 1:
+            total -= message_tokens(recent[start].content)
+            start += 1
+        return head + [
+            LLMMessage(role=m.role, content=m.content) for m in recent[start:]
+        ]
+
+    def compact(self, messages: Sequence[Message]) -> None:
+        """履歴が予算に近づいていれば、古いターンの要約をバックグラウンドで始める."""
+        with self._lock:
+            if self._pending is not None and not self._pending.done():
+                return
+        summary = self._usable_summary(messages)
+        covered = summary.covered if summary is not None else 0
+        tokens = [message_tokens(m.content) for m in messages[covered:]]
+        if summary is not None:
+            tokens.insert(0, message_tokens(SUMMARY_PREFIX + summary.text))
+        if sum(tokens) <= self._budget_tokens * SUMMARIZE_RATIO:
+            return
+
+        fold_until = self._fold_point(messages, covered)
+        if fold_until <= covered:
+            return
+        snapshot = list(messages[:fold_until])
+        future = self._executor.submit(self._summarize, snapshot, summary)
+        with self._lock:
+            self._pending = future
+
+    def _usable_summary(self, messages: Sequence[Message]) -> ChatSummary | None:
+        """現在の履歴に使える要約を返す（履歴より多くを要約したものは使わない）."""
+        summary = self.summary
+        if summary is None or summary.covered > len(messages):
+            return None
+        return summary
+
+    def _fold_point(self, messages: Sequence[Message], covered: int) -> int:
+        """直近KEEP_RECENT_RATIO分のターンを残し、要約にまとめる範囲の終わりを返す."""
+        keep_tokens = self._budget_tokens * KEEP_RECENT_RATIO
+        kept = 0
+        fold_until = len(messages)
+        while fold_until > covered:
+            kept += message_tokens(messages[fold_until - 1].content)
+            if kept > keep_tokens:
+                break
+            fold_until -= 1
+        # 残す部分がユーザーの発話から始まるよう、やり取りの途中では区切らない
+        while fold_until < len(messages) and messages[fold_until].role != "user":
+            fold_until += 1
+        # 最新のメッセージは原文のまま残す
+        return min(fold_until, len(messages) - 1)
+
+    def _summarize(self, messages: list[Message], previous: ChatSummary | None) -> None:
+        """前回の要約と新たに古くなったターンから要約を作る（executor上）."""
+        covered = previous.covered if previous is not None else 0
+        transcript = "\n".join(f"{m.role}: {m.content}" for m in messages[covered:])
+        if previous is not None:
+            transcript = f"{SUMMARY_PREFIX}{previous.text}\n\n{transcript}"
+        text = self._llm.generate(
+            [
+                LLMMessage(role="system", content=SUMMARY_INSTRUCTION),
+                LLMMessage(role="user", content=transcript),
+            ]
+        ).strip()
+        if not text:
+            return
+        with self._lock:
+            self._summary = ChatSummary(text=text, covered=len(messages))
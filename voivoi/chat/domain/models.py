@@ -18,9 +18,10 @@ class Message:
     role: Role
     content: str
     created_at: datetime
+    interrupted: bool = False  # 応答の途中でユーザーが割り込んだ場合True
 
     @classmethod
-    def create(cls, role: Role, content: str) -> Message:
+    def create(cls, role: Role, content: str, interrupted: bool = False) -> Message:
         """新規メッセージを作成する."""
         if role not in VALID_ROLES:
             msg = f"role must be one of {VALID_ROLES}, got '{role}'"
@@ -28,12 +29,25 @@ class Message:
         if not content:
             msg = "content must not be empty"
             raise ValueError(msg)
-        return cls(role=role, content=content, created_at=datetime.now(timezone.utc))
+        return cls(
+            role=role,
+            content=content,
+            created_at=datetime.now(timezone.utc),
+            interrupted=interrupted,
+        )
 
     @classmethod
-    def restore(cls, role: Role, content: str, created_at: datetime) -> Message:
+    def restore(
+        cls,
+        role: Role,
+        content: str,
+        created_at: datetime,
+        interrupted: bool = False,
+    ) -> Message:
         """永続化データからメッセージを復元する."""
-        return cls(role=role, content=content, created_at=created_at)
+        return cls(
+            role=role, content=content, created_at=created_at, interrupted=interrupted
+        )
 
 
 @dataclass
@@ -69,8 +83,16 @@ class Chat:
             id=id, messages=messages, created_at=created_at, updated_at=updated_at
         )
 
-    def add_message(self, role: Role, content: str) -> None:
+    def add_message(self, role: Role, content: str, interrupted: bool = False) -> None:
         """メッセージを追加する."""
-        message = Message.create(role=role, content=content)
+        message = Message.create(role=role, content=content, interrupted=interrupted)
         self.messages.append(message)
         self.updated_at = message.created_at
+
+
+@dataclass(frozen=True)
+class ChatSummary:
+    """チャットの古いメッセージの要約."""
+
+    text: str
+    covered: int  # 要約に含めた先頭からのメッセージ数
@@ -4,7 +4,7 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
-from voivoi.chat.domain.models import Chat, Message
+from voivoi.chat.domain.models import Chat, ChatSummary, Message
 
 
 def save_chat(chat: Chat, path: Path) -> None:
@@ -12,14 +12,15 @@ def save_chat(chat: Chat, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
         for message in chat.messages:
-            line = json.dumps(
-                {
-                    "role": message.role,
-                    "content": message.content,
-                    "created_at": message.created_at.isoformat(),
-                },
-                ensure_ascii=False,
-            )
+            data: dict[str, object] = {
+                "role": message.role,
+                "content": message.content,
+                "created_at": message.created_at.isoformat(),
+            }
+            # 中断されたメッセージだけに記録し、既存の形式との互換性を保つ
+            if message.interrupted:
+                data["interrupted"] = True
+            line = json.dumps(data, ensure_ascii=False)
             f.write(line + "\n")
 
 
@@ -39,6 +40,7 @@ def load_chat(path: Path) -> Chat | None:
                 role=data["role"],
                 content=data["content"],
                 created_at=created_at,
+                interrupted=data.get("interrupted", False),
             )
             messages.append(message)
 
@@ -56,6 +58,13 @@ def load_chat(path: Path) -> Chat | None:
     )
 
 
+def save_summary(summary: ChatSummary, path: Path) -> None:
+    """チャットの要約を保存する."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"text": summary.text, "covered": summary.covered}
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
 def list_chats(chats_dir: Path) -> list[Chat]:
     """全チャットを取得する."""
     if not chats_dir.exists():
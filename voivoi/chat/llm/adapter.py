@@ -2,17 +2,83 @@
 
 from __future__ import annotations
 
+import contextlib
+import socket
+import ssl
+import threading
+from collections.abc import Generator, Iterable, Iterator
+from typing import Any, Final
+
+import httpcore
+import httpx
 import ollama
 from ollama import ResponseError
 
-from voivoi.chat.llm.port import LLMConnectionError, LLMMessage
+from voivoi.chat.llm.port import LLMConnectionError, LLMMessage, LLMStream, LLMUsage
+
+DEFAULT_HOST: Final[str] = "http://127.0.0.1:11434"
+DEFAULT_TIMEOUT: Final[float] = 120.0  # 接続・トークン受信ごとの待ち時間の上限（秒）
+DEFAULT_KEEP_ALIVE: Final[float | str] = -1  # 負の値はOllamaにモデルを残し続ける
+DEFAULT_NUM_CTX: Final[int] = 8192  # コンテキスト長（トークン数）
+
+# Ollamaへの接続の失敗（サーバーのエラー応答・接続不可・タイムアウト）
+_CONNECTION_ERRORS = (ResponseError, ConnectionError, httpx.TransportError)
 
 
 class OllamaAdapter:
-    """Ollamaを使用したLLM実装."""
+    """Ollamaを使用したLLM実装.
+
+    接続を使い回すため、ホストとタイムアウトを設定したクライアントを1つ持ち続ける。
+    すべてのリクエストにkeep_aliveを指定し、会話の途中でモデルが
+    アンロードされて読み込み直しの待ち時間が発生しないようにする。
 
-    def __init__(self, model: str) -> None:
+    Ollamaは前回のリクエストとプロンプトの先頭が一致する部分のKVキャッシュを
+    再利用するため、会話履歴をそのまま送れば新しいメッセージだけを評価する。
+    オプションが変わるとモデルが読み込み直されてキャッシュが失われるため、
+    ウォームアップを含むすべてのリクエストで同じnum_ctxを指定する。
+    ストリーミングで評価したプロンプトのトークン数と時間はlast_usageで取得できる。
+    ストリーミングは使い回した接続でも、取り消した時点でその接続だけを切る。
+    """
+
+    def __init__(
+        self,
+        model: str,
+        host: str = DEFAULT_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        keep_alive: float | str = DEFAULT_KEEP_ALIVE,
+        num_ctx: int = DEFAULT_NUM_CTX,
+    ) -> None:
         self._model = model
+        self._keep_alive = keep_alive
+        self._options = {"num_ctx": num_ctx}
+        self._client = ollama.Client(host=host, timeout=timeout)
+        self._transport = _StreamTransport()
+        self._stream_client = ollama.Client(
+            host=host, timeout=timeout, transport=self._transport
+        )
+        self._last_usage: LLMUsage | None = None
+
+    @property
+    def last_usage(self) -> LLMUsage | None:
+        """直前のストリーミングで評価したプロンプトの量（最後まで受信しなければNone）."""
+        return self._last_usage
+
+    def warm_up(self) -> None:
+        """モデルをOllamaに読み込ませ、初回応答の待ち時間を減らす.
+
+        Raises:
+            LLMConnectionError: Ollamaへの接続に失敗した場合
+        """
+        # メッセージなしのリクエストはモデルの読み込みだけを行う
+        self._chat([])
+
+    def unload(self) -> None:
+        """Ollamaからモデルをアンロードし、メモリを解放する.
+
+        Raises:
+            LLMConnectionError: Ollamaへの接続に失敗した場合
+        """
+        self._chat([], keep_alive=0)
 
     def generate(self, messages: list[LLMMessage]) -> str:
         """メッセージリストから応答を生成する.
@@ -20,9 +86,217 @@ class OllamaAdapter:
         Raises:
             LLMConnectionError: Ollamaへの接続に失敗した場合
         """
+        response = self._chat(self._to_ollama_messages(messages))
+        return response["message"]["content"]
+
+    def stream(self, messages: list[LLMMessage]) -> LLMStream:
+        """メッセージリストから応答を生成し、届いた順にテキストの断片を返す.
+
+        返したストリームのcancelで（プロンプトの評価中でも）すぐに接続を切り、
+        Ollamaに生成を止めさせる。
+
+        Raises:
+            LLMConnectionError: Ollamaへの接続に失敗した場合（反復中に送出）
+        """
+        connection = _StreamConnection()
+        return LLMStream(
+            self._stream_chunks(messages, connection), on_cancel=connection.close
+        )
+
+    def _stream_chunks(
+        self, messages: list[LLMMessage], connection: _StreamConnection
+    ) -> Iterator[str]:
+        """ストリーミングでチャットAPIを呼び出し、空でない断片を返す."""
+        self._last_usage = None
+        try:
+            chunks = self._stream_client.chat(
+                model=self._model,
+                messages=self._to_ollama_messages(messages),
+                stream=True,
+                options=self._options,
+                keep_alive=self._keep_alive,
+            )
+            try:
+                # リクエストは最初の反復で送られるため、その間に接続を記録させる
+                with self._transport.bind(connection):
+                    chunk = next(chunks, None)
+                while chunk is not None:
+                    content = chunk["message"]["content"]
+                    if content:
+                        yield content
+                    if chunk.get("done"):
+                        self._last_usage = self._to_usage(chunk)
+                        # 受信を終えた接続はプールに戻るため、以降の取り消しでは切らない
+                        connection.release()
+                    chunk = next(chunks, None)
+            finally:
+                connection.release()
+                # 途中で閉じられた場合も、すぐに接続を切って生成を止めさせる
+                if isinstance(chunks, Generator):
+                    chunks.close()
+        except _CONNECTION_ERRORS as e:
+            raise LLMConnectionError(str(e)) from e
+
+    def _chat(
+        self, messages: list[dict[str, str]], keep_alive: float | str | None = None
+    ) -> Any:
+        """ストリーミングなしでチャットAPIを呼び出す."""
         try:
-            ollama_messages = [{"role": m.role, "content": m.content} for m in messages]
-            response = ollama.chat(model=self._model, messages=ollama_messages)
-            return response["message"]["content"]
-        except ResponseError as e:
+            return self._client.chat(
+                model=self._model,
+                messages=messages,
+                options=self._options,
+                keep_alive=self._keep_alive if keep_alive is None else keep_alive,
+            )
+        except _CONNECTION_ERRORS as e:
             raise LLMConnectionError(str(e)) from e
+
+    def _to_ollama_messages(self, messages: list[LLMMessage]) -> list[dict[str, str]]:
+        """メッセージをOllamaのリクエスト形式に変換する."""
+        return [{"role": m.role, "content": m.content} for m in messages]
+
+    def _to_usage(self, chunk: Any) -> LLMUsage:
+        """最後の断片の統計からプロンプトの評価量を取り出す."""
+        # プロンプト全体がキャッシュにあった場合、Ollamaは評価量を省略することがある
+        return LLMUsage(
+            prompt_tokens=chunk.get("prompt_eval_count") or 0,
+            prefill_ms=(chunk.get("prompt_eval_duration") or 0) / 1_000_000,
+        )
+
+
+class _StreamConnection:
+    """ストリーミングの接続を他のスレッドから切断するためのハンドル."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._closed = False
+        self._released = False
+
+    def attach(self, sock: socket.socket) -> None:
+        """リクエストを送ったソケットを記録する（取り消し済みならすぐに切断する）."""
+        with self._lock:
+            if self._released:
+                return
+            self._socket = sock
+            closed = self._closed
+        if closed:
+            _shutdown(sock)
+
+    def release(self) -> None:
+        """ソケットを手放し、以降の取り消しで切断しないようにする."""
+        with self._lock:
+            self._released = True
+            self._socket = None
+
+    def close(self) -> None:
+        """ソケットを切断し、応答を待っている読み込みをすぐに終わらせる."""
+        with self._lock:
+            self._closed = True
+            sock = self._socket
+        if sock is not None:
+            _shutdown(sock)
+
+
+class _StreamTransport(httpx.HTTPTransport):
+    """ストリーミング用のトランスポート.
+
+    接続はプールで使い回し、リクエストを送ったソケットを、呼び出し元の
+    スレッドに結び付けた_StreamConnectionに記録させる。新しく張った接続でも
+    プールから取り出した接続でも、取り消しでは実行中のリクエストの接続だけを切る。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._local = threading.local()
+        # httpxは接続の作り方を差し替える引数を持たないため、同じ設定でプールを作り直す
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        self._pool = httpcore.ConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_TrackingBackend(self._local),
+        )
+
+    @contextlib.contextmanager
+    def bind(self, connection: _StreamConnection) -> Iterator[None]:
+        """このスレッドのリクエストの接続をconnectionに記録させる."""
+        previous = getattr(self._local, "connection", None)
+        self._local.connection = connection
+        try:
+            yield
+        finally:
+            self._local.connection = previous
+
+
+class _TrackingBackend(httpcore.NetworkBackend):
+    """送信したスレッドに結び付いた_StreamConnectionへソケットを記録させる接続を張る."""
+
+    def __init__(self, local: threading.local) -> None:
+        self._backend = httpcore.SyncBackend()
+        self._local = local
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.NetworkStream:
+        stream = self._backend.connect_tcp(
+            host, port, timeout, local_address, socket_options
+        )
+        return _TrackingStream(stream, self._local)
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.NetworkStream:
+        stream = self._backend.connect_unix_socket(path, timeout, socket_options)
+        return _TrackingStream(stream, self._local)
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+class _TrackingStream(httpcore.NetworkStream):
+    """書き込みのたびに、送信したスレッドの_StreamConnectionへソケットを記録する."""
+
+    def __init__(self, stream: httpcore.NetworkStream, local: threading.local) -> None:
+        self._stream = stream
+        self._local = local
+
+    def read(self, max_bytes: int, timeout: float | None = None) -> bytes:
+        return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: float | None = None) -> None:
+        connection: _StreamConnection | None = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.attach(self._stream.get_extra_info("socket"))
+        self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: str | None = None,
+        timeout: float | None = None,
+    ) -> httpcore.NetworkStream:
+        stream = self._stream.start_tls(ssl_context, server_hostname, timeout)
+        return _TrackingStream(stream, self._local)
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+def _shutdown(sock: socket.socket) -> None:
+    """ソケットの送受信を止める（別のスレッドで待っている読み込みも終わる）."""
+    # 既に閉じられている場合は何もしない
+    with contextlib.suppress(OSError):
+        sock.shutdown(socket.SHUT_RDWR)
@@ -0,0 +1,240 @@
+"""LLMの応答キャッシュ（よく聞かれる質問への応答を使い回す）モジュール."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from voivoi.chat.llm.port import (
+    LLMMessage,
+    LLMPort,
+    LLMStream,
+    LLMUsage,
+    UnloadableLLM,
+    UsageReportingLLM,
+)
+from voivoi.chat.llm.router import RoutingLLM
+
+DEFAULT_TTL_SECONDS: Final[float] = 3600.0
+DEFAULT_MAX_ENTRIES: Final[int] = 256
+DEFAULT_MAX_DEPTH: Final[int] = 1  # 会話の最初の質問だけをキャッシュする
+DEFAULT_WINDOW: Final[int] = 1  # キーに含める末尾のメッセージ数
+
+# 言い回しの揺れとみなして無視する文字（空白と文末・文中の句読点）
+_IGNORED_CHARACTERS: Final[re.Pattern[str]] = re.compile(r"[\s、。，．！？!?,.]+")
+
+# 保存済みのキャッシュが読めない場合（存在しない・壊れている・形式が違う）
+_CACHE_LOAD_ERRORS = (OSError, ValueError, TypeError, KeyError)
+
+
+def get_cache_dir() -> Path:
+    """LLMの応答キャッシュのディレクトリのパスを取得する."""
+    return Path.home() / ".local" / "share" / "voivoi" / "cache"
+
+
+def normalize_prompt(text: str) -> str:
+    """全角・半角、大文字・小文字、空白と句読点の違いを吸収する."""
+    normalized = unicodedata.normalize("NFKC", text).lower()
+    return _IGNORED_CHARACTERS.sub(" ", normalized).strip()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """応答キャッシュのヒット数とミス数."""
+
+    hits: int
+    misses: int
+
+
+class CachedLLM:
+    """同じ質問への応答をキャッシュから返すLLM.
+
+    キーは応答させるモデル名と、正規化した末尾window件のメッセージ。
+    RoutingLLMを包む場合、小さいモデルに振り分ける発話はfast_modelの応答として扱い
+    （fast_modelを省略した場合はキャッシュしない）、大きいモデルの遅れを
+    小さいモデルが補った（hedge）応答は保存しない。文脈によって応答が変わらないよう、ユーザーの発話がmax_depth件以下の会話だけを対象にし、
+    systemメッセージ（会話の要約など）を含むリクエストはキャッシュしない。
+    エントリーはttl_seconds後に失効し、max_entriesを超えると最も使われていない
+    ものから削除する。pathを指定すると、応答を保存するたびにJSONに書き出す。
+    ストリーミングは最後まで受信した応答だけを保存し、ヒットした場合は
+    保存済みの応答を1つの断片として返す。
+    """
+
+    def __init__(
+        self,
+        llm: LLMPort,
+        model: str,
+        path: Path | None = None,
+        fast_model: str | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        window: int = DEFAULT_WINDOW,
+    ) -> None:
+        self._llm = llm
+        self._model = model
+        self._fast_model = fast_model
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._max_depth = max_depth
+        self._window = window
+        self._lock = threading.Lock()
+        # キー → (応答, 保存した時刻（time.time）)。末尾ほど最近使ったもの
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._last_hit = False
+        if path is not None:
+            self._load(path)
+
+    @property
+    def llm(self) -> LLMPort:
+        """キャッシュで包んでいるLLM."""
+        return self._llm
+
+    @property
+    def stats(self) -> CacheStats:
+        """これまでのヒット数とミス数."""
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses)
+
+    @property
+    def last_usage(self) -> LLMUsage | None:
+        """直前の応答でLLMが評価したプロンプトの量（キャッシュから返した場合None）."""
+        if self._last_hit or not isinstance(self._llm, UsageReportingLLM):
+            return None
+        return self._llm.last_usage
+
+    def generate(self, messages: list[LLMMessage]) -> str:
+        """キャッシュにあれば保存済みの応答を、なければLLMの応答を返す."""
+        key = self._key(messages)
+        if key is not None and (cached := self._lookup(key)) is not None:
+            return cached
+        response = self._llm.generate(messages)
+        if key is not None and self._answered_by_keyed_model():
+            self._store(key, response)
+        return response
+
+    def stream(self, messages: list[LLMMessage]) -> LLMStream:
+        """キャッシュにあれば保存済みの応答を、なければLLMの応答を逐次返す."""
+        self._last_hit = False
+        key = self._key(messages)
+        if key is not None and (cached := self._lookup(key)) is not None:
+            return LLMStream(iter([cached]))
+        stream = self._llm.stream(messages)
+        if key is None:
+            return stream
+        return LLMStream(
+            self._store_when_complete(key, stream), on_cancel=stream.cancel
+        )
+
+    def unload(self) -> None:
+        """包んでいるLLMのモデルをアンロードする."""
+        if isinstance(self._llm, UnloadableLLM):
+            self._llm.unload()
+
+    def _key(self, messages: list[LLMMessage]) -> str | None:
+        """キャッシュのキーを返す（キャッシュの対象外ならNone）."""
+        depth = sum(1 for m in messages if m.role == "user")
+        if depth > self._max_depth or any(m.role == "system" for m in messages):
+            return None
+        model = self._model_for(messages)
+        if model is None:
+            return None
+        window = [
+            [m.role, normalize_prompt(m.content)] for m in messages[-self._window :]
+        ]
+        data = json.dumps([model, window], ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _model_for(self, messages: list[LLMMessage]) -> str | None:
+        """リクエストに応答させるモデル名を返す（分からなければNone）."""
+        if isinstance(self._llm, RoutingLLM) and self._llm.route(messages) == "fast":
+            return self._fast_model
+        return self._model
+
+    def _answered_by_keyed_model(self) -> bool:
+        """直前の応答が、キーに含めたモデルによるものかどうかを判定する."""
+        return not (
+            isinstance(self._llm, RoutingLLM) and self._llm.last_route == "hedge"
+        )
+
+    def _lookup(self, key: str) -> str | None:
+        """キャッシュから応答を取り出し、ヒット数とミス数を数える."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[1] > self._ttl_seconds:
+                del self._entries[key]
+                entry = None
+            self._last_hit = entry is not None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _store(self, key: str, response: str) -> None:
+        """応答をキャッシュに保存し、上限を超えた古いエントリーを削除する."""
+        if not response:
+            return
+        with self._lock:
+            self._entries[key] = (response, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            entries = list(self._entries.items())
+        if self._path is not None:
+            self._save(self._path, entries)
+
+    def _store_when_complete(self, key: str, stream: LLMStream) -> Iterator[str]:
+        """応答を中継し、最後まで受信できたらキャッシュに保存する."""
+        chunks: list[str] = []
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            stream.close()
+        if not stream.cancelled and self._answered_by_keyed_model():
+            self._store(key, "".join(chunks))
+
+    def _load(self, path: Path) -> None:
+        """保存済みのキャッシュを読み込む（読めない場合は空のまま始める）."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entries = [(e["key"], e["response"], e["created_at"]) for e in data]
+        except _CACHE_LOAD_ERRORS:
+            return
+        now = time.time()
+        for key, response, created_at in entries[-self._max_entries :]:
+            if now - created_at <= self._ttl_seconds:
+                self._entries[key] = (response, created_at)
+
+    def _save(self, path: Path, entries: list[tuple[str, tuple[str, float]]]) -> None:
+        """キャッシュをJSONに書き出す（古いものから順に並べる）."""
+        data = [
+            {"key": key, "response": response, "created_at": created_at}
+            for key, (response, created_at) in entries
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 書き込み途中のファイルを読まないよう、一時ファイルに書いてから置き換える
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            Path(tmp_name).write_text(json.dumps(data, ensure_ascii=False), "utf-8")
+            Path(tmp_name).replace(path)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
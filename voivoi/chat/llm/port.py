@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Generator, Iterator
 from dataclasses import dataclass
-from typing import Literal, Protocol
+from typing import Literal, Protocol, Self, runtime_checkable
 
 LLMRole = Literal["user", "assistant", "system"]
 
@@ -16,11 +18,90 @@ class LLMMessage:
     content: str
 
 
+@dataclass(frozen=True)
+class LLMUsage:
+    """1回の応答生成でLLMが処理したプロンプトの量."""
+
+    # 新たに評価したプロンプトのトークン数（KVキャッシュを再利用した部分は含まない）
+    prompt_tokens: int
+    # プロンプトの評価（プレフィル）にかかった時間
+    prefill_ms: float
+
+
 class LLMConnectionError(Exception):
     """LLMへの接続に失敗した場合のエラー."""
 
 
+class LLMStream:
+    """LLMの応答の断片を届いた順に返し、生成を途中で取り消せるイテレーター.
+
+    cancelは他のスレッドから呼べる。取り消すと次の断片が届いた時点で反復を終え、
+    元のストリームを閉じて接続を切る（Ollamaは接続が切れると生成を止める）。
+    on_cancelを渡すと取り消した時点で呼び出し、プロンプトの評価中のように断片が
+    届かない間でも接続を切る。その後に元のストリームが送出したエラーは反復の終了として扱う。
+    """
+
+    def __init__(
+        self, chunks: Iterator[str], on_cancel: Callable[[], None] | None = None
+    ) -> None:
+        self._chunks = chunks
+        self._on_cancel = on_cancel
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """生成を取り消した場合True."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """生成を取り消す."""
+        self._cancelled.set()
+        if self._on_cancel is not None:
+            self._on_cancel()
+
+    def close(self) -> None:
+        """元のストリームを閉じる（反復しているスレッドから呼ぶ）."""
+        if isinstance(self._chunks, Generator):
+            self._chunks.close()
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> str:
+        if not self._cancelled.is_set():
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                raise
+            except Exception:
+                # 取り消しで接続を切ったことによるエラーは送出しない
+                if not self._cancelled.is_set():
+                    raise
+            else:
+                if not self._cancelled.is_set():
+                    return chunk
+        self.close()
+        raise StopIteration
+
+
 class LLMPort(Protocol):
     """LLMプロバイダーのインターフェース（依存注入用）."""
 
     def generate(self, messages: list[LLMMessage]) -> str: ...
+
+    def stream(self, messages: list[LLMMessage]) -> LLMStream: ...
+
+
+@runtime_checkable
+class UnloadableLLM(Protocol):
+    """セッションの終了時にモデルをメモリから解放できるLLM."""
+
+    def unload(self) -> None: ...
+
+
+@runtime_checkable
+class UsageReportingLLM(Protocol):
+    """直前の応答生成で処理したプロンプトの量を報告できるLLM."""
+
+    @property
+    def last_usage(self) -> LLMUsage | None: ...
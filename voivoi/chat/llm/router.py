@@ -0,0 +1,235 @@
+"""発話に応じて小さいモデルと大きいモデルを使い分けるLLMルーター."""
+
+from __future__ import annotations
+
+import queue
+import statistics
+import threading
+import time
+import unicodedata
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Final, Literal
+
+from voivoi.chat.llm.port import (
+    LLMMessage,
+    LLMPort,
+    LLMStream,
+    LLMUsage,
+    UnloadableLLM,
+    UsageReportingLLM,
+)
+
+# 応答したモデルの経路（hedgeは大きいモデルの遅れを小さいモデルが補った場合）
+Route = Literal["fast", "primary", "hedge"]
+ROUTES: Final[tuple[Route, ...]] = ("fast", "primary", "hedge")
+
+# 応答の断片を中継するスレッドからの通知（候補の番号と、断片・終了(None)・例外）
+_Event = tuple[int, str | Exception | None]
+
+
+@dataclass(frozen=True)
+class RouteLatency:
+    """経路ごとの最初のトークンまでの時間の分布."""
+
+    route: Route
+    count: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+
+
+class RoutingLLM:
+    """短い発話は小さいモデルに、それ以外は大きいモデル（primary）に送るLLM.
+
+    最後のユーザーの発話がmax_fast_chars文字以下なら小さいモデルで応答する。
+    hedge_after_msを指定すると、大きいモデルの最初のトークンがその時間内に
+    届かない場合（またはエラーの場合）に小さいモデルにも同じリクエストを送り、
+    先に最初のトークンを返した方の応答を使う。もう一方は取り消して接続を切る。
+    経路ごとの最初のトークンまでの時間を記録し、latenciesで百分位数を返す。
+    last_routeとlast_usageは直前の呼び出しの結果のため、応答を生成するスレッドだけが
+    使う（会話の要約のように別のスレッドで生成する場合はprimaryを直接使う）。
+    """
+
+    def __init__(
+        self,
+        primary: LLMPort,
+        fast: LLMPort,
+        max_fast_chars: int,
+        hedge_after_ms: float | None = None,
+    ) -> None:
+        self._primary = primary
+        self._fast = fast
+        self._max_fast_chars = max_fast_chars
+        self._hedge_after_ms = hedge_after_ms
+        self._lock = threading.Lock()
+        self._ttfts: dict[Route, list[float]] = {route: [] for route in ROUTES}
+        self._last: LLMPort | None = None  # 直前に応答したモデル
+        self._last_route: Route | None = None
+
+    @property
+    def latencies(self) -> list[RouteLatency]:
+        """応答のあった経路ごとの最初のトークンまでの時間の百分位数."""
+        with self._lock:
+            samples: dict[Route, list[float]] = {
+                route: list(ttfts) for route, ttfts in self._ttfts.items()
+            }
+        return [_to_latency(route, ttfts) for route, ttfts in samples.items() if ttfts]
+
+    @property
+    def primary(self) -> LLMPort:
+        """大きいモデル."""
+        return self._primary
+
+    @property
+    def last_route(self) -> Route | None:
+        """直前に応答した経路（応答していなければNone）."""
+        return self._last_route
+
+    @property
+    def last_usage(self) -> LLMUsage | None:
+        """直前に応答したモデルが報告したプロンプトの評価量."""
+        llm = self._last
+        return llm.last_usage if isinstance(llm, UsageReportingLLM) else None
+
+    def route(self, messages: list[LLMMessage]) -> Route:
+        """最後のユーザーの発話の長さから、応答させるモデルの経路を決める."""
+        text = next((m.content for m in reversed(messages) if m.role == "user"), "")
+        length = len(unicodedata.normalize("NFKC", text).strip())
+        return "fast" if length <= self._max_fast_chars else "primary"
+
+    def generate(self, messages: list[LLMMessage]) -> str:
+        """振り分けたモデルで応答を生成する（ヘッジしない）."""
+        route = self.route(messages)
+        llm = self._fast if route == "fast" else self._primary
+        self._last, self._last_route = llm, route
+        return llm.generate(messages)
+
+    def stream(self, messages: list[LLMMessage]) -> LLMStream:
+        """振り分けたモデルで応答を逐次生成する（取り消しはモデルのストリームに伝える）."""
+        if self.route(messages) == "fast":
+            return self._relay("fast", self._fast, messages)
+        if self._hedge_after_ms is None:
+            return self._relay("primary", self._primary, messages)
+        candidates: list[tuple[Route, LLMPort, LLMStream]] = []
+        return LLMStream(
+            self._hedged(messages, self._hedge_after_ms / 1000, candidates),
+            on_cancel=lambda: _cancel_all(candidates),
+        )
+
+    def unload(self) -> None:
+        """両方のモデルをアンロードする."""
+        for llm in (self._primary, self._fast):
+            if isinstance(llm, UnloadableLLM):
+                llm.unload()
+
+    def _relay(
+        self, route: Route, llm: LLMPort, messages: list[LLMMessage]
+    ) -> LLMStream:
+        """1つのモデルの応答を中継し、最初のトークンまでの時間を記録する."""
+        start = time.perf_counter()
+        stream = llm.stream(messages)
+        self._last, self._last_route = llm, route
+
+        def chunks() -> Iterator[str]:
+            try:
+                for i, chunk in enumerate(stream):
+                    if i == 0:
+                        self._record(route, start)
+                    yield chunk
+            finally:
+                stream.close()
+
+        return LLMStream(chunks(), on_cancel=stream.cancel)
+
+    def _hedged(
+        self,
+        messages: list[LLMMessage],
+        hedge_after: float,
+        candidates: list[tuple[Route, LLMPort, LLMStream]],
+    ) -> Iterator[str]:
+        """大きいモデルが遅れたら小さいモデルにも送り、先に答えた方を中継する."""
+        start = time.perf_counter()
+        events: queue.Queue[_Event] = queue.Queue()
+        failed: set[int] = set()
+
+        def launch(route: Route, llm: LLMPort) -> None:
+            index = len(candidates)
+            stream = llm.stream(messages)
+            candidates.append((route, llm, stream))
+            threading.Thread(
+                target=_pump, args=(index, stream, events), daemon=True
+            ).start()
+
+        try:
+            launch("primary", self._primary)
+            while True:
+                hedged = len(candidates) > 1
+                try:
+                    index, payload = events.get(timeout=None if hedged else hedge_after)
+                except queue.Empty:
+                    launch("hedge", self._fast)
+                    continue
+                if not isinstance(payload, Exception):
+                    break
+                failed.add(index)
+                if len(failed) == len(candidates):
+                    if hedged:
+                        raise payload
+                    # 大きいモデルが失敗した場合は、待たずに小さいモデルに切り替える
+                    launch("hedge", self._fast)
+
+            route, llm, _ = candidates[index]
+            for other, (_, _, stream) in enumerate(candidates):
+                if other != index:
+                    stream.cancel()
+            self._last, self._last_route = llm, route
+            self._record(route, start)
+            while isinstance(payload, str):
+                yield payload
+                payload = _next_from(events, index)
+            if isinstance(payload, Exception):
+                raise payload
+        finally:
+            _cancel_all(candidates)
+
+    def _record(self, route: Route, start: float) -> None:
+        """経路の最初のトークンまでの時間を記録する."""
+        with self._lock:
+            self._ttfts[route].append((time.perf_counter() - start) * 1000)
+
+
+def _cancel_all(candidates: list[tuple[Route, LLMPort, LLMStream]]) -> None:
+    """すべての候補のモデルのストリームを取り消す（他のスレッドから呼べる）."""
+    for _, _, stream in list(candidates):
+        stream.cancel()
+
+
+def _pump(index: int, stream: LLMStream, events: queue.Queue[_Event]) -> None:
+    """候補のモデルの応答の断片を順にキューへ送る（取り消されると終了する）."""
+    try:
+        for chunk in stream:
+            events.put((index, chunk))
+        events.put((index, None))
+    except Exception as e:
+        events.put((index, e))
+
+
+def _next_from(events: queue.Queue[_Event], index: int) -> str | Exception | None:
+    """指定した候補からの次の通知を返す（取り消した候補の残りは読み捨てる）."""
+    while True:
+        source, payload = events.get()
+        if source == index:
+            return payload
+
+
+def _to_latency(route: Route, ttfts: list[float]) -> RouteLatency:
+    """最初のトークンまでの時間の一覧から百分位数を求める."""
+    if len(ttfts) == 1:
+        p50 = p90 = p99 = ttfts[0]
+    else:
+        cuts = statistics.quantiles(ttfts, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    return RouteLatency(
+        route=route, count=len(ttfts), p50_ms=p50, p90_ms=p90, p99_ms=p99
+    )
@@ -0,0 +1,44 @@
+"""会話ターンごとの応答時間の計測モジュール."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TurnMetrics:
+    """1ターンの応答時間の計測結果."""
+
+    turn: int
+    # LLMへのリクエストから最初のトークンが届くまでの時間（届かなければNone）
+    ttft_ms: float | None
+    # LLMへのリクエストから最初の文の読み上げを始めるまでの時間（読み上げなければNone）
+    ttfa_ms: float | None
+    # LLMが新たに評価したプロンプトのトークン数と評価時間（報告がなければNone）
+    prompt_tokens: int | None = None
+    prefill_ms: float | None = None
+
+
+class FirstTokenTimer:
+    """テキストの断片を中継しながら、最初の断片が届くまでの時間を計る.
+
+    計測は反復を始めた時点（LLMへのリクエスト）から開始する。
+    """
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = chunks
+        self._elapsed_ms: float | None = None
+
+    @property
+    def elapsed_ms(self) -> float | None:
+        """最初の断片が届くまでの時間（ミリ秒、まだ届いていなければNone）."""
+        return self._elapsed_ms
+
+    def __iter__(self) -> Iterator[str]:
+        start = time.perf_counter()
+        for chunk in self._chunks:
+            if self._elapsed_ms is None:
+                self._elapsed_ms = (time.perf_counter() - start) * 1000
+            yield chunk
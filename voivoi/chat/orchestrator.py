@@ -2,64 +2,309 @@
 
 from __future__ import annotations
 
-import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Final
 
+from voivoi.chat.audio.meter import rms_level
+from voivoi.chat.audio.pcm import duration_ms
 from voivoi.chat.audio.wav import save_wav
+from voivoi.chat.context import ContextWindow
 from voivoi.chat.domain.models import Chat
-from voivoi.chat.llm.port import LLMMessage, LLMPort
-from voivoi.chat.stt.port import SilentAudioError, STTPort
+from voivoi.chat.llm.cache import normalize_prompt
+from voivoi.chat.llm.port import LLMMessage, LLMPort, LLMStream, UsageReportingLLM
+from voivoi.chat.metrics import FirstTokenTimer, TurnMetrics
+from voivoi.chat.stt.port import SilentAudioError, STTPort, TranscribeResult
+from voivoi.chat.stt.streaming import (
+    DEFAULT_MAX_WINDOW_MS,
+    DEFAULT_STEP_MS,
+    StreamingTranscriber,
+)
+from voivoi.chat.tts.pipeline import SpeechPipeline
 from voivoi.chat.tts.port import TTSPort
-from voivoi.chat.ui import print_ai_message, print_user_message
+from voivoi.chat.ui import (
+    print_partial,
+    print_status,
+    print_user_message,
+    stream_ai_message,
+)
+
+# 応答を止める音声コマンド（空白と句読点を除き、小文字にして比較する）
+STOP_COMMANDS: Final[frozenset[str]] = frozenset(
+    {"ストップ", "止めて", "とめて", "やめて", "stop"}
+)
+
+# 割り込み（barge_in）と判定する発話の長さと音量。スピーカーから回り込んだ
+# 読み上げの音声や咳で応答を止めないよう、VADの閾値より大きな声が続く必要がある
+DEFAULT_BARGE_IN_MS: Final[int] = 200
+DEFAULT_BARGE_IN_THRESHOLD: Final[float] = 0.05
+
+
+def is_stop_command(text: str) -> bool:
+    """発話が応答を止める音声コマンドかどうかを判定する."""
+    return normalize_prompt(text).replace(" ", "") in STOP_COMMANDS
 
 
 class ChatOrchestrator:
-    """音声入力→STT→LLM→TTSの統合フロー."""
+    """音声入力→STT→LLM→TTSの統合フロー.
+
+    SpeechObserverとしてリスナーに渡すと、発話の音声をwindow_msの窓ごとに
+    文字起こしし（窓の最後のセグメントは次の窓と重ねる）、発話終了時に1つのターンに
+    まとめる。streamingを有効にすると、窓が埋まるのを待たずに発話中から逐次
+    文字起こしを進め、発話終了後は未確定の末尾だけを認識する。
+    LLMの応答は届いた順に表示し、文が区切れるたびに生成と並行して読み上げる。
+    最初のトークンと最初の読み上げまでの時間はターンごとに記録する。
+    LLMには毎回同じ並びの会話履歴を送り、前のターンまでのプロンプトのKVキャッシュを
+    再利用させる。LLMが報告したプロンプトの評価量（プレフィル）もターンごとに記録する。
+    contextを渡すと会話履歴をトークン予算内に収め、古いターンは応答の後に要約する。
+
+    barge_inを有効にすると、応答中にbarge_in_threshold（正規化RMS）を超える音量の
+    発話がbarge_in_ms続いたとき（on_speech_chunk）にLLMの生成と読み上げを中断し、
+    聞かせた部分までを中断された応答として記録する。
+    barge_inが無効なら、応答中に録音した発話（スピーカーから回り込んだ読み上げなど）は
+    捨て（last_utterance_ignored）、次のターンにしない。
+    リスナーはprocess_audioとは別のスレッドで動かし続ける必要がある。
+    応答中の発話はstreamingの設定によらず逐次文字起こしし、途中の認識結果が
+    「ストップ」などの音声コマンド（STOP_COMMANDS）になった時点で、barge_inの設定に
+    よらず応答を中断する。音声コマンドはLLMに送らず、会話履歴にも残さない。
+    """
 
     def __init__(
         self,
         stt: STTPort,
         llm: LLMPort,
         tts: TTSPort,
-        temp_dir: Path | None = None,
+        debug_audio_dir: Path | None = None,
+        streaming: bool = False,
+        executor: Executor | None = None,
+        barge_in: bool = False,
+        context: ContextWindow | None = None,
+        barge_in_ms: int = DEFAULT_BARGE_IN_MS,
+        barge_in_threshold: float = DEFAULT_BARGE_IN_THRESHOLD,
+        window_ms: int = DEFAULT_MAX_WINDOW_MS,
     ) -> None:
         self._stt = stt
         self._llm = llm
         self._tts = tts
-        self._temp_dir = temp_dir or Path(tempfile.gettempdir())
+        self._debug_audio_dir = debug_audio_dir
         self._chat = Chat.create()
+        self._turn_count = 0
+        self._metrics: list[TurnMetrics] = []
+        self._streaming = streaming
+        # STTモデルを同時に使わないよう、文字起こしはすべてワーカー1つで直列に実行する
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
+        self._executor = executor
+        self._window_ms = window_ms
+        self._stream: StreamingTranscriber | None = None
+        self._finished: deque[StreamingTranscriber] = deque()
+        self._barge_in = barge_in
+        self._barge_in_ms = barge_in_ms
+        self._barge_in_threshold = barge_in_threshold
+        self._loud_ms = 0.0  # 発話中に閾値を超える音量が続いている時間
+        self._heard_in_turn = False  # 録音中の発話が応答中に重なった場合True
+        self._ignored = False  # 直前に終わった発話を捨てた場合True
+        self._lock = threading.Lock()
+        self._in_turn = False  # process_audioの実行中True
+        self._speech: SpeechPipeline | None = None  # 応答中の読み上げ
+        self._reply: LLMStream | None = None  # 生成中の応答
+        self._interrupted = threading.Event()
+        self._context = context
+
+    def on_speech_start(self) -> None:
+        """発話開始時に窓ごとの文字起こし（streamingなら逐次文字起こし）を開始する."""
+        self._loud_ms = 0.0
+        self._heard_in_turn = self._in_turn
+        # 応答中は、音声コマンドを聞き取るためにstreamingが無効でも逐次文字起こしする
+        incremental = self._streaming or self._in_turn
+        # 捨てる発話の途中経過は、表示中の応答に混ぜない
+        quiet = not self._streaming or (self._in_turn and not self._barge_in)
+        self._stream = StreamingTranscriber(
+            stt=self._stt,
+            executor=self._executor,
+            step_ms=DEFAULT_STEP_MS if incremental else self._window_ms,
+            max_window_ms=self._window_ms,
+            on_partial=None if quiet else print_partial,
+            on_hypothesis=self._stop_on_command,
+        )
+
+    def on_speech_chunk(self, data: bytes) -> None:
+        """発話中の音声チャンクを逐次文字起こしに渡し、割り込みを判定する."""
+        if self._in_turn:
+            self._heard_in_turn = True
+        if self._barge_in:
+            self._detect_barge_in(data)
+        if self._stream is not None:
+            self._stream.feed(data)
+
+    def on_speech_end(self, audio_data: bytes) -> None:
+        """発話終了時に逐次文字起こしを確定待ちにする（捨てる発話なら破棄する）."""
+        stream, self._stream = self._stream, None
+        self._ignored = self._heard_in_turn and not self._barge_in
+        if stream is not None and not self._ignored:
+            self._finished.append(stream)
+
+    @property
+    def last_utterance_ignored(self) -> bool:
+        """直前に終わった発話を、応答中に録音した音声として捨てたかどうか."""
+        return self._ignored
+
+    def _stop_on_command(self, text: str) -> None:
+        """発話途中の認識結果が音声コマンドなら応答を中断する（STTのスレッド）."""
+        if is_stop_command(text):
+            self.interrupt()
+
+    def _detect_barge_in(self, data: bytes) -> None:
+        """大きな声がbarge_in_ms続いたら応答を中断する."""
+        if rms_level(data) > self._barge_in_threshold:
+            self._loud_ms += duration_ms(data)
+        else:
+            self._loud_ms = 0.0
+        if self._loud_ms >= self._barge_in_ms:
+            self.interrupt()
+
+    def interrupt(self) -> bool:
+        """処理中のターンのLLMの生成と読み上げを中断する（他スレッドから呼べる）.
+
+        LLMの呼び出し前に中断した場合、そのターンでは応答しない。
+        新たにターンを中断した場合Trueを返す（処理中でないか、中断済みならFalse）。
+        """
+        with self._lock:
+            if not self._in_turn or self._interrupted.is_set():
+                return False
+            self._interrupted.set()
+            reply = self._reply
+            speech = self._speech
+        if reply is not None:
+            reply.cancel()
+        if speech is not None:
+            speech.cancel()
+        return True
 
     def process_audio(self, audio_data: bytes) -> None:
         """音声データを処理して応答を生成し、読み上げる."""
-        # 音声データをWAVファイルに保存
-        wav_path = self._temp_dir / "temp_audio.wav"
-        save_wav(audio_data, wav_path)
+        with self._lock:
+            self._in_turn = True
+            self._interrupted.clear()
+        try:
+            self._process_turn(audio_data)
+        finally:
+            with self._lock:
+                self._in_turn = False
 
-        # STT: 音声→テキスト
+    def _process_turn(self, audio_data: bytes) -> None:
+        """1ターン分の文字起こし・応答生成・読み上げを行う."""
+        self._turn_count += 1
+        # デバッグ用に発話ごとのWAVファイルを残す（STTには使わない）
+        if self._debug_audio_dir is not None:
+            self._save_debug_audio(audio_data, self._debug_audio_dir)
+
+        # STT: 音声→テキスト（PCMをメモリ上のまま渡す）
         try:
-            result = self._stt.transcribe(wav_path)
+            result = self._transcribe(audio_data)
         except SilentAudioError:
             return
 
         user_text = result.text
         print_user_message(user_text)
+        if is_stop_command(user_text):
+            # 応答中なら発話の途中で中断済みのため、コマンド自体には応答しない
+            print_status("(stopped)")
+            return
+        if result.truncated:
+            print_status("(transcription cut short: repeated output detected)")
 
         # ユーザーメッセージを会話履歴に追加
         self._chat.add_message("user", user_text)
+        if self._interrupted.is_set():
+            # 文字起こし中にユーザーが話し続けた場合は、次の発話と合わせて応答する
+            return
 
-        # LLM: 応答生成（現在の会話履歴を渡す）
-        llm_messages = [
-            LLMMessage(role=m.role, content=m.content) for m in self._chat.messages
-        ]
-        response = self._llm.generate(llm_messages)
-        print_ai_message(response)
+        # LLM: 応答生成（現在の会話履歴を渡し、届いた順に表示する）
+        # 履歴は過去のメッセージを書き換えずに送り、前回のプロンプトを先頭に一致させる
+        # TTS: 文が区切れるたびに、続きの生成と並行して読み上げる
+        llm_messages = self._llm_messages()
+        requested_at = time.perf_counter()
+        reply = self._llm.stream(llm_messages)
+        timer = FirstTokenTimer(reply)
+        speech = SpeechPipeline(self._tts)
+        with self._lock:
+            self._reply = reply
+            self._speech = speech
+            if self._interrupted.is_set():
+                # 文字起こしの後、生成を始めるまでの間に中断された場合
+                reply.cancel()
+        try:
+            with speech:
+                response = stream_ai_message(speech.speak_along(timer))
+        finally:
+            with self._lock:
+                self._reply = None
+                self._speech = None
+            # 例外で抜けた場合も接続を切り、Ollamaに生成を止めさせる
+            reply.close()
+
+        usage = (
+            self._llm.last_usage if isinstance(self._llm, UsageReportingLLM) else None
+        )
+        self._metrics.append(
+            TurnMetrics(
+                turn=self._turn_count,
+                ttft_ms=timer.elapsed_ms,
+                ttfa_ms=(
+                    (speech.first_audio_at - requested_at) * 1000
+                    if speech.first_audio_at is not None
+                    else None
+                ),
+                prompt_tokens=usage.prompt_tokens if usage is not None else None,
+                prefill_ms=usage.prefill_ms if usage is not None else None,
+            )
+        )
 
         # アシスタントの応答を会話履歴に追加
-        self._chat.add_message("assistant", response)
+        if not self._interrupted.is_set():
+            self._chat.add_message("assistant", response)
+        else:
+            # 中断した応答は、読み上げを始めた部分（なければ表示した部分）までを記録する
+            print_status("(interrupted)")
+            if heard := speech.spoken_text or response:
+                self._chat.add_message("assistant", heard, interrupted=True)
+        # 応答を終えてから古いターンを要約し、次の発話までの間に済ませる
+        if self._context is not None:
+            self._context.compact(self._chat.messages)
+
+    def _llm_messages(self) -> list[LLMMessage]:
+        """LLMに送る会話履歴を作る（contextがあればトークン予算内に収める）."""
+        if self._context is not None:
+            return self._context.build(self._chat.messages)
+        return [LLMMessage(role=m.role, content=m.content) for m in self._chat.messages]
 
-        # TTS: テキスト→音声
-        self._tts.speak(response)
+    def _transcribe(self, audio_data: bytes) -> TranscribeResult:
+        """発話を文字起こしする（窓ごとに文字起こし済みなら未確定の末尾のみ）."""
+        if self._finished:
+            return self._finished.popleft().finish()
+        # 応答中の発話の逐次文字起こしと同時にモデルを使わないよう、同じワーカーで実行する
+        return self._executor.submit(self._stt.transcribe, audio_data).result()
+
+    def _save_debug_audio(self, audio_data: bytes, directory: Path) -> None:
+        """発話の音声をチャットIDとターン番号で一意なWAVファイルに保存する."""
+        directory.mkdir(parents=True, exist_ok=True)
+        save_wav(audio_data, directory / f"{self._chat.id}-{self._turn_count:04d}.wav")
 
     def get_chat(self) -> Chat:
         """会話履歴を取得する."""
         return self._chat
+
+    @property
+    def metrics(self) -> list[TurnMetrics]:
+        """応答したターンごとの応答時間."""
+        return list(self._metrics)
+
+    def close(self) -> None:
+        """文字起こし用のスレッドを停止する."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,119 @@
+"""起動時のコンポーネント読み込み（バックグラウンド初期化）モジュール."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from voivoi.chat.llm.port import (
+    LLMMessage,
+    LLMPort,
+    LLMStream,
+    LLMUsage,
+    UsageReportingLLM,
+)
+from voivoi.chat.stt.port import AudioInput, STTPort, TranscribeResult
+from voivoi.chat.tts.port import TTSPort
+
+
+class BackgroundLoader:
+    """重いコンポーネントの初期化を並行してバックグラウンドで実行する.
+
+    初期化を待たずにマイクの録音を始められるよう、各コンポーネントはFutureとして返す。
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 3,
+        on_loaded: Callable[[str, float], None] | None = None,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="loader"
+        )
+        self._on_loaded = on_loaded
+        self._lock = threading.Lock()
+        self._timings: dict[str, float] = {}
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """初期化が完了したコンポーネントごとの所要時間（秒）."""
+        with self._lock:
+            return dict(self._timings)
+
+    def submit[T](self, name: str, factory: Callable[[], T]) -> Future[T]:
+        """コンポーネントの初期化を開始する."""
+
+        def load() -> T:
+            start = time.perf_counter()
+            component = factory()
+            self._record(name, time.perf_counter() - start)
+            return component
+
+        return self._executor.submit(load)
+
+    def shutdown(self) -> None:
+        """未開始の初期化を取り消し、実行中の初期化の完了を待つ."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _record(self, name: str, elapsed: float) -> None:
+        """初期化の所要時間を記録して通知する."""
+        with self._lock:
+            self._timings[name] = elapsed
+        if self._on_loaded is not None:
+            self._on_loaded(name, elapsed)
+
+
+class DeferredSTT:
+    """初期化中のSTTを包み、初回の呼び出し時に完了を待つ."""
+
+    def __init__(self, future: Future[STTPort]) -> None:
+        self._future = future
+
+    def transcribe(self, audio: AudioInput) -> TranscribeResult:
+        """初期化の完了を待ってから文字起こしする."""
+        return self._future.result().transcribe(audio)
+
+
+class DeferredLLM:
+    """初期化中のLLMを包み、初回の呼び出し時に完了を待つ."""
+
+    def __init__(self, future: Future[LLMPort]) -> None:
+        self._future = future
+
+    def generate(self, messages: list[LLMMessage]) -> str:
+        """初期化の完了を待ってから応答を生成する."""
+        return self._future.result().generate(messages)
+
+    def stream(self, messages: list[LLMMessage]) -> LLMStream:
+        """初期化の完了を待ってから応答を逐次生成する."""
+        return self._future.result().stream(messages)
+
+    @property
+    def last_usage(self) -> LLMUsage | None:
+        """初期化済みのLLMが報告した直前のプロンプトの評価量."""
+        if not self._future.done() or self._future.exception() is not None:
+            return None
+        llm = self._future.result()
+        return llm.last_usage if isinstance(llm, UsageReportingLLM) else None
+
+
+class DeferredTTS:
+    """初期化中のTTSを包み、初回の呼び出し時に完了を待つ."""
+
+    def __init__(self, future: Future[TTSPort]) -> None:
+        self._future = future
+
+    def speak(self, text: str) -> None:
+        """初期化の完了を待ってから読み上げる."""
+        self._future.result().speak(text)
+
+    def speak_async(self, text: str) -> Future[None]:
+        """初期化の完了を待ってから読み上げを予約する."""
+        return self._future.result().speak_async(text)
+
+    def cancel(self) -> None:
+        """初期化済みなら読み上げを中断する（初期化中は読み上げていないため何もしない）."""
+        if self._future.done() and self._future.exception() is None:
+            self._future.result().cancel()
@@ -2,18 +2,38 @@
 
 from __future__ import annotations
 
+import math
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, Final, NotRequired, TypedDict
 
+import numpy as np
+import torch
 import whisper
+from numpy.typing import NDArray
+from whisper.audio import CHUNK_LENGTH, SAMPLE_RATE
+from whisper.tokenizer import Tokenizer, get_tokenizer
 
-from voivoi.chat.stt.port import SilentAudioError, TranscribeResult
+from voivoi.chat.stt.guard import DecodeAbortedError, DecodeGuard
+from voivoi.chat.stt.model_input import to_model_input
+from voivoi.chat.stt.port import (
+    AudioInput,
+    DecodingOptions,
+    SilentAudioError,
+    TranscribeResult,
+    TranscribeSegment,
+)
+
+# 短い発話でも打ち切らずに済むトークン数の下限
+MIN_TOKEN_BUDGET: Final[int] = 32
 
 
 class WhisperSegment(TypedDict):
     """Whisperのセグメント出力."""
 
     no_speech_prob: float
+    start: NotRequired[float]
+    end: NotRequired[float]
+    text: NotRequired[str]
 
 
 class WhisperOutput(TypedDict):
@@ -24,22 +44,57 @@ class WhisperOutput(TypedDict):
 
 
 class WhisperAdapter:
-    """Whisperを使用したSTT実装."""
-
-    def __init__(self, model_name: str = "base", language: str = "ja") -> None:
-        self._model = whisper.load_model(model_name)
+    """Whisperを使用したSTT実装.
+
+    quantizeを指定するとLinear層をint8に動的量子化し、CPUでの推論を速くする。
+    decodingを省略した場合はWhisperの既定のデコード設定を使う。
+    decodingでトークン数や時間の上限を指定すると、同じ語句を繰り返す暴走デコードを
+    途中で打ち切り、生成済みの部分をtruncated=Trueの結果として返す。
+    """
+
+    def __init__(
+        self,
+        model_name: str = "base",
+        language: str = "ja",
+        quantize: bool = False,
+        cache_dir: Path | None = None,
+        decoding: DecodingOptions | None = None,
+    ) -> None:
+        if decoding is not None and decoding.threads > 0:
+            torch.set_num_threads(decoding.threads)
+        if quantize:
+            from voivoi.chat.stt.quantize import (
+                get_model_cache_dir,
+                load_quantized_model,
+            )
+
+            self._model = load_quantized_model(
+                model_name, cache_dir or get_model_cache_dir()
+            )
+        else:
+            self._model = whisper.load_model(model_name)
         self._language = language
+        self._decoding = decoding
+        self._decode_options = self._to_decode_options(decoding)
+
+    def transcribe(self, audio: AudioInput) -> TranscribeResult:
+        """音声をテキストに変換する.
 
-    def transcribe(self, audio_path: Path) -> TranscribeResult:
-        """音声ファイルをテキストに変換する.
+        PCMのバイト列や配列はメモリ上のまま渡し、ffmpegによるデコードを省く。
 
         Raises:
             SilentAudioError: 無音または音声を認識できなかった場合
         """
-        # fp16=False でCPU使用時の警告を抑制
-        raw_result = self._model.transcribe(
-            str(audio_path), language=self._language, fp16=False
-        )
+        model_input = to_model_input(audio)
+        guard = self._create_guard(model_input)
+        if guard is None:
+            raw_result = self._decode(model_input)
+        else:
+            try:
+                with guard:
+                    raw_result = self._decode(model_input)
+            except DecodeAbortedError:
+                return self._truncated_result(guard)
         result = WhisperOutput(
             text=raw_result["text"],
             segments=raw_result.get("segments", []),
@@ -48,11 +103,118 @@ class WhisperAdapter:
         transcribe_result = TranscribeResult(
             text=result["text"].strip(),
             no_speech_prob=no_speech_prob,
+            segments=tuple(
+                TranscribeSegment(
+                    start=segment.get("start", 0.0),
+                    end=segment.get("end", 0.0),
+                    text=segment.get("text", ""),
+                )
+                for segment in result["segments"]
+            ),
         )
         if transcribe_result.is_silent:
             raise SilentAudioError("音声を認識できませんでした")
         return transcribe_result
 
+    def no_speech_prob(self, audio: AudioInput) -> float:
+        """エンコーダーとデコーダーの1ステップだけで無音確率を推定する.
+
+        フルデコードの前に無音・雑音のみの発話を判定するために使う。
+        """
+        model_input = to_model_input(audio)
+        samples = (
+            whisper.load_audio(model_input)
+            if isinstance(model_input, str)
+            else model_input
+        )
+        mel = whisper.log_mel_spectrogram(
+            whisper.pad_or_trim(samples), n_mels=self._model.dims.n_mels
+        )
+        tokenizer = self._tokenizer()
+        with torch.no_grad():
+            audio_features = self._model.embed_audio(mel.unsqueeze(0))
+            tokens = torch.tensor(
+                [tokenizer.sot_sequence], device=audio_features.device
+            )
+            # SOTトークンの直後に<|nospeech|>が来る確率（Whisperの判定と同じ位置）
+            logits = self._model.logits(tokens, audio_features)[:, 0]
+            probs = logits.float().softmax(dim=-1)
+        return float(probs[0, tokenizer.no_speech])
+
+    def _decode(self, model_input: str | NDArray[np.float32]) -> dict[str, Any]:
+        """Whisperのtranscribeを実行する."""
+        # fp16=False でCPU使用時の警告を抑制
+        return self._model.transcribe(
+            model_input,
+            language=self._language,
+            fp16=False,
+            **self._decode_options,
+        )
+
+    def _tokenizer(self) -> Tokenizer:
+        """モデルと言語に対応するトークナイザーを返す（キャッシュされる）."""
+        return get_tokenizer(
+            self._model.is_multilingual,
+            num_languages=self._model.num_languages,
+            language=self._language,
+            task="transcribe",
+        )
+
+    def _create_guard(
+        self, model_input: str | NDArray[np.float32]
+    ) -> DecodeGuard | None:
+        """デコード設定の上限から暴走デコードの監視を作る（上限がなければNone）."""
+        decoding = self._decoding
+        if decoding is None or (
+            decoding.max_tokens_per_second is None
+            and decoding.max_decode_seconds is None
+        ):
+            return None
+        # ファイル入力は長さが分からないため、1窓（30秒）分の予算を割り当てる
+        window_seconds = float(CHUNK_LENGTH)
+        if not isinstance(model_input, str):
+            window_seconds = min(window_seconds, len(model_input) / SAMPLE_RATE)
+        max_tokens = math.inf
+        if decoding.max_tokens_per_second is not None:
+            max_tokens = max(
+                MIN_TOKEN_BUDGET,
+                math.ceil(window_seconds * decoding.max_tokens_per_second),
+            )
+        return DecodeGuard(
+            self._model.decoder,
+            self._tokenizer(),
+            max_tokens=max_tokens,
+            max_seconds=decoding.max_decode_seconds or math.inf,
+            compression_ratio_threshold=decoding.compression_ratio_threshold,
+            beam_size=decoding.beam_size,
+        )
+
+    def _truncated_result(self, guard: DecodeGuard) -> TranscribeResult:
+        """打ち切ったデコードの生成済みテキストを結果として返す.
+
+        Raises:
+            SilentAudioError: 打ち切るまでにテキストを生成していなかった場合
+                （生成済みのテキストを追えないビームサーチの場合を含む）
+        """
+        text = guard.partial_text
+        if not text:
+            raise SilentAudioError("音声を認識できませんでした")
+        return TranscribeResult(text=text, no_speech_prob=0.0, truncated=True)
+
+    def _to_decode_options(self, decoding: DecodingOptions | None) -> dict[str, Any]:
+        """デコード設定をWhisperのtranscribeの引数に変換する."""
+        if decoding is None:
+            return {}
+        return {
+            # beam_sizeを指定しない場合、Whisperは貪欲法でデコードする
+            "beam_size": decoding.beam_size if decoding.beam_size > 1 else None,
+            "best_of": decoding.best_of,
+            "temperature": decoding.temperatures,
+            "compression_ratio_threshold": decoding.compression_ratio_threshold,
+            "logprob_threshold": decoding.logprob_threshold,
+            "condition_on_previous_text": decoding.condition_on_previous_text,
+        }
+
     def _extract_no_speech_prob(self, segments: list[WhisperSegment]) -> float:
         """セグメントからno_speech_probを抽出する."""
         if not segments:
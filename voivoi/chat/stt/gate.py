@@ -0,0 +1,103 @@
+"""無音の事前判定（フルデコード前の足切り）モジュール."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final, Protocol
+
+import numpy as np
+
+from voivoi.chat.audio.pcm import SAMPLE_RATE
+from voivoi.chat.audio.vad import DEFAULT_MIN_THRESHOLD, SpectralVAD
+from voivoi.chat.stt.port import (
+    AudioInput,
+    SilentAudioError,
+    STTPort,
+    TranscribeResult,
+)
+
+FRAME_SIZE: Final[int] = 480  # 信号判定のフレーム長（30ミリ秒）
+# これより発話らしいフレームが短い音声は無音とみなす
+DEFAULT_MIN_VOICED_MS: Final[int] = 90
+
+
+class NoSpeechDetector(Protocol):
+    """モデルによる無音確率の推定のインターフェース."""
+
+    def no_speech_prob(self, audio: AudioInput) -> float: ...
+
+
+@dataclass(frozen=True)
+class GateStats:
+    """無音の事前判定の統計情報."""
+
+    passed: int  # 文字起こしに進んだ回数
+    rejected_by_signal: int  # 信号の特徴量で無音と判定した回数
+    rejected_by_model: int  # モデルの無音確率で無音と判定した回数
+
+    @property
+    def rejected(self) -> int:
+        """フルデコードを省いた回数."""
+        return self.rejected_by_signal + self.rejected_by_model
+
+
+class SpeechGate:
+    """フルデコードの前に無音・雑音のみの音声を判定して除外するSTT.
+
+    まずPCMの特徴量（SpectralVAD）で発話らしいフレームの長さを数え、
+    短すぎる場合は即座に除外する。静かな部屋の小さな声を落とさないよう、
+    音量の閾値はAdaptiveVADの下限に合わせ、判定は主にスペクトルの形で行う。
+    次にdetectorがあれば、エンコーダーとデコーダーの1ステップだけで
+    無音確率を推定し、閾値を超えれば除外する。
+    """
+
+    def __init__(
+        self,
+        stt: STTPort,
+        detector: NoSpeechDetector | None = None,
+        vad: SpectralVAD | None = None,
+        min_voiced_ms: int = DEFAULT_MIN_VOICED_MS,
+        no_speech_threshold: float = TranscribeResult.SILENT_THRESHOLD,
+        sample_rate: int = SAMPLE_RATE,
+    ) -> None:
+        self._stt = stt
+        self._detector = detector
+        self._vad = vad or SpectralVAD(energy_threshold=DEFAULT_MIN_THRESHOLD)
+        self._min_voiced_ms = min_voiced_ms
+        self._no_speech_threshold = no_speech_threshold
+        self._sample_rate = sample_rate
+        self._passed = 0
+        self._rejected_by_signal = 0
+        self._rejected_by_model = 0
+
+    @property
+    def stats(self) -> GateStats:
+        """無音の事前判定の統計情報を取得する."""
+        return GateStats(
+            passed=self._passed,
+            rejected_by_signal=self._rejected_by_signal,
+            rejected_by_model=self._rejected_by_model,
+        )
+
+    def transcribe(self, audio: AudioInput) -> TranscribeResult:
+        """無音でなければ音声をテキストに変換する.
+
+        Raises:
+            SilentAudioError: 無音または音声を認識できなかった場合
+        """
+        if isinstance(audio, bytes) and self._voiced_ms(audio) < self._min_voiced_ms:
+            self._rejected_by_signal += 1
+            raise SilentAudioError("発話らしい音声がありません")
+        if (
+            self._detector is not None
+            and self._detector.no_speech_prob(audio) > self._no_speech_threshold
+        ):
+            self._rejected_by_model += 1
+            raise SilentAudioError("音声を認識できませんでした")
+        self._passed += 1
+        return self._stt.transcribe(audio)
+
+    def _voiced_ms(self, data: bytes) -> float:
+        """発話と判定されたフレームの合計時間（ミリ秒）を返す."""
+        voiced = int(np.count_nonzero(self._vad.detect(data, FRAME_SIZE)))
+        return voiced * FRAME_SIZE / self._sample_rate * 1000
@@ -0,0 +1,126 @@
+"""Whisperの暴走デコード（同じ語句の繰り返し）の打ち切りモジュール."""
+
+from __future__ import annotations
+
+import time
+from types import TracebackType
+from typing import Final, Self
+
+import torch
+from whisper.tokenizer import Tokenizer
+from whisper.utils import compression_ratio
+
+# 圧縮率を判定するのに十分なテキストが溜まるまでのトークン数
+MIN_TOKENS_FOR_RATIO: Final[int] = 32
+# 圧縮率を計算する間隔（トークン数）
+RATIO_CHECK_INTERVAL: Final[int] = 16
+# これ以上繰り返された末尾の語句を1回に縮める
+MIN_REPEATS: Final[int] = 3
+
+
+class DecodeAbortedError(Exception):
+    """デコードを途中で打ち切った場合のエラー（内部用）."""
+
+
+class DecodeGuard:
+    """Whisperのデコードを1トークンごとに監視し、暴走したら打ち切る.
+
+    デコーダーのフォワードフックでトークン数・経過時間・生成中のテキストの圧縮率を調べ、
+    上限を超えたらDecodeAbortedErrorを送出してtranscribeを中断する。
+    中断までに生成したテキストはpartial_textで取得できる。
+    ビームサーチ（beam_sizeが2以上）では候補がステップごとに並べ替えられ、フックからは
+    1つの候補のトークン列を追えないため、トークン数と時間の上限だけで打ち切り、
+    圧縮率の判定と生成済みテキストの取得は行わない。
+    """
+
+    def __init__(
+        self,
+        decoder: torch.nn.Module,
+        tokenizer: Tokenizer,
+        max_tokens: float,
+        max_seconds: float,
+        compression_ratio_threshold: float,
+        beam_size: int = 1,
+    ) -> None:
+        self._decoder = decoder
+        self._tokenizer = tokenizer
+        self._max_tokens = max_tokens
+        self._max_seconds = max_seconds
+        self._compression_ratio_threshold = compression_ratio_threshold
+        self._follow_text = beam_size <= 1
+        self._steps = 0  # 現在のデコードで生成したトークン数
+        self._tokens: list[int] = []  # 生成したトークン列（ビームサーチでは空）
+        self._deadline = 0.0
+        self._handle: torch.utils.hooks.RemovableHandle | None = None
+
+    @property
+    def partial_text(self) -> str:
+        """打ち切ったデコードで生成済みのテキスト（末尾の繰り返しは除く）.
+
+        ビームサーチでは生成済みのテキストを追えないため、常に空文字を返す。
+        """
+        text_tokens = [t for t in self._tokens if t < self._tokenizer.eot]
+        return trim_repetition(self._tokenizer.decode(text_tokens).strip())
+
+    def __enter__(self) -> Self:
+        self._steps = 0
+        self._tokens = []
+        self._deadline = time.perf_counter() + self._max_seconds
+        self._handle = self._decoder.register_forward_hook(self._on_step)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._handle is not None:
+            self._handle.remove()
+            self._handle = None
+
+    def _on_step(
+        self, module: torch.nn.Module, args: tuple[torch.Tensor, ...], output: object
+    ) -> None:
+        """デコーダーの1ステップごとに呼ばれ、上限を超えていれば打ち切る."""
+        tokens = args[0]
+        if tokens.shape[-1] > 1:
+            # KVキャッシュ使用時は2ステップ目以降に最後のトークンだけが渡されるため、
+            # 複数トークンの入力は新しいデコード（次の窓や温度フォールバック）の開始を示す
+            self._steps = 0
+            self._tokens = []
+        else:
+            self._steps += 1
+            if self._follow_text:
+                self._tokens.append(int(tokens[0, -1]))
+
+        if time.perf_counter() > self._deadline:
+            raise DecodeAbortedError("decode time limit exceeded")
+        if self._steps >= self._max_tokens:
+            raise DecodeAbortedError("token budget exceeded")
+        if (
+            self._follow_text
+            and len(self._tokens) >= MIN_TOKENS_FOR_RATIO
+            and len(self._tokens) % RATIO_CHECK_INTERVAL == 0
+            and compression_ratio(self._raw_text()) > self._compression_ratio_threshold
+        ):
+            raise DecodeAbortedError("repetition detected")
+
+    def _raw_text(self) -> str:
+        """生成中のテキストを返す."""
+        return self._tokenizer.decode(
+            [t for t in self._tokens if t < self._tokenizer.eot]
+        )
+
+
+def trim_repetition(text: str, min_repeats: int = MIN_REPEATS) -> str:
+    """末尾でmin_repeats回以上繰り返された語句を1回に縮める."""
+    for unit_length in range(1, len(text) // min_repeats + 1):
+        unit = text[-unit_length:]
+        if not text.endswith(unit * min_repeats):
+            continue
+        end = len(text)
+        while text[:end].endswith(unit * 2):
+            end -= unit_length
+        return text[:end].rstrip()
+    return text
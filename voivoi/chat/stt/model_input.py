@@ -0,0 +1,23 @@
+"""STTモデルへの入力変換モジュール."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voivoi.chat.audio.pcm import to_float32
+from voivoi.chat.stt.port import AudioInput
+
+
+def to_model_input(audio: AudioInput) -> str | NDArray[np.float32]:
+    """Whisper系モデルが受け付ける形式（ファイルパスまたはfloat32配列）に変換する.
+
+    PCMのバイト列はメモリ上のままfloat32配列にし、ffmpegによるデコードを省く。
+    """
+    if isinstance(audio, Path):
+        return str(audio)
+    if isinstance(audio, bytes):
+        return to_float32(audio)
+    return audio
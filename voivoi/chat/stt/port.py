@@ -6,11 +6,42 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import ClassVar, Final, Protocol
 
+import numpy as np
+from numpy.typing import NDArray
+
+# 音声ファイルのパス、16-bit PCMのバイト列、または-1.0〜1.0のfloat32配列
+AudioInput = Path | bytes | NDArray[np.float32]
+
+
+@dataclass(frozen=True)
+class DecodingOptions:
+    """文字起こしのデコード設定（既定値はWhisperの既定値）."""
+
+    beam_size: int = 5  # 1は貪欲法
+    best_of: int = 5
+    temperatures: tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+    compression_ratio_threshold: float = 2.4
+    logprob_threshold: float = -1.0
+    condition_on_previous_text: bool = True
+    threads: int = 0  # 0はライブラリの既定値
+    # 暴走デコードの打ち切り（Noneは無制限）
+    max_tokens_per_second: float | None = None  # 音声1秒あたりの生成トークン数の上限
+    max_decode_seconds: float | None = None  # 1回の文字起こしにかける時間の上限
+
 
 class SilentAudioError(Exception):
     """無音または音声を認識できなかった場合のエラー."""
 
 
+@dataclass(frozen=True)
+class TranscribeSegment:
+    """文字起こし結果の区間（時刻は入力音声の先頭からの秒数）."""
+
+    start: float
+    end: float
+    text: str
+
+
 @dataclass(frozen=True)
 class TranscribeResult:
     """文字起こし結果."""
@@ -20,6 +51,9 @@ class TranscribeResult:
 
     text: str
     no_speech_prob: float
+    segments: tuple[TranscribeSegment, ...] = ()
+    # デコードを途中で打ち切り、生成済みの部分だけを返した場合にTrue
+    truncated: bool = False
 
     @property
     def is_silent(self) -> bool:
@@ -30,4 +64,4 @@ class TranscribeResult:
 class STTPort(Protocol):
     """STTプロバイダーのインターフェース（依存注入用）."""
 
-    def transcribe(self, audio_path: Path) -> TranscribeResult: ...
+    def transcribe(self, audio: AudioInput) -> TranscribeResult: ...
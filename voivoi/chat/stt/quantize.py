@@ -0,0 +1,73 @@
+"""Whisperモデルのint8動的量子化モジュール."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import warnings
+from pathlib import Path
+
+import torch
+import whisper
+from whisper.model import Linear as WhisperLinear
+from whisper.model import Whisper
+
+# 壊れた・互換性のないキャッシュを読み込んだときに発生するエラー
+_CACHE_LOAD_ERRORS = (
+    OSError,
+    RuntimeError,
+    AttributeError,
+    EOFError,
+    pickle.UnpicklingError,
+)
+
+
+def get_model_cache_dir() -> Path:
+    """量子化済みモデルのキャッシュディレクトリのパスを取得する."""
+    return Path.home() / ".cache" / "voivoi" / "whisper"
+
+
+def quantize_model(model: Whisper) -> Whisper:
+    """Linear層の重みをint8に動的量子化する（CPU専用）.
+
+    活性はfloat32のまま推論時に量子化されるため、学習データなしで変換できる。
+    """
+    # WhisperのLinearは入力のdtypeに重みを合わせるだけのサブクラスで、
+    # quantize_dynamicは型が完全に一致するnn.Linearしか変換しないため差し替える
+    for module in model.modules():
+        if type(module) is WhisperLinear:
+            module.__class__ = torch.nn.Linear
+    with warnings.catch_warnings():
+        # torch.ao.quantizationの非推奨警告を起動のたびに表示しない
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+def load_quantized_model(model_name: str, cache_dir: Path) -> Whisper:
+    """int8量子化済みのWhisperモデルを読み込む.
+
+    初回は量子化した結果をcache_dirに保存し、以降の起動では変換を省く。
+    キャッシュはtorchのバージョンごとに分け、読めない場合は作り直す。
+    """
+    cache_path = cache_dir / f"{model_name}-int8-torch{torch.__version__}.pt"
+    if cache_path.exists():
+        try:
+            # 自身が書き出したモジュール全体のpickleのため、weights_onlyは使えない
+            return torch.load(cache_path, map_location="cpu", weights_only=False)
+        except _CACHE_LOAD_ERRORS:
+            cache_path.unlink(missing_ok=True)
+
+    model = quantize_model(whisper.load_model(model_name, device="cpu"))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # 書き込み途中のファイルを読まないよう、一時ファイルに書いてから置き換える
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        torch.save(model, tmp_name)
+        Path(tmp_name).replace(cache_path)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+    return model
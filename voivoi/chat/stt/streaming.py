@@ -0,0 +1,178 @@
+"""逐次文字起こし（ストリーミングSTT）モジュール."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from typing import Final
+
+from voivoi.chat.audio.pcm import SAMPLE_RATE, SAMPLE_WIDTH, duration_ms
+from voivoi.chat.stt.port import (
+    SilentAudioError,
+    STTPort,
+    TranscribeResult,
+    TranscribeSegment,
+)
+
+DEFAULT_STEP_MS: Final[int] = 1000  # 未確定部分を再認識する間隔
+DEFAULT_MAX_WINDOW_MS: Final[int] = 30000  # 未確定部分の上限（Whisperの1窓分）
+
+
+class StreamingTranscriber:
+    """発話中の音声を受け取り、安定した部分から逐次確定する文字起こし.
+
+    新しい音声がstep_ms溜まるごとに未確定部分（スライディングウィンドウ）を再認識し、
+    連続する2回の認識で一致した先頭のセグメントを確定する。確定した区間の音声は
+    ウィンドウから取り除くため、発話終了時の認識は未確定の末尾だけで済む。
+    一致しないまま未確定部分がmax_window_msを超えた場合は、最後のセグメントだけを
+    次の窓との重なりとして残し、それ以前を確定する。長い独り言でも認識は
+    一定の長さの窓ごとに進み、保持する音声の量も上限内に収まる。
+
+    on_partialには新たに確定したテキストを、on_hypothesisには再認識のたびに
+    確定済みと未確定を合わせたその時点の認識結果を渡す（音声コマンドの検出用）。
+
+    STTの呼び出しはすべてexecutor上で行う。モデルを共有する他の認識と
+    同時に実行されないよう、executorにはワーカー1つのものを渡す。
+    """
+
+    def __init__(
+        self,
+        stt: STTPort,
+        executor: Executor,
+        step_ms: int = DEFAULT_STEP_MS,
+        max_window_ms: int = DEFAULT_MAX_WINDOW_MS,
+        sample_rate: int = SAMPLE_RATE,
+        on_partial: Callable[[str], None] | None = None,
+        on_hypothesis: Callable[[str], None] | None = None,
+    ) -> None:
+        self._stt = stt
+        self._executor = executor
+        self._step_ms = step_ms
+        self._max_window_ms = max_window_ms
+        self._sample_rate = sample_rate
+        self._on_partial = on_partial
+        self._on_hypothesis = on_hypothesis
+        self._lock = threading.Lock()
+        self._window = bytearray()  # 未確定部分の音声
+        self._unprocessed_ms = 0.0  # 前回の認識以降に届いた音声の長さ
+        self._decoding = False
+        self._committed: list[str] = []  # 確定したセグメントのテキスト
+        self._previous: list[TranscribeSegment] = []  # 前回認識の未確定セグメント
+
+    @property
+    def committed_text(self) -> str:
+        """確定済みのテキスト."""
+        with self._lock:
+            return "".join(self._committed).strip()
+
+    def feed(self, chunk: bytes) -> None:
+        """音声チャンクを追加し、十分に溜まっていれば再認識を予約する."""
+        with self._lock:
+            self._window.extend(chunk)
+            self._unprocessed_ms += duration_ms(chunk, self._sample_rate)
+            if self._decoding or self._unprocessed_ms < self._step_ms:
+                return
+            self._decoding = True
+            self._unprocessed_ms = 0.0
+            window = bytes(self._window)
+        self._executor.submit(self._decode_window, window)
+
+    def finish(self) -> TranscribeResult:
+        """未確定の末尾を認識し、発話全体の文字起こし結果を返す.
+
+        Raises:
+            SilentAudioError: 発話全体で音声を認識できなかった場合
+        """
+        # 単一ワーカーのexecutorに積むことで、実行中の再認識の完了を待つ
+        return self._executor.submit(self._transcribe_tail).result()
+
+    def _decode_window(self, window: bytes) -> None:
+        """未確定部分を再認識し、前回と一致した先頭セグメントを確定する."""
+        try:
+            overflow = duration_ms(window, self._sample_rate) >= self._max_window_ms
+            try:
+                result = self._stt.transcribe(window)
+            except SilentAudioError:
+                if overflow:
+                    # 窓全体が無音なら、上限を超えた音声を持ち続けない
+                    with self._lock:
+                        del self._window[: len(window)]
+                        self._previous = []
+                return
+            segments = result.segments
+            if overflow and not segments:
+                # セグメントを返さないSTTでは、窓全体を1つのセグメントとみなす
+                window_seconds = duration_ms(window, self._sample_rate) / 1000
+                segments = (TranscribeSegment(0.0, window_seconds, result.text),)
+            # 最後のセグメントは発話の途中で切れている可能性があるため確定しない
+            stable = _common_prefix(self._previous, segments[:-1])
+            if overflow:
+                # 一致を待たずに確定し、最後のセグメントを次の窓との重なりとして残す。
+                # セグメントが1つしかなければ、窓全体を確定する
+                stable = list(segments[:-1] if len(segments) > 1 else segments)
+            # 窓全体を確定した場合は、最後のセグメントの後ろの音声も取り除く
+            whole = overflow and len(stable) == len(segments)
+            with self._lock:
+                hypothesis = "".join(self._committed) + result.text
+                if stable:
+                    self._commit(stable, len(window), whole=whole)
+                self._previous = list(segments[len(stable) :])
+            if stable and self._on_partial is not None:
+                self._on_partial("".join(s.text for s in stable).strip())
+            if self._on_hypothesis is not None:
+                self._on_hypothesis(hypothesis.strip())
+        finally:
+            with self._lock:
+                self._decoding = False
+
+    def _commit(
+        self,
+        segments: Sequence[TranscribeSegment],
+        window_bytes: int,
+        whole: bool = False,
+    ) -> None:
+        """確定したセグメントを記録し、その区間の音声をウィンドウから取り除く."""
+        self._committed.extend(segment.text for segment in segments)
+        end_sample = int(segments[-1].end * self._sample_rate)
+        end = window_bytes if whole else min(end_sample * SAMPLE_WIDTH, window_bytes)
+        del self._window[:end]
+
+    def _transcribe_tail(self) -> TranscribeResult:
+        """未確定の末尾を認識し、確定済みのテキストと結合する."""
+        with self._lock:
+            tail = bytes(self._window)
+            texts = list(self._committed)
+
+        tail_result: TranscribeResult | None = None
+        if tail:
+            try:
+                tail_result = self._stt.transcribe(tail)
+            except SilentAudioError:
+                tail_result = None
+        if tail_result is not None:
+            if tail_result.segments:
+                texts.extend(segment.text for segment in tail_result.segments)
+            else:
+                texts.append(tail_result.text)
+
+        text = "".join(texts).strip()
+        if not text:
+            raise SilentAudioError("音声を認識できませんでした")
+        return TranscribeResult(
+            text=text,
+            no_speech_prob=tail_result.no_speech_prob if tail_result else 0.0,
+            truncated=tail_result.truncated if tail_result else False,
+        )
+
+
+def _common_prefix(
+    previous: Sequence[TranscribeSegment], current: Sequence[TranscribeSegment]
+) -> list[TranscribeSegment]:
+    """2回の認識で先頭から同じテキストが続くセグメントを返す."""
+    stable: list[TranscribeSegment] = []
+    for before, after in zip(previous, current, strict=False):
+        if before.text.strip() != after.text.strip():
+            break
+        stable.append(after)
+    return stable
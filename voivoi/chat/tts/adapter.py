@@ -2,16 +2,113 @@
 
 from __future__ import annotations
 
+import queue
+import sys
+import threading
+from concurrent.futures import Future
+from typing import Any
+
 import pyttsx3
 
 
 class Pyttsx3Adapter:
-    """pyttsx3を使用したTTS実装."""
+    """pyttsx3を使用したTTS実装.
+
+    pyttsx3のエンジンは作成したスレッドでしか安全に使えないため、専用のワーカースレッドが
+    エンジンを持ち続け、読み上げ要求はキューで受け取る。speak_asyncは読み上げを待たずに
+    Futureを返し、完了の通知はそのadd_done_callbackで受け取れる。
+    cancelは中断の要求を記録するだけで、エンジンの停止はワーカーが読み上げ中の
+    コールバック（started-word）から行う。
+    macOSでは同一エンジンの再利用で問題が起きるため、読み上げごとに初期化する。
+    """
+
+    def __init__(self, reuse_engine: bool = sys.platform != "darwin") -> None:
+        self._reuse_engine = reuse_engine
+        self._queue: queue.Queue[tuple[str, Future[None]] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._engine: Any = None  # ワーカーが使い続けるエンジン
+        self._speaking = False  # ワーカーが読み上げ中の場合True
+        self._stop_requested = False  # 読み上げ中の音声の中断を要求された場合True
+
+    def warm_up(self) -> None:
+        """ワーカー上で音声合成ドライバーを読み込み、初回読み上げの待ち時間を減らす."""
+        self._submit("").result()
 
     def speak(self, text: str) -> None:
-        """テキストを音声で読み上げる."""
-        # macOSでは同一エンジンの再利用で問題が起きるため、毎回初期化
+        """テキストを音声で読み上げ、終わるまで待つ."""
+        self.speak_async(text).result()
+
+    def speak_async(self, text: str) -> Future[None]:
+        """読み上げを予約し、完了を表すFutureを返す."""
+        return self._submit(text)
+
+    def cancel(self) -> None:
+        """読み上げ中の音声を止め、予約済みの読み上げを取り消す."""
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                request[1].cancel()
+        with self._lock:
+            if self._speaking:
+                self._stop_requested = True
+
+    def _submit(self, text: str) -> Future[None]:
+        """読み上げ要求をワーカーのキューに積む（空文字はエンジンの初期化のみ）."""
+        future: Future[None] = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tts", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self) -> None:
+        """キューの読み上げ要求を順に処理する（ワーカースレッド）."""
+        while (request := self._queue.get()) is not None:
+            text, future = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self._speak(text)
+            except Exception as e:  # 呼び出し元にFuture経由で伝える
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+
+    def _speak(self, text: str) -> None:
+        """ワーカーのエンジンでテキストを読み上げる."""
+        engine = self._engine or self._init_engine()
+        if self._reuse_engine:
+            self._engine = engine
+        with self._lock:
+            self._speaking = True
+            self._stop_requested = False
+        try:
+            if text:
+                engine.say(text)
+                engine.runAndWait()
+        finally:
+            with self._lock:
+                self._speaking = False
+            if not self._reuse_engine:
+                engine.stop()
+
+    def _init_engine(self) -> Any:
+        """エンジンを作成し、読み上げ中に中断の要求を確かめるコールバックを登録する."""
         engine = pyttsx3.init()
-        engine.say(text)
-        engine.runAndWait()
-        engine.stop()
+
+        def stop_if_requested(*_: object) -> None:
+            with self._lock:
+                requested = self._stop_requested
+            if requested:
+                engine.stop()
+
+        engine.connect("started-utterance", stop_if_requested)
+        engine.connect("started-word", stop_if_requested)
+        return engine
@@ -0,0 +1,149 @@
+"""文単位の読み上げパイプライン（生成中の応答を文ごとに読み上げる）モジュール."""
+
+from __future__ import annotations
+
+import queue
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+from typing import Final, Self
+
+from voivoi.chat.tts.port import TTSPort
+
+# 文の区切り。日本語の句読点は次の文字が届いた時点で、英語の句読点は直後が空白の
+# 場合だけ（小数点や略語で区切らないため）区切る。閉じ括弧は同じ文に含める
+_SENTENCE_BOUNDARY: Final[re.Pattern[str]] = re.compile(
+    r"[。！？]+[」』）)\"']*(?=[^。！？」』）)\"'])|[.!?]+[)\"']*(?=\s)|\n"
+)
+
+
+class SentenceSplitter:
+    """逐次届くテキストを文の区切りで分割する."""
+
+    def __init__(self) -> None:
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> list[str]:
+        """テキストの断片を追加し、区切りが確定した文を返す.
+
+        文の前後の空白は取り除かないため、返した文をつなげると元のテキストに戻る。
+        """
+        self._buffer += chunk
+        sentences: list[str] = []
+        start = 0
+        for match in _SENTENCE_BOUNDARY.finditer(self._buffer):
+            sentences.append(self._buffer[start : match.end()])
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> str:
+        """区切りの来ていない残りのテキストを返す."""
+        rest, self._buffer = self._buffer, ""
+        return rest
+
+
+class SpeechPipeline:
+    """生成中の応答を文ごとにワーカースレッドで読み上げる.
+
+    feedで渡したテキストを文に区切って順にキューへ積み、最初の文の読み上げ中に
+    続きの文の生成を進める。ブロックを抜けると残りを読み上げ、完了を待つ。
+    ブロック内で例外が発生した場合やcancelした場合は、未着手の文を読み上げずに終了する。
+    """
+
+    def __init__(self, tts: TTSPort) -> None:
+        self._tts = tts
+        self._splitter = SentenceSplitter()
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="tts-pipeline", daemon=True
+        )
+        self._first_audio_at: float | None = None
+        self._started: list[str] = []  # 読み上げを始めた文
+        self._cancelled = threading.Event()
+        self._error: Exception | None = None
+
+    @property
+    def first_audio_at(self) -> float | None:
+        """最初の文の読み上げを開始した時刻（time.perf_counter、未開始ならNone）."""
+        return self._first_audio_at
+
+    @property
+    def spoken_text(self) -> str:
+        """読み上げを始めた文（中断された文を含む）をつなげたテキスト."""
+        return "".join(self._started).strip()
+
+    def speak_along(self, chunks: Iterable[str]) -> Iterator[str]:
+        """テキストの断片を中継しながら、区切りが確定した文を読み上げ待ちにする."""
+        for chunk in chunks:
+            self.feed(chunk)
+            yield chunk
+
+    def feed(self, chunk: str) -> None:
+        """テキストの断片を追加し、区切りが確定した文を読み上げ待ちにする."""
+        if self._cancelled.is_set():
+            return
+        for sentence in self._splitter.feed(chunk):
+            self._queue.put(sentence)
+
+    def cancel(self) -> None:
+        """未着手の文を取り消し、読み上げ中の音声を止める（他スレッドから呼べる）."""
+        self._cancelled.set()
+        self._discard_pending()
+        self._tts.cancel()
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None and not self._cancelled.is_set():
+            self._queue.put(self._splitter.flush())
+        else:
+            self._discard_pending()
+        self._queue.put(None)  # ワーカーへの終了の合図
+        self._thread.join()
+        # 中断した場合の読み上げの失敗（取り消しを含む）は送出しない
+        if (
+            exc_type is None
+            and self._error is not None
+            and not self._cancelled.is_set()
+        ):
+            raise self._error
+
+    def _run(self) -> None:
+        """キューの文を順に読み上げる（ワーカースレッド）."""
+        while (sentence := self._queue.get()) is not None:
+            if (
+                self._error is not None
+                or self._cancelled.is_set()
+                or not (text := sentence.strip())
+            ):
+                continue
+            if self._first_audio_at is None:
+                self._first_audio_at = time.perf_counter()
+            self._started.append(sentence)
+            try:
+                self._tts.speak(text)
+            except Exception as e:
+                # 呼び出し元のスレッドで送出し直すため、ここでは記録だけする
+                self._error = e
+
+    def _discard_pending(self) -> None:
+        """まだ読み上げていない文をキューから取り除く（終了の合図は残す）."""
+        while True:
+            try:
+                sentence = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if sentence is None:
+                # 終了の合図は最後に積まれるため、戻せばワーカーが最後に受け取る
+                self._queue.put(None)
+                return
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from typing import Protocol
 
 
@@ -9,3 +10,7 @@ class TTSPort(Protocol):
     """TTSプロバイダーのインターフェース（依存注入用）."""
 
     def speak(self, text: str) -> None: ...
+
+    def speak_async(self, text: str) -> Future[None]: ...
+
+    def cancel(self) -> None: ...
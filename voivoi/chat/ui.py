@@ -1,10 +1,17 @@
 """UI表示モジュール（Claude Code風スタイル）."""
 
+from collections.abc import Iterable
+from typing import Final
+
 from rich.console import Console
+from rich.live import Live
 from rich.text import Text
 
 console = Console()
 
+# 逐次表示の再描画回数の上限（トークンごとに描画すると端末が追いつかない）
+STREAM_REFRESH_PER_SECOND: Final[int] = 12
+
 
 def print_user_message(text: str) -> None:
     """ユーザーの発話を表示（> プレフィックス、背景色付き）."""
@@ -22,6 +29,32 @@ def print_ai_message(text: str) -> None:
     console.print(styled)
 
 
+def stream_ai_message(chunks: Iterable[str]) -> str:
+    """AIの発話を届いた順に表示し、全体のテキストを返す（● プレフィックス）.
+
+    再描画はSTREAM_REFRESH_PER_SECONDに間引き、表示は最後に確定した内容で残す。
+    """
+    styled = Text()
+    styled.append("● ", style="bold cyan")
+    parts: list[str] = []
+    with Live(
+        styled, console=console, refresh_per_second=STREAM_REFRESH_PER_SECOND
+    ) as live:
+        for chunk in chunks:
+            parts.append(chunk)
+            styled.append(chunk)
+            live.update(styled)
+    return "".join(parts)
+
+
+def print_partial(text: str) -> None:
+    """逐次文字起こしで確定したテキストを表示（… プレフィックス、薄いグレー）."""
+    styled = Text()
+    styled.append("… ", style="dim")
+    styled.append(text, style="dim")
+    console.print(styled)
+
+
 def print_status(text: str) -> None:
     """ステータスメッセージを表示（薄いグレー）."""
     console.print(text, style="dim")
@@ -14,12 +14,41 @@ def _print_config(config: Config) -> None:
     typer.echo()
     typer.echo(typer.style("  LLM", bold=True))
     typer.echo(f"    model: {config.llm.model}")
+    typer.echo(f"    host: {config.llm.host}")
+    typer.echo(f"    timeout: {config.llm.timeout}")
+    typer.echo(f"    keep_alive: {config.llm.keep_alive}")
+    typer.echo(f"    num_ctx: {config.llm.num_ctx}")
+    typer.echo(f"    context_tokens: {config.llm.context_tokens}")
+    typer.echo(f"    fast_model: {config.llm.fast_model}")
+    typer.echo(f"    route_max_chars: {config.llm.route_max_chars}")
+    typer.echo(f"    hedge_after_ms: {config.llm.hedge_after_ms}")
+    typer.echo("    cache:")
+    typer.echo(f"      enabled: {str(config.llm.cache.enabled).lower()}")
+    typer.echo(f"      ttl_seconds: {config.llm.cache.ttl_seconds}")
+    typer.echo(f"      max_entries: {config.llm.cache.max_entries}")
+    typer.echo(f"      max_depth: {config.llm.cache.max_depth}")
+    typer.echo(f"      window: {config.llm.cache.window}")
     typer.echo()
     typer.echo(typer.style("  STT", bold=True))
     typer.echo(f"    language: {config.stt.language}")
+    typer.echo(f"    backend: {config.stt.backend}")
+    typer.echo(f"    compute_type: {config.stt.compute_type}")
+    typer.echo(f"    quantize: {str(config.stt.quantize).lower()}")
+    typer.echo(f"    silence_precheck: {str(config.stt.silence_precheck).lower()}")
+    typer.echo(f"    profile: {config.stt.profile}")
+    typer.echo(f"    streaming: {str(config.stt.streaming).lower()}")
     typer.echo()
     typer.echo(typer.style("  TTS", bold=True))
     typer.echo(f"    enabled: {str(config.tts.enabled).lower()}")
+    typer.echo()
+    typer.echo(typer.style("  Audio", bold=True))
+    typer.echo(f"    vad: {config.audio.vad}")
+    typer.echo(f"    pre_roll_ms: {config.audio.pre_roll_ms}")
+    typer.echo(f"    silence_ms: {config.audio.silence_ms}")
+    typer.echo(f"    min_speech_ms: {config.audio.min_speech_ms}")
+    typer.echo(f"    max_utterance_ms: {config.audio.max_utterance_ms}")
+    typer.echo(f"    barge_in: {str(config.audio.barge_in).lower()}")
+    typer.echo(f"    barge_in_threshold: {config.audio.barge_in_threshold}")
 
 
 @app.command("init")
@@ -1,8 +1,9 @@
 """設定スキーマ定義."""
 
 from enum import StrEnum
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class LLMModel(StrEnum):
@@ -22,12 +23,113 @@ class STTLanguage(StrEnum):
     EN = "en"
 
 
+class STTBackend(StrEnum):
+    """許可されたSTTの実装."""
+
+    WHISPER = "whisper"
+    FASTER_WHISPER = "faster-whisper"
+
+
+class STTComputeType(StrEnum):
+    """faster-whisperで許可された計算精度."""
+
+    INT8 = "int8"
+    INT8_FLOAT32 = "int8_float32"
+    FLOAT32 = "float32"
+
+
+class VADType(StrEnum):
+    """許可されたVAD（音声検出）の種類."""
+
+    THRESHOLD = "threshold"
+    SPECTRAL = "spectral"
+    ADAPTIVE = "adaptive"
+
+
+class ResponseCacheConfig(BaseModel):
+    """LLMの応答キャッシュ設定."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = False
+    # 保存した応答を使い回す時間（秒）
+    ttl_seconds: float = Field(default=3600.0, gt=0)
+    # 保存する応答の上限（超えたら最も使われていないものから削除する）
+    max_entries: int = Field(default=256, gt=0)
+    # ユーザーの発話がこの件数以下の会話だけをキャッシュする（文脈に依存しない質問向け）
+    max_depth: int = Field(default=1, gt=0)
+    # キーに含める末尾のメッセージ数
+    window: int = Field(default=1, gt=0)
+
+
 class LLMConfig(BaseModel):
     """LLM設定."""
 
     model_config = ConfigDict(extra="forbid")
 
     model: LLMModel = LLMModel.LLAMA3_1
+    host: str = "http://127.0.0.1:11434"
+    # 接続・トークン受信ごとの待ち時間の上限（秒）
+    timeout: float = Field(default=120.0, gt=0)
+    # 応答後にモデルをメモリに残す時間（"30m"などの期間か秒数、負の値はセッション中ずっと）
+    keep_alive: int | str = -1
+    # コンテキスト長（トークン数）。すべてのリクエストで同じ値を送り、KVキャッシュを再利用させる
+    num_ctx: int = Field(default=8192, gt=0)
+    # 送信する会話履歴の上限（推定トークン数）。超えそうになると古いターンを要約する
+    context_tokens: int = Field(default=6144, gt=0)
+    # 短い発話に応答させる小さいモデル（route_max_charsかhedge_after_msを指定した場合）
+    fast_model: LLMModel = LLMModel.LLAMA3_2
+    # この文字数以下の発話はfast_modelで応答する（0は振り分けない）
+    route_max_chars: int = Field(default=0, ge=0)
+    # modelの最初のトークンがこの時間内に届かなければfast_modelにも送る（0はしない）
+    hedge_after_ms: int = Field(default=0, ge=0)
+    cache: ResponseCacheConfig = ResponseCacheConfig()
+
+
+class DecodingProfile(BaseModel):
+    """Whisperのデコード設定.
+
+    1セグメントあたりのデコード回数は最大でtemperaturesの要素数になるため、
+    要素数を減らすほど最悪時の文字起こし時間が短くなる。
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    # 1は貪欲法（ビームサーチなし）
+    beam_size: int = Field(default=1, ge=1)
+    # temperatureが0より大きいときにサンプリングする候補数
+    best_of: int = Field(default=1, ge=1)
+    # 品質が閾値を下回ったときに順に試す温度
+    temperatures: list[float] = Field(default=[0.0], min_length=1)
+    # これを超える圧縮率の結果は繰り返しとみなして次の温度を試す
+    compression_ratio_threshold: float = 2.4
+    # これを下回る平均対数確率の結果は失敗とみなして次の温度を試す
+    logprob_threshold: float = -1.0
+    # 直前のセグメントの文字起こし結果をプロンプトとして使う
+    condition_on_previous_text: bool = False
+    # 推論に使うスレッド数（0はライブラリの既定値）
+    threads: int = Field(default=0, ge=0)
+    # 音声1秒あたりの生成トークン数の上限（超えたら繰り返しとみなして打ち切る）
+    max_tokens_per_second: float = Field(default=15.0, gt=0)
+    # 1回の文字起こしにかける時間の上限（秒）
+    max_decode_seconds: float = Field(default=10.0, gt=0)
+
+
+DEFAULT_DECODING_PROFILES: dict[str, DecodingProfile] = {
+    # 温度フォールバックなしの貪欲法。1セグメント1回のデコードで済む
+    "fast": DecodingProfile(),
+    # フォールバックを1回に制限する
+    "balanced": DecodingProfile(best_of=2, temperatures=[0.0, 0.4]),
+    # Whisperの既定値と同等（最大6回のデコード）
+    "accurate": DecodingProfile(
+        beam_size=5,
+        best_of=5,
+        temperatures=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        condition_on_previous_text=True,
+        max_tokens_per_second=20.0,
+        max_decode_seconds=30.0,
+    ),
+}
 
 
 class STTConfig(BaseModel):
@@ -37,6 +139,57 @@ class STTConfig(BaseModel):
 
     language: STTLanguage = STTLanguage.JA
     model: str = "base"
+    # faster-whisperはCTranslate2で動作し、CPUでの文字起こしが速い（要オプション依存）
+    backend: STTBackend = STTBackend.WHISPER
+    # faster-whisper使用時の計算精度
+    compute_type: STTComputeType = STTComputeType.INT8
+    # whisper使用時にLinear層をint8へ動的量子化する（CPU向け、初回のみ変換）
+    quantize: bool = False
+    # フルデコードの前に無音・雑音のみの発話を安価に判定して除外する
+    silence_precheck: bool = True
+    # 使用するデコード設定の名前（profilesのキー）
+    profile: str = "balanced"
+    profiles: dict[str, DecodingProfile] = Field(
+        default_factory=lambda: dict(DEFAULT_DECODING_PROFILES)
+    )
+    # 発話中から逐次文字起こしを進め、発話終了後の待ち時間を短くする
+    streaming: bool = True
+
+    @field_validator("profiles", mode="before")
+    @classmethod
+    def _merge_default_profiles(cls, value: Any) -> Any:
+        """ユーザー定義のプロファイルを既定のプロファイルに追加する.
+
+        既定と同じ名前のプロファイルは、指定した項目だけを既定の値に上書きする。
+        """
+        if not isinstance(value, dict):
+            return value
+        merged: dict[str, Any] = dict(DEFAULT_DECODING_PROFILES)
+        for name, profile in value.items():
+            overrides = (
+                profile.model_dump(exclude_unset=True)
+                if isinstance(profile, DecodingProfile)
+                else profile
+            )
+            default = DEFAULT_DECODING_PROFILES.get(name)
+            if default is not None and isinstance(overrides, dict):
+                merged[name] = {**default.model_dump(), **overrides}
+            else:
+                merged[name] = profile
+        return merged
+
+    @model_validator(mode="after")
+    def _check_profile_exists(self) -> Self:
+        """選択したプロファイルが定義されていることを確認する."""
+        if self.profile not in self.profiles:
+            names = ", ".join(self.profiles)
+            raise ValueError(f"unknown profile {self.profile!r} (available: {names})")
+        return self
+
+    @property
+    def decoding(self) -> DecodingProfile:
+        """選択されているデコード設定."""
+        return self.profiles[self.profile]
 
 
 class TTSConfig(BaseModel):
@@ -47,6 +200,26 @@ class TTSConfig(BaseModel):
     enabled: bool = True
 
 
+class AudioConfig(BaseModel):
+    """音声入力設定."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    vad: VADType = VADType.ADAPTIVE
+    # 発話開始の直前から遡って録音に含める時間
+    pre_roll_ms: int = Field(default=300, ge=0)
+    # 発話終了と判定するまでの無音時間
+    silence_ms: int = Field(default=1000, gt=0)
+    # これより短い発話はノイズとして無視する
+    min_speech_ms: int = Field(default=200, ge=0)
+    # 1回の発話として保持する音声の上限（長い発話はこの長さの窓ごとに文字起こしし、1つにまとめる）
+    max_utterance_ms: int = Field(default=30000, gt=0)
+    # 応答中にユーザーが話し始めたら、生成と読み上げを中断する（min_speech_ms以上続いた場合）
+    barge_in: bool = False
+    # 割り込みと判定する音量（正規化RMS）。読み上げの回り込みを拾わないようVADより高くする
+    barge_in_threshold: float = Field(default=0.05, gt=0, le=1)
+
+
 class Config(BaseModel):
     """アプリケーション設定."""
 
@@ -55,3 +228,4 @@ class Config(BaseModel):
     llm: LLMConfig = LLMConfig()
     stt: STTConfig = STTConfig()
     tts: TTSConfig = TTSConfig()
+    audio: AudioConfig = AudioConfig()